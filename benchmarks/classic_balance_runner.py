@@ -0,0 +1,195 @@
+"""
+经典模式平衡性模拟：用多个进程并行运行大量带种子的无界面对局，统计分数、存活时间、结束原因和各种效果的触发次数，
+用于评估其他食物属性权重等规则调整的效果。
+
+每局由机器人控制：
+    greedy   走向最近的真食物，避开危险（与classic_headless.py相同）
+    scripted 保持方向直行，前方危险时随机换一个安全的方向
+
+种子按块分配给ProcessPoolExecutor的各个进程，每块完成后立即把结果逐行写入CSV文件并输出进度；
+输出文件以.npz结尾时，在全部完成后按列保存为NumPy数组。每局只由种子决定，结果与进程数无关。
+
+用法:
+    python benchmarks/classic_balance_runner.py --games 2000 --output results.csv
+    python benchmarks/classic_balance_runner.py --games 2000 --weights 0.02,0.16,0.16,0.16,0.16,0.34 --output bomb2.npz
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import numpy as np
+
+from classic_headless import DIRECTIONS, autopilot
+from game.modes.classic.classic_snake_game import OTHER_FOOD_PROPERTIES, ClassicSnakeGame
+from game.utils.food_table import BOMB
+from game.utils.occupancy_grid import EMPTY, FOOD, OTHER_FOOD
+
+CAUSES = ('edge', 'self', 'obstacle', 'bomb', 'timeout')
+EFFECTS = ('double_score', 'color_change', 'speed_up', 'speed_down', 'freeze')
+COLUMNS = (('seed', 'score', 'ticks', 'survival_time', 'max_length', 'cause', 'foods_eaten', 'other_foods_eaten')
+           + tuple(f'effect_{effect}' for effect in EFFECTS))
+
+
+def scripted(game, rng):
+    """保持方向直行，前方是边缘、蛇身、障碍物或炸弹时随机换一个安全的方向"""
+    def safe(direction):
+        pos = (game.snake[0][0] + direction[0], game.snake[0][1] + direction[1])
+        kind = game.grid.kind(pos)
+        if kind == OTHER_FOOD:
+            return game.fake_foods.properties[game.fake_foods.find(pos)] != BOMB
+        return kind in (EMPTY, FOOD)
+
+    if safe(game.direction):
+        return
+    candidates = [direction for direction in DIRECTIONS if safe(direction)]
+    if candidates:
+        game.direction = rng.choice(candidates)
+
+
+POLICIES = {'greedy': autopilot, 'scripted': scripted}
+
+
+def simulate_game(seed, policy, max_ticks, weights=None, tick_rate=60):
+    """用给定种子运行一局，返回一行结果"""
+    events = Counter()
+
+    def sink(event, data):
+        if event == 'effect':
+            events[f"effect_{data['effect']}"] += 1
+        else:
+            events[event] += 1
+
+    game = ClassicSnakeGame(headless=True, rng=random.Random(seed), event_sink=sink, tick_rate=tick_rate)
+    if weights is not None:
+        # 初始食物也按新的权重生成
+        game.other_food_weights = list(weights)
+        game.reset()
+    pilot = POLICIES[policy]
+    pilot_rng = random.Random(f'pilot-{seed}')
+    game.game_started = True
+    dt = game.tick_interval
+    ticks = 0
+    while not game.game_over and ticks < max_ticks:
+        pilot(game, pilot_rng)
+        game.step(dt)
+        ticks += 1
+
+    row = {
+        'seed': seed,
+        'score': game.score,
+        'ticks': ticks,
+        'survival_time': game.sim_time,
+        'max_length': game.current_game_max_length,
+        'cause': game.game_over_cause or 'timeout',
+        'foods_eaten': events['food_eaten'],
+        'other_foods_eaten': events['other_food_eaten'],
+    }
+    for effect in EFFECTS:
+        row[f'effect_{effect}'] = events[f'effect_{effect}']
+    return row
+
+
+def simulate_chunk(seeds, policy, max_ticks, weights, tick_rate):
+    return [simulate_game(seed, policy, max_ticks, weights, tick_rate) for seed in seeds]
+
+
+def save_npz(path, rows):
+    columns = {}
+    for column in COLUMNS:
+        values = [row[column] for row in rows]
+        if column == 'cause':
+            columns[column] = np.array(values, dtype='U8')
+        elif column == 'survival_time':
+            columns[column] = np.array(values, dtype=np.float64)
+        elif column == 'score':
+            # 分数翻倍可能超出int64
+            columns[column] = np.array(values, dtype=np.float64 if max(values, default=0) >= 2 ** 63 else np.int64)
+        else:
+            columns[column] = np.array(values, dtype=np.int64)
+    np.savez(path, **columns)
+
+
+def summarize(rows, elapsed):
+    scores = np.array([float(row['score']) for row in rows])
+    survival = np.array([row['survival_time'] for row in rows])
+    causes = Counter(row['cause'] for row in rows)
+    ticks = sum(row['ticks'] for row in rows)
+    print(f"完成 {len(rows)} 局，耗时 {elapsed:.1f} 秒（{len(rows) / elapsed:.1f} 局/秒，{ticks / elapsed:,.0f} 步/秒）")
+    print(f"分数: 中位数 {np.median(scores):.0f}，平均 {scores.mean():.1f}，p90 {np.percentile(scores, 90):.0f}")
+    print(f"存活时间: 中位数 {np.median(survival):.1f} 秒，平均 {survival.mean():.1f} 秒")
+    print("结束原因: " + ", ".join(f"{cause} {causes[cause] / len(rows):.1%}" for cause in CAUSES if causes[cause]))
+    eaten = sum(row['other_foods_eaten'] for row in rows)
+    print(f"每局平均吃到真食物 {np.mean([row['foods_eaten'] for row in rows]):.1f} 个，其他食物 {eaten / len(rows):.1f} 个")
+    print("每局平均效果次数: " + ", ".join(
+        f"{effect} {np.mean([row[f'effect_{effect}'] for row in rows]):.2f}" for effect in EFFECTS))
+
+
+def parse_weights(value):
+    if value is None:
+        return None
+    weights = [float(weight) for weight in value.split(',')]
+    if len(weights) != len(OTHER_FOOD_PROPERTIES):
+        raise argparse.ArgumentTypeError(f"需要{len(OTHER_FOOD_PROPERTIES)}个权重，顺序为: {','.join(OTHER_FOOD_PROPERTIES)}")
+    return weights
+
+
+def main():
+    parser = argparse.ArgumentParser(description="经典模式多进程平衡性模拟")
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0, help="第一局的种子，之后每局加1")
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='greedy')
+    parser.add_argument('--max-ticks', type=int, default=60 * 60 * 10, help="每局最多的逻辑步数，超过后记为timeout")
+    parser.add_argument('--tick-rate', type=int, default=60)
+    parser.add_argument('--weights', type=parse_weights,
+                        help=f"其他食物属性的权重，顺序为 {','.join(OTHER_FOOD_PROPERTIES)}")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--chunk-size', type=int, default=16)
+    parser.add_argument('--output', default='classic_balance.csv', help="结果文件，.csv逐块写入，.npz在结束时写入")
+    args = parser.parse_args()
+
+    seeds = list(range(args.seed, args.seed + args.games))
+    chunks = [seeds[i:i + args.chunk_size] for i in range(0, len(seeds), args.chunk_size)]
+    write_csv = not args.output.endswith('.npz')
+    rows = []
+    start = last_report = time.perf_counter()
+
+    with open(args.output if write_csv else os.devnull, 'w', newline='') as output, \
+            ProcessPoolExecutor(max_workers=args.workers) as executor:
+        writer = csv.DictWriter(output, fieldnames=COLUMNS)
+        writer.writeheader()
+        futures = [
+            executor.submit(simulate_chunk, chunk, args.policy, args.max_ticks, args.weights, args.tick_rate)
+            for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            chunk_rows = future.result()
+            rows.extend(chunk_rows)
+            writer.writerows(chunk_rows)
+            output.flush()
+            now = time.perf_counter()
+            if now - last_report >= 2.0 or len(rows) == len(seeds):
+                rate = len(rows) / (now - start)
+                remaining = (len(seeds) - len(rows)) / rate if rate else 0.0
+                print(f"进度: {len(rows)}/{len(seeds)} 局，{rate:.1f} 局/秒，预计剩余 {remaining:.0f} 秒", flush=True)
+                last_report = now
+
+    elapsed = time.perf_counter() - start
+    rows.sort(key=lambda row: row['seed'])
+    if not write_csv:
+        save_npz(args.output, rows)
+    print(f"结果已保存到 {args.output}")
+    summarize(rows, elapsed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+批量引擎一致性检查：同样的种子下，ClassicBatchEngine的每个棋盘与单独运行的ClassicSnakeGame逐步比较，
+蛇身、占用网格（包括空闲列表）、食物表、分数、效果时间、计时器和游戏结束原因都必须完全相同。
+检查通过后再比较两者每秒推进的棋盘步数。
+
+用法:
+    python benchmarks/classic_batch_conformance.py --boards 32 --ticks 20000 --seed 0
+    python benchmarks/classic_batch_conformance.py --benchmark-boards 1024
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import numpy as np
+
+from classic_headless import autopilot
+from game.modes.classic.classic_batch_engine import EFFECT_COLUMNS, ClassicBatchEngine
+from game.modes.classic.classic_snake_game import ClassicSnakeGame
+from game.utils.occupancy_grid import OBSTACLE, SNAKE
+
+
+def compare(game, engine, board):
+    """返回第board个棋盘与game不一致的字段名列表"""
+    mismatches = []
+    if list(game.snake) != engine.snake(board):
+        mismatches.append('snake')
+    if not np.array_equal(game.grid.cells, engine.grid.cells[board]):
+        mismatches.append('grid')
+    free_count = game.grid.free_count
+    if free_count != engine.grid.free_counts[board] or \
+            not np.array_equal(game.grid._free[:free_count], engine.grid._free[board, :free_count]):
+        mismatches.append('free_list')
+    for name, table, tables in (('foods', game.foods, engine.foods), ('fake_foods', game.fake_foods, engine.fake_foods)):
+        count = len(table)
+        if count != tables.counts[board]:
+            mismatches.append(name)
+            continue
+        for column in ('positions', 'colors', 'double_score', 'ages', 'properties'):
+            if not np.array_equal(getattr(table, column)[:count], getattr(tables, column)[board, :count]):
+                mismatches.append(f'{name}.{column}')
+    if game.score != engine.scores[board]:
+        mismatches.append('score')
+    if game.game_over_cause != engine.cause(board):
+        mismatches.append('game_over_cause')
+    if game.current_game_max_length != engine.max_lengths[board]:
+        mismatches.append('max_length')
+    for effect, column in EFFECT_COLUMNS.items():
+        if game.effects[effect] != engine.effects[board, column]:
+            mismatches.append(f'effects.{effect}')
+    for name, value in (('move_timer', engine.move_timers[board]),
+                        ('food_refresh_timer', engine.food_refresh_timers[board]),
+                        ('sim_time', engine.sim_times[board])):
+        if getattr(game, name) != value:
+            mismatches.append(name)
+    return mismatches
+
+
+def check(boards, ticks, seed):
+    games = [ClassicSnakeGame(headless=True, rng=random.Random(seed + board)) for board in range(boards)]
+    engine = ClassicBatchEngine(boards, seed=seed)
+    pilot = random.Random(seed - 1)
+    for game in games:
+        game.game_started = True
+
+    for board, game in enumerate(games):
+        mismatches = compare(game, engine, board)
+        if mismatches:
+            print(f"初始状态不一致: 棋盘 {board}: {', '.join(mismatches)}")
+            return False
+
+    for tick in range(1, ticks + 1):
+        for board, game in enumerate(games):
+            if not game.game_over:
+                autopilot(game, pilot)
+                engine.directions[board] = game.direction
+            game.step(engine.tick_interval)
+        engine.step()
+        for board, game in enumerate(games):
+            mismatches = compare(game, engine, board)
+            if mismatches:
+                print(f"第 {tick} 步不一致: 棋盘 {board}: {', '.join(mismatches)}")
+                return False
+        if all(game.game_over for game in games):
+            break
+
+    causes = [game.game_over_cause for game in games]
+    print(f"一致: {boards} 个棋盘 × {tick} 步，结束 {sum(cause is not None for cause in causes)} 局")
+    return True
+
+
+def safe_directions(engine, rng):
+    """为每个棋盘随机选择一个下一步不会撞到边缘、蛇身或障碍物的方向，对所有棋盘一次性计算"""
+    count = engine.count
+    directions = np.array([(1, 0), (-1, 0), (0, 1), (0, -1)])
+    heads = engine.bodies[np.arange(count), engine.head_slots]
+    # 每个棋盘随机排列四个方向，保持原方向的优先级最高，避免频繁转弯
+    order = np.argsort(rng.random((count, 4)), axis=1)
+    candidates = np.concatenate((engine.directions[:, None], directions[order]), axis=1)
+    targets = heads[:, None] + candidates
+    xs, ys = targets[..., 0], targets[..., 1]
+    inside = (xs >= 0) & (xs < engine.grid_width) & (ys >= 0) & (ys < engine.grid_height)
+    boards = np.broadcast_to(np.arange(count)[:, None], xs.shape)
+    kinds = np.full(xs.shape, SNAKE)
+    kinds[inside] = engine.grid.cells[boards[inside], ys[inside], xs[inside]]
+    safe = (kinds != SNAKE) & (kinds != OBSTACLE)
+    choice = np.where(safe.any(axis=1), safe.argmax(axis=1), 0)
+    return candidates[np.arange(count), choice]
+
+
+def benchmark(boards, ticks, seed):
+    """批量引擎与逐个推进ClassicSnakeGame的速度比较，方向由向量化的避障策略选择，结束后立即重新开始"""
+    rng = np.random.default_rng(seed)
+    engine = ClassicBatchEngine(boards, seed=seed, auto_reset=True)
+    history = []
+    start = time.perf_counter()
+    for _ in range(ticks):
+        engine.directions[:] = safe_directions(engine, rng)
+        history.append(engine.directions.tolist())
+        engine.step()
+    batch_rate = boards * ticks / (time.perf_counter() - start)
+
+    # ClassicSnakeGame按批量引擎记录下来的方向运行同样的步数
+    games = [ClassicSnakeGame(headless=True, rng=random.Random(seed + board)) for board in range(boards)]
+    completed = 0
+    start = time.perf_counter()
+    for directions in history:
+        for game, direction in zip(games, directions):
+            if game.game_over:
+                game.reset()
+                completed += 1
+            game.game_started = True
+            game.direction = tuple(direction)
+            game.step(game.tick_interval)
+    scalar_rate = boards * ticks / (time.perf_counter() - start)
+    completed += sum(game.game_over for game in games)
+
+    print(f"{boards} 个棋盘 × {ticks} 步: 批量引擎 {batch_rate:,.0f} 棋盘步/秒，"
+          f"ClassicSnakeGame {scalar_rate:,.0f} 棋盘步/秒（{batch_rate / scalar_rate:.1f} 倍），"
+          f"完成 {len(engine.completed)}/{completed} 局")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="批量引擎与ClassicSnakeGame的一致性检查")
+    parser.add_argument('--boards', type=int, default=32)
+    parser.add_argument('--ticks', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--benchmark-boards', type=int, default=1024)
+    parser.add_argument('--benchmark-ticks', type=int, default=600)
+    args = parser.parse_args()
+    if not check(args.boards, args.ticks, args.seed):
+        sys.exit(1)
+    benchmark(args.benchmark_boards, args.benchmark_ticks, args.seed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+经典模式无界面模拟：不打开窗口、不加载字体和音效，按固定步长尽可能快地运行游戏规则，
+用于长时间检验规则和统计每秒逻辑步数。
+
+每局由一个简单的自动驾驶控制蛇：优先走向最近的真食物，避开边缘、蛇身、障碍物和炸弹。
+一局结束后自动开始下一局，最后输出逻辑步数/秒、各结束原因的次数和分数统计。
+
+用法:
+    python benchmarks/classic_headless.py --ticks 200000 --seed 1
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# 使用SDL的dummy驱动，不需要显示器和声卡
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import numpy as np
+
+from game.modes.classic.classic_snake_game import ClassicSnakeGame
+from game.utils.food_table import BOMB
+from game.utils.occupancy_grid import EMPTY, FOOD, OTHER_FOOD
+
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def autopilot(game, rng):
+    """为下一次移动选择方向：在安全的方向中选离最近的真食物最近的一个，没有安全方向时保持不变"""
+    hx, hy = game.snake[0]
+    target = None
+    count = len(game.foods)
+    if count:
+        positions = game.foods.positions[:count]
+        distances = np.abs(positions[:, 0] - hx) + np.abs(positions[:, 1] - hy)
+        target = positions[int(np.argmin(distances))]
+
+    best, best_distance = None, None
+    candidates = list(DIRECTIONS)
+    rng.shuffle(candidates)
+    for dx, dy in candidates:
+        pos = (hx + dx, hy + dy)
+        kind = game.grid.kind(pos)
+        if kind not in (EMPTY, FOOD, OTHER_FOOD):
+            continue
+        if kind == OTHER_FOOD and game.fake_foods.properties[game.fake_foods.find(pos)] == BOMB:
+            continue
+        distance = 0 if target is None else abs(pos[0] - target[0]) + abs(pos[1] - target[1])
+        if best is None or distance < best_distance:
+            best, best_distance = (dx, dy), distance
+    if best is not None:
+        game.direction = best
+
+
+def run(ticks, seed, tick_rate, width, height):
+    rng = random.Random(seed)
+    events = Counter()
+    game = ClassicSnakeGame(width=width, height=height, tick_rate=tick_rate, headless=True, rng=rng,
+                            event_sink=lambda event, data: events.update((event,)))
+    pilot_rng = random.Random(seed + 1)
+    causes = Counter()
+    scores, lengths = [], []
+
+    game.game_started = True
+    dt = game.tick_interval
+    start = time.perf_counter()
+    for _ in range(ticks):
+        if game.game_over:
+            causes[game.game_over_cause] += 1
+            scores.append(game.score)
+            lengths.append(game.current_game_max_length)
+            game.reset()
+            game.game_started = True
+        autopilot(game, pilot_rng)
+        game.step(dt)
+    elapsed = time.perf_counter() - start
+
+    print(f"逻辑步数: {ticks}（模拟 {ticks * dt:.0f} 秒，{tick_rate} 步/秒）")
+    print(f"耗时: {elapsed:.2f} 秒，{ticks / elapsed:,.0f} 步/秒，相当于 {ticks * dt / elapsed:,.0f} 倍速")
+    print(f"完成局数: {len(scores)}")
+    for cause, count in causes.most_common():
+        print(f"  {cause}: {count}")
+    if scores:
+        print(f"分数: 平均 {np.mean(scores):.1f}，最高 {max(scores)}；最长长度: 平均 {np.mean(lengths):.1f}，最高 {max(lengths)}")
+    print("事件: " + ", ".join(f"{event}={count}" for event, count in sorted(events.items())))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="经典模式无界面模拟")
+    parser.add_argument('--ticks', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--tick-rate', type=int, default=60)
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    args = parser.parse_args()
+    run(args.ticks, args.seed, args.tick_rate, args.width, args.height)
+
+
+if __name__ == '__main__':
+    main()
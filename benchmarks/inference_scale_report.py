@@ -0,0 +1,134 @@
+"""
+推理分辨率报告：在录制的视频上比较不同推理分辨率下的食指指尖误差和推理耗时。
+
+以原始分辨率的检测结果为参照，对每个推理分辨率统计：
+    - 推理耗时 p50/p90（毫秒）
+    - 指尖位置误差的平均值/p90（原图像素）
+    - 召回率：参照帧检测到手时，该分辨率也检测到手的比例
+
+用法:
+    python benchmarks/inference_scale_report.py clip1.mp4 [clip2.mp4 ...] [--scales full,640x360,320x180]
+    python benchmarks/inference_scale_report.py --record clip.mp4 --seconds 10   # 先用摄像头录制一段视频
+
+--detector可选cvzone（默认，与游戏相同的HandDetector）或simple（肤色检测的SimpleHandDetector）。
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import cv2
+import numpy as np
+
+from game.core.hand_detection import ScaledHandDetector, detect_index_fingertip, parse_inference_size
+
+
+def create_detector(kind):
+    if kind == 'cvzone':
+        from cvzone.HandTrackingModule import HandDetector
+        return HandDetector(detectionCon=0.1, maxHands=1)
+    from game.core.game_controller import SimpleHandDetector
+    return SimpleHandDetector(detectionCon=0.1, maxHands=1)
+
+
+def record(path, seconds, camera=0):
+    """从摄像头录制一段镜像后的视频，和游戏中检测使用的画面一致"""
+    capture = cv2.VideoCapture(camera)
+    capture.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+    capture.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+    success, frame = capture.read()
+    if not success:
+        print("摄像头没有画面，无法录制")
+        return
+    height, width = frame.shape[:2]
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'), 30, (width, height))
+    frames = 0
+    deadline = time.perf_counter() + seconds
+    while success and time.perf_counter() < deadline:
+        writer.write(cv2.flip(frame, 1))
+        frames += 1
+        success, frame = capture.read()
+    writer.release()
+    capture.release()
+    print(f"已录制 {frames} 帧到 {path} ({width}x{height})")
+
+
+def read_clip(path, max_frames):
+    capture = cv2.VideoCapture(path)
+    frames = []
+    while len(frames) < max_frames:
+        success, frame = capture.read()
+        if not success:
+            break
+        frames.append(frame)
+    capture.release()
+    return frames
+
+
+def detect_all(detector, frames):
+    """返回每帧的指尖位置（未检测到为None）和推理耗时（毫秒）"""
+    positions, latencies = [], []
+    for frame in frames:
+        start = time.perf_counter()
+        positions.append(detect_index_fingertip(detector, frame))
+        latencies.append((time.perf_counter() - start) * 1000)
+    return positions, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="推理分辨率的准确度/耗时报告")
+    parser.add_argument('clips', nargs='*', help="录制的视频文件")
+    parser.add_argument('--scales', default='full,960x540,640x360,480x270,320x180')
+    parser.add_argument('--detector', choices=('cvzone', 'simple'), default='cvzone')
+    parser.add_argument('--max-frames', type=int, default=600)
+    parser.add_argument('--record', help="录制视频到该路径后退出")
+    parser.add_argument('--seconds', type=float, default=10.0)
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record, args.seconds)
+        return
+    if not args.clips:
+        parser.error("需要至少一个视频文件，或使用--record录制")
+
+    frames = []
+    for clip in args.clips:
+        clip_frames = read_clip(clip, args.max_frames)
+        print(f"{clip}: {len(clip_frames)} 帧")
+        frames.extend(clip_frames)
+    if not frames:
+        print("没有可用的帧")
+        return
+
+    # 每个分辨率使用新的检测器实例，避免跟踪状态互相影响
+    reference, reference_latencies = detect_all(create_detector(args.detector), frames)
+    reference_hits = sum(position is not None for position in reference)
+    print(f"参照（原始分辨率 {frames[0].shape[1]}x{frames[0].shape[0]}）检测到手: {reference_hits}/{len(frames)} 帧")
+    print(f"{'分辨率':>10} {'耗时p50':>9} {'耗时p90':>9} {'误差均值':>9} {'误差p90':>9} {'召回率':>8}")
+
+    for scale in args.scales.split(','):
+        inference_size = parse_inference_size(scale)
+        if inference_size is None:
+            positions, latencies = reference, reference_latencies
+        else:
+            detector = ScaledHandDetector(create_detector(args.detector), inference_size)
+            positions, latencies = detect_all(detector, frames)
+
+        errors = [
+            np.hypot(position[0] - expected[0], position[1] - expected[1])
+            for position, expected in zip(positions, reference)
+            if position is not None and expected is not None
+        ]
+        p50, p90 = np.percentile(latencies, [50, 90])
+        if errors:
+            error_text = f"{np.mean(errors):9.1f} {np.percentile(errors, 90):9.1f}"
+        else:
+            error_text = f"{'-':>9} {'-':>9}"
+        recall = len(errors) / reference_hits if reference_hits else 0.0
+        print(f"{scale:>10} {p50:9.2f} {p90:9.2f} {error_text} {recall:8.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+帧显示性能测试：对比旧的 cvtColor + transpose + make_surface 路径和 FramePresenter 的耗时。
+
+用法:
+    python benchmarks/present_benchmark.py [--width 1920] [--height 1080] [--frames 300]
+
+没有显示器时可设置 SDL_VIDEODRIVER=dummy 运行。
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import cv2
+import numpy as np
+import pygame
+
+from game.core.frame_presenter import FramePresenter
+
+
+def legacy_present(screen, img):
+    """优化前GameController.draw_opencv_image的做法"""
+    img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    surface = pygame.surfarray.make_surface(np.transpose(img_rgb, (1, 0, 2)))
+    screen.blit(surface, (0, 0))
+
+
+def run(present, screen, frames, reuse_buffer):
+    """返回每帧平均耗时(毫秒)"""
+    height, width = screen.get_height(), screen.get_width()
+    rng = np.random.default_rng(0)
+    sources = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(4)]
+    frame = np.empty_like(sources[0])
+
+    # 预热
+    for i in range(10):
+        present(screen, sources[i % len(sources)])
+
+    start = time.perf_counter()
+    for i in range(frames):
+        if reuse_buffer:
+            # 模拟复用帧缓冲：每帧把新内容写入同一块内存
+            np.copyto(frame, sources[i % len(sources)])
+            present(screen, frame)
+        else:
+            present(screen, sources[i % len(sources)].copy())
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="帧显示性能测试")
+    parser.add_argument('--width', type=int, default=1920)
+    parser.add_argument('--height', type=int, default=1080)
+    parser.add_argument('--frames', type=int, default=300)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((args.width, args.height))
+    presenter = FramePresenter()
+
+    def new_present(target, img):
+        presenter.present(target, img)
+
+    # 两种写法都包含生成/拷贝帧的开销，单独测一次作为基准
+    baseline = run(lambda target, img: None, screen, args.frames, reuse_buffer=False)
+    baseline_reuse = run(lambda target, img: None, screen, args.frames, reuse_buffer=True)
+
+    print(f"分辨率: {args.width}x{args.height}, 帧数: {args.frames}")
+    for label, reuse in (("每帧新数组", False), ("复用帧缓冲", True)):
+        base = baseline_reuse if reuse else baseline
+        legacy = run(legacy_present, screen, args.frames, reuse) - base
+        allocations = presenter.surface_allocations
+        optimized = run(new_present, screen, args.frames, reuse) - base
+        allocations = presenter.surface_allocations - allocations
+        print(f"[{label}] 优化前: {legacy:.2f} ms/帧, 优化后: {optimized:.2f} ms/帧, "
+              f"加速 {legacy / max(optimized, 1e-6):.1f}x, 新建Surface {allocations} 次")
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+import threading
+import time
+
+import cv2
+
+
+class ThreadedCapture:
+    """
+    后台线程读取摄像头的cv2.VideoCapture封装。
+    读取线程把帧写入一个小的环形缓冲区，游戏循环调用read()时直接拿到最新的一帧，不会被摄像头阻塞。
+    接口与cv2.VideoCapture保持一致（isOpened/read/get/set/release），可以直接替换。
+    """
+
+    def __init__(self, source=0, width=None, height=None, buffer_size=3):
+        # 至少3个槽位：一个正在写入、一个是最新帧、一个可能正被调用方使用
+        self.buffer_size = max(3, buffer_size)
+        self._capture = cv2.VideoCapture(source)
+        if self._capture.isOpened():
+            if width is not None:
+                self._capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            if height is not None:
+                self._capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+
+        self._slots = [None] * self.buffer_size
+        self._timestamps = [0.0] * self.buffer_size
+        self._latest_index = -1
+        # 零拷贝读取方（游戏循环）正在使用的槽位和它读到的最后一帧序号；
+        # 只保护一个零拷贝读取方，其他读取方需要用copy=True
+        self._reader_index = -1
+        self._latest_seq = -1
+        self._last_read_seq = -1
+        self._lock = threading.Lock()
+        self._device_lock = threading.Lock()
+        self._frame_ready = threading.Condition(self._lock)
+
+        # 统计信息
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.read_errors = 0
+        self.camera_fps = 0.0
+        self._fps_window_start = time.perf_counter()
+        self._fps_window_frames = 0
+
+        self._running = False
+        self._thread = None
+        if self._capture.isOpened():
+            self._running = True
+            self._thread = threading.Thread(target=self._reader_loop, name="ThreadedCapture", daemon=True)
+            self._thread.start()
+
+    def _next_write_index(self):
+        """选择一个既不是最新帧、也不是调用方正在使用的槽位"""
+        for offset in range(1, self.buffer_size + 1):
+            index = (self._latest_index + offset) % self.buffer_size
+            if index != self._latest_index and index != self._reader_index:
+                return index
+        return 0
+
+    def _reader_loop(self):
+        while self._running:
+            with self._lock:
+                index = self._next_write_index()
+            with self._device_lock:
+                if not self._running:
+                    break
+                success, frame = self._capture.read(self._slots[index])
+            timestamp = time.perf_counter()
+
+            if not success or frame is None:
+                self.read_errors += 1
+                time.sleep(0.01)
+                continue
+
+            with self._lock:
+                self._slots[index] = frame
+                self._timestamps[index] = timestamp
+                # 上一帧还没被零拷贝读取方读取就被新帧覆盖，记为丢帧
+                if self._latest_seq > self._last_read_seq:
+                    self.frames_dropped += 1
+                self._latest_index = index
+                self._latest_seq += 1
+                self.frames_captured += 1
+                self._frame_ready.notify_all()
+
+            self._fps_window_frames += 1
+            elapsed = timestamp - self._fps_window_start
+            if elapsed >= 1.0:
+                self.camera_fps = self._fps_window_frames / elapsed
+                self._fps_window_start = timestamp
+                self._fps_window_frames = 0
+
+    def isOpened(self):
+        return self._capture.isOpened()
+
+    def read_latest(self, copy=False, newer_than=None, timeout=None):
+        """
+        获取最新的一帧，返回(success, frame, timestamp, seq)。
+        返回的帧在下一次读取前有效；需要长期保存或有多个读取方时传copy=True。
+        不拷贝的读取只能有一个读取方（游戏循环），丢帧统计也只按它计算，copy=True的读取不影响丢帧统计。
+        传入newer_than时，如果还没有序号大于newer_than的帧则等待，最多等待timeout秒。
+        """
+        with self._lock:
+            if newer_than is not None:
+                self._frame_ready.wait_for(lambda: self._latest_seq > newer_than or not self._running, timeout)
+            if self._latest_index < 0:
+                return False, None, None, -1
+            index = self._latest_index
+            frame = self._slots[index]
+            if copy:
+                frame = frame.copy()
+            else:
+                self._reader_index = index
+                self._last_read_seq = self._latest_seq
+            return True, frame, self._timestamps[index], self._latest_seq
+
+    def read(self):
+        """与cv2.VideoCapture.read相同的返回值，但不阻塞，直接返回最新的一帧"""
+        success, frame, _, _ = self.read_latest()
+        return success, frame
+
+    def get(self, prop_id):
+        with self._device_lock:
+            return self._capture.get(prop_id)
+
+    def set(self, prop_id, value):
+        with self._device_lock:
+            return self._capture.set(prop_id, value)
+
+    def stats(self):
+        """返回采集统计"""
+        return {
+            'frames_captured': self.frames_captured,
+            'frames_dropped': self.frames_dropped,
+            'read_errors': self.read_errors,
+            'camera_fps': self.camera_fps,
+            'latest_seq': self._latest_seq,
+        }
+
+    def release(self):
+        """停止读取线程并释放摄像头"""
+        self._running = False
+        with self._lock:
+            self._frame_ready.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        with self._device_lock:
+            self._capture.release()
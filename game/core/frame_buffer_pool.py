@@ -0,0 +1,62 @@
+import numpy as np
+
+
+class FrameBufferPool:
+    """
+    屏幕尺寸的OpenCV帧缓冲池。
+    每个名字对应一块预先分配的缓冲区，各个界面每帧取回同一块内存，用fill/copyto原地清空或填充，
+    稳定运行时不再分配新的大数组；屏幕尺寸变化时重新分配。
+    """
+
+    def __init__(self, width, height, channels=3):
+        self.width = width
+        self.height = height
+        self.channels = channels
+        self._buffers = {}
+
+        # 统计信息
+        self.allocations = 0
+        self.acquisitions = 0
+
+    def resize(self, width, height):
+        """屏幕尺寸变化时释放所有缓冲区，下次取用时按新尺寸分配"""
+        if (width, height) != (self.width, self.height):
+            self.width = width
+            self.height = height
+            self._buffers.clear()
+
+    def acquire(self, name='frame', fill=None, shape=None):
+        """
+        取回名为name的缓冲区，默认是屏幕尺寸(高, 宽, 通道)，也可以用shape指定其他形状。
+        fill不为None时先原地填充（数值或BGR元组，新分配的缓冲区同样填充），否则保留上一帧的内容，由调用方整体覆盖。
+        """
+        if shape is None:
+            shape = (self.height, self.width, self.channels)
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.zeros(shape, dtype=np.uint8)
+            self._buffers[name] = buffer
+            self.allocations += 1
+        if fill is not None:
+            buffer[...] = fill
+        self.acquisitions += 1
+        return buffer
+
+    def acquire_copy(self, source, name='frame'):
+        """取回缓冲区并把source的内容拷贝进去，source的形状需要与缓冲区一致"""
+        buffer = self.acquire(name, shape=source.shape)
+        np.copyto(buffer, source)
+        return buffer
+
+    def clear(self):
+        """释放所有缓冲区"""
+        self._buffers.clear()
+
+    def stats(self):
+        """返回缓冲池统计"""
+        return {
+            'buffers': len(self._buffers),
+            'bytes': sum(buffer.nbytes for buffer in self._buffers.values()),
+            'allocations': self.allocations,
+            'acquisitions': self.acquisitions,
+        }
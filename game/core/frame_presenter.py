@@ -0,0 +1,77 @@
+import cv2
+import numpy as np
+import pygame
+
+
+class FramePresenter:
+    """
+    把OpenCV的BGR帧显示到pygame屏幕上。
+    用pygame.image.frombuffer直接以BGR格式包装帧内存，不做颜色转换和转置，
+    对同一块帧缓冲复用同一个Surface，稳定帧不再分配新的Surface。
+    """
+
+    def __init__(self, max_cached_surfaces=4):
+        self.max_cached_surfaces = max_cached_surfaces
+        # 键为(内存地址, 形状, 通道格式)，值为(帧数组, Surface)；保留帧数组的引用保证内存地址不会被复用
+        self._surfaces = {}
+        self.surface_allocations = 0
+        self.frombuffer_supported = True
+
+    def _get_surface(self, img, pixel_format):
+        key = (img.__array_interface__['data'][0], img.shape, pixel_format)
+        cached = self._surfaces.get(key)
+        if cached is not None and cached[0] is img:
+            return cached[1]
+
+        surface = pygame.image.frombuffer(img, (img.shape[1], img.shape[0]), pixel_format)
+        self.surface_allocations += 1
+        if len(self._surfaces) >= self.max_cached_surfaces:
+            self._surfaces.pop(next(iter(self._surfaces)))
+        self._surfaces[key] = (img, surface)
+        return surface
+
+    def present(self, screen, img, position=(0, 0)):
+        """将OpenCV图像绘制到screen上"""
+        # 确保图像数据类型正确
+        if img.dtype != np.uint8:
+            img = img.astype(np.uint8)
+
+        if len(img.shape) == 3:
+            if img.shape[2] == 3:
+                pixel_format = 'BGR'
+            elif img.shape[2] == 4:
+                pixel_format = 'BGRA'
+            else:
+                return
+        elif len(img.shape) == 2:
+            # 灰度图转换为BGR
+            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+            pixel_format = 'BGR'
+        else:
+            return  # 不支持的图像维度
+
+        if self.frombuffer_supported:
+            # frombuffer要求内存连续，裁剪或翻转得到的视图需要先拷贝一次
+            if not img.flags['C_CONTIGUOUS']:
+                img = np.ascontiguousarray(img)
+            try:
+                surface = self._get_surface(img, pixel_format)
+            except ValueError as e:
+                # 旧版本pygame不支持BGR格式，退回到转换颜色的方式
+                print(f"frombuffer不支持{pixel_format}格式，使用颜色转换显示: {e}")
+                self.frombuffer_supported = False
+            else:
+                screen.blit(surface, position)
+                return
+
+        if pixel_format == 'BGR':
+            img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+            surface = pygame.image.frombuffer(img_rgb, (img.shape[1], img.shape[0]), 'RGB')
+        else:
+            img_rgba = cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
+            surface = pygame.image.frombuffer(img_rgba, (img.shape[1], img.shape[0]), 'RGBA')
+        screen.blit(surface, position)
+
+    def clear(self):
+        """释放缓存的Surface"""
+        self._surfaces.clear()
@@ -11,6 +11,7 @@ import numpy as np
 import pygame
 import pygame_gui
 import math
+import time
 from pygame_gui.elements import UIButton
 
 print(f"Python版本: {sys.version}")
@@ -27,7 +28,10 @@ class SimpleHandDetector:
         self.hand_history = []
         self.max_history = 5  # 保存最近5帧的手部位置
         
-    def findHands(self, img, draw=True, flipType=False):
+    # 支持在裁剪区域上检测：origin为裁剪区域在原图中的位置，历史记录统一保存原图坐标
+    accepts_roi_origin = True
+
+    def findHands(self, img, draw=True, flipType=False, origin=(0, 0)):
         """检测手部，返回手部位置列表，模拟cvzone.HandDetector的接口"""
         try:
 
@@ -206,7 +210,7 @@ class SimpleHandDetector:
                         hands.append(hand_info)
                         
 
-                        self.hand_history.append((x, y, w, h))
+                        self.hand_history.append((x + origin[0], y + origin[1], w, h))
 
                         if len(self.hand_history) > self.max_history:
                             self.hand_history.pop(0)
@@ -224,8 +228,8 @@ class SimpleHandDetector:
 
                     recent_hands = self.hand_history[-3:]
 
-                    avg_x = int(sum(h[0] for h in recent_hands) / len(recent_hands))
-                    avg_y = int(sum(h[1] for h in recent_hands) / len(recent_hands))
+                    avg_x = int(sum(h[0] for h in recent_hands) / len(recent_hands)) - origin[0]
+                    avg_y = int(sum(h[1] for h in recent_hands) / len(recent_hands)) - origin[1]
                     avg_w = int(sum(h[2] for h in recent_hands) / len(recent_hands))
                     avg_h = int(sum(h[3] for h in recent_hands) / len(recent_hands))
                     
@@ -273,6 +277,13 @@ from game.utils.game_data import load_game_data, save_game_data
 from game.utils.chinese_text import put_chinese_text, put_rainbow_text
 from game.utils.improved_chinese_text import put_chinese_text_pil, put_rainbow_text_pil, put_chinese_text_with_background
 from game.utils.language_manager import get_translation
+from game.utils.asset_manager import asset_manager
+from game.utils.glyph_atlas import PygameGlyphAtlas
+from game.core.frame_presenter import FramePresenter
+from game.core.frame_buffer_pool import FrameBufferPool
+from game.core.camera_capture import ThreadedCapture
+from game.core.hand_detection import map_to_screen
+from game.core.process_hand_detection import create_hand_detection_worker
 
 
 try:
@@ -285,7 +296,7 @@ except ImportError as e:
     print("使用SimpleHandDetector作为备用，优化对半只手的检测")
 
 class GameController:
-    def __init__(self):
+    def __init__(self, detection_mode=None, inference_size=None, max_detection_age=0.5):
         pygame.init()
         
         # 初始化音频系统
@@ -320,6 +331,10 @@ class GameController:
             (self.screen_width, self.screen_height), 
             pygame.FULLSCREEN | pygame.NOFRAME
         )
+        # 帧显示器：直接以BGR格式包装OpenCV帧，复用Surface
+        self.frame_presenter = FramePresenter()
+        # 屏幕尺寸的帧缓冲池：各界面每帧复用同一块内存，不再每帧分配新数组
+        self.frame_pool = FrameBufferPool(self.screen_width, self.screen_height)
         # 使用翻译设置窗口标题
         pygame.display.set_caption(get_translation('menu_title'))
         self.clock = pygame.time.Clock()
@@ -339,6 +354,9 @@ class GameController:
                 self.font_large, self.font_small = pygame.font.Font(None, 80), pygame.font.Font(None, 40)
         else:
             self.font_large, self.font_small = pygame.font.Font(None, 80), pygame.font.Font(None, 40)
+        # 菜单文字使用字符图集绘制，避免每帧重新渲染字符串
+        self.text_large = PygameGlyphAtlas(self.font_large)
+        self.text_small = PygameGlyphAtlas(self.font_small)
         
 
         theme_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'themes', 'button_theme.json')
@@ -373,6 +391,13 @@ class GameController:
 
         self.hand_tracking_enabled = False
         self.hand_detector = None
+        self.hand_detection_worker = None
+        # 手部检测运行方式：'thread'或'process'，None时读取环境变量SNAKE_DETECTION_MODE
+        self.detection_mode = detection_mode
+        # 手部检测的推理分辨率，如'640x360'，None时读取环境变量SNAKE_INFERENCE_SIZE
+        self.inference_size = inference_size
+        # 检测结果的最大有效时间（秒），从帧的采集时间算起，与检测统计中的staleness_s含义相同
+        self.max_detection_age = max_detection_age
 
         self.is_loading = False
         self.loading_progress = 0
@@ -390,7 +415,7 @@ class GameController:
         
 
 
-        food_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "resources", "assets", "images", "Donut.png")
+        food_path = asset_manager.resolve("Donut.png")
         
 
 
@@ -783,7 +808,7 @@ class GameController:
 
                 mouse_pos = event.pos
 
-                img_temp = np.zeros((self.screen_height, self.screen_width, 3), dtype=np.uint8)
+                img_temp = self.frame_pool.acquire('scratch')
                 img_temp, color_blocks = draw_settings_screen(img_temp, self.snake_color, mouse_pos, current_language=self.current_language)
 
                 for block in color_blocks:
@@ -832,9 +857,7 @@ class GameController:
                         self.high_score_gesture = self.hand_tracking_game.score
                     save_game_data({'high_score_classic': self.high_score_classic, 'high_score_gesture': self.high_score_gesture, 'snake_color': self.snake_color}) 
                     self.game_mode = 'selection'
-                    if self.capture is not None:
-                        self.capture.release()
-                        self.capture = None
+                    self.release_camera()
                     self.show_menu_buttons()
                     global_particles.clear()
         elif self.game_mode == 'hand_tracking_settings':
@@ -875,8 +898,7 @@ class GameController:
                 # 重新计算与update_and_draw相同的位置
                 try:
                     title_text = get_translation('settings_language')
-                    title_surface = self.font_large.render(title_text, True, (255, 255, 255))
-                    title_height = title_surface.get_height()
+                    title_height = self.text_large.size(title_text)[1]
                 except Exception as e:
                     title_height = 80  
                 
@@ -1004,7 +1026,8 @@ class GameController:
         
         if self.game_mode == 'loading':
 
-            img = np.zeros((self.screen_height, self.screen_width, 3), dtype=np.uint8)
+            # 星空背景会覆盖整个缓冲区，不需要先清空
+            img = self.frame_pool.acquire()
 
             from game.core.game_ui import draw_starry_background
             img = draw_starry_background(img)
@@ -1012,9 +1035,7 @@ class GameController:
 
             if self.loading_progress < 20:
 
-                if self.capture is not None:
-                    self.capture.release()
-                    self.capture = None
+                self.release_camera()
                 self.loading_progress = 20
             elif self.loading_progress < 50:
 
@@ -1042,11 +1063,12 @@ class GameController:
                 self.hand_tracking_game.reset()
 
                 self.hand_tracking_game.snake_color = self.snake_color
+                self.start_hand_detection()
                 self.loading_progress = 100
             
 
             try:
-                from game.utils.improved_chinese_text import put_chinese_text_pil
+                from game.utils.improved_chinese_text import put_chinese_text_pil, get_chinese_text_size
                 
                 if self.loading_progress < 20:
                     loading_text = get_translation('loading_releasing_resources')
@@ -1060,8 +1082,7 @@ class GameController:
                     loading_text = get_translation('loading_completed')
                 
                 # 获取文本尺寸以实现居中
-                _, text_size = put_chinese_text_pil(img.copy(), loading_text, (0, 0), 40, (255, 255, 255))
-                text_width, _ = text_size
+                text_width, _ = get_chinese_text_size(loading_text, 40)
                 # 计算水平居中位置
                 text_x = self.screen_width // 2 - text_width // 2
                 text_y = self.screen_height // 2 - 50
@@ -1110,7 +1131,7 @@ class GameController:
                 self.is_loading = False
                 
         elif self.game_mode == 'startup':
-            img = np.zeros((self.screen_height, self.screen_width, 3), dtype=np.uint8)  
+            img = self.frame_pool.acquire()
             img = draw_startup_animation(img, self.animation_frame_count)
             self.animation_frame_count += 1
 
@@ -1121,7 +1142,7 @@ class GameController:
             self.draw_opencv_image(img)
 
         elif self.game_mode == 'selection':
-            img = np.zeros((self.screen_height, self.screen_width, 3), dtype=np.uint8)
+            img = self.frame_pool.acquire()
 
             img = draw_mode_selection_screen(img, self.hovered_button, self.clicked_button, self.current_language)
             self.draw_opencv_image(img)
@@ -1130,7 +1151,7 @@ class GameController:
             try:
 
                 mouse_pos = pygame.mouse.get_pos()
-                img = np.zeros((self.screen_height, self.screen_width, 3), dtype=np.uint8)
+                img = self.frame_pool.acquire()
 
                 img, color_blocks = draw_settings_screen(img, self.snake_color, mouse_pos, current_language=self.current_language)
                 self.draw_opencv_image(img)
@@ -1160,13 +1181,7 @@ class GameController:
                     global_particles.clear()
 
         elif self.game_mode == 'hand_tracking':
-            snake_bg_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'resources', 'assets', 'images', 'snake.png')
-            if os.path.exists(snake_bg_path):
-                snake_bg = cv2.imread(snake_bg_path)
-                snake_bg = cv2.resize(snake_bg, (self.screen_width, self.screen_height))
-                img = snake_bg.copy()
-            else:
-                img = np.zeros((self.screen_height, self.screen_width, 3), dtype=np.uint8) + 20  
+            img = None
             
             mouse_pos = pygame.mouse.get_pos()
             mouse_clicked = pygame.mouse.get_pressed()[0] if self.hand_tracking_game.gameOver else False
@@ -1175,23 +1190,29 @@ class GameController:
             
             if self.capture is not None and self.capture.isOpened():
                 try:
-                    success, cam_img = self.capture.read()
-                    if success and cam_img is not None:
-                        original_cam_img = cam_img.copy()
-                        
-                        if not self.hide_camera_feed:
-                            display_img = cv2.flip(original_cam_img, 1)  
-                            display_img = cv2.resize(display_img, (self.screen_width, self.screen_height))
-                            img = display_img.copy()
-                        
-                        if self.hand_detector is not None:
-                            try:
-                                detection_img = cv2.flip(original_cam_img, 1)
-                                hand_position = self.get_hand_position(detection_img)
-                            except Exception as e:
-                                print(f"手部检测错误: {e}")
+                    if not self.hide_camera_feed:
+                        success, cam_img = self.capture.read()
+                        if success and cam_img is not None:
+                            # 镜像和缩放都写入缓冲池中的缓冲区，不分配新数组
+                            img = self.frame_pool.acquire()
+                            if cam_img.shape == img.shape:
+                                cv2.flip(cam_img, 1, dst=img)
+                            else:
+                                display_img = cv2.flip(cam_img, 1, dst=self.frame_pool.acquire('camera', shape=cam_img.shape))
+                                cv2.resize(display_img, (self.screen_width, self.screen_height), dst=img)
                 except Exception as e:
                     print(f"摄像头读取错误: {e}")
+                
+                # 手部检测在后台线程进行，这里只取最近一次的结果
+                hand_position = self.get_hand_position()
+            
+            if img is None:
+                # 背景图只解码和缩放一次，每帧拷贝到缓冲池的缓冲区中用于绘制
+                snake_bg = asset_manager.get_screen('snake.png', (self.screen_width, self.screen_height))
+                if snake_bg is not None:
+                    img = self.frame_pool.acquire_copy(snake_bg)
+                else:
+                    img = self.frame_pool.acquire(fill=20)
             
             if hand_position:
                 img = self.hand_tracking_game.update(img, hand_position, mouse_pos, mouse_clicked, self.high_score_gesture)
@@ -1211,9 +1232,7 @@ class GameController:
             if self.hand_tracking_game.return_to_menu:
                 self.stop_bgm()
                 self.game_mode = 'selection'
-                if self.capture is not None:
-                    self.capture.release()
-                    self.capture = None
+                self.release_camera()
                 self.show_menu_buttons()
                 global_particles.clear()
             
@@ -1230,8 +1249,7 @@ class GameController:
             title_text = get_translation('game_paused')
             try:
 
-                title_surface = self.font_large.render(title_text, True, (255, 255, 255))
-                title_height = title_surface.get_height()
+                title_height = self.text_large.size(title_text)[1]
             except Exception as e:
                 print(f"标题渲染错误: {e}")
                 title_height = 80  
@@ -1254,8 +1272,7 @@ class GameController:
             
 
             try:
-                title_rect = title_surface.get_rect(center=(self.screen_width//2, menu_start_y + title_height//2))
-                self.screen.blit(title_surface, title_rect)
+                self.text_large.draw(self.screen, title_text, (255, 255, 255), center=(self.screen_width//2, menu_start_y + title_height//2))
             except Exception as e:
                 print(f"标题渲染错误: {e}")
 
@@ -1301,9 +1318,7 @@ class GameController:
             pygame.draw.rect(self.screen, resume_button_color, resume_button_rect, border_radius=10)
             resume_text = get_translation('game_resume')
             try:
-                resume_surface = self.font_small.render(resume_text, True, text_color)
-                resume_text_rect = resume_surface.get_rect(center=resume_button_rect.center)
-                self.screen.blit(resume_surface, resume_text_rect)
+                self.text_small.draw(self.screen, resume_text, text_color, center=resume_button_rect.center)
             except Exception as e:
                 print(f"返回游戏按钮文本渲染错误: {e}")
             
@@ -1312,9 +1327,7 @@ class GameController:
             pygame.draw.rect(self.screen, menu_button_color, menu_button_rect, border_radius=10)
             menu_text = get_translation('game_return_menu')
             try:
-                menu_surface = self.font_small.render(menu_text, True, text_color)
-                menu_text_rect = menu_surface.get_rect(center=menu_button_rect.center)
-                self.screen.blit(menu_surface, menu_text_rect)
+                self.text_small.draw(self.screen, menu_text, text_color, center=menu_button_rect.center)
             except Exception as e:
                 print(f"主菜单按钮文本渲染错误: {e}")
             
@@ -1323,9 +1336,7 @@ class GameController:
             pygame.draw.rect(self.screen, exit_button_color, exit_button_rect, border_radius=10)
             exit_text = get_translation('menu_exit')
             try:
-                exit_surface = self.font_small.render(exit_text, True, text_color)
-                exit_text_rect = exit_surface.get_rect(center=exit_button_rect.center)
-                self.screen.blit(exit_surface, exit_text_rect)
+                self.text_small.draw(self.screen, exit_text, text_color, center=exit_button_rect.center)
             except Exception as e:
                 print(f"退出按钮文本渲染错误: {e}")
             
@@ -1344,9 +1355,7 @@ class GameController:
 
                     save_game_data({'high_score_classic': self.high_score_classic, 'high_score_gesture': self.high_score_gesture, 'snake_color': self.snake_color})
 
-                    if self.capture is not None:
-                        self.capture.release()
-                        self.capture = None
+                    self.release_camera()
 
                     self.game_mode = 'selection'
 
@@ -1366,8 +1375,7 @@ class GameController:
             title_text = get_translation('settings_title')
             try:
 
-                title_surface = self.font_large.render(title_text, True, (255, 255, 255))
-                title_height = title_surface.get_height()
+                title_height = self.text_large.size(title_text)[1]
             except Exception as e:
                 print(f"标题渲染错误: {e}")
                 title_height = 80  
@@ -1390,8 +1398,7 @@ class GameController:
             
 
             try:
-                title_rect = title_surface.get_rect(center=(self.screen_width//2, menu_start_y + title_height//2))
-                self.screen.blit(title_surface, title_rect)
+                self.text_large.draw(self.screen, title_text, (255, 255, 255), center=(self.screen_width//2, menu_start_y + title_height//2))
             except Exception as e:
                 print(f"标题渲染错误: {e}")
 
@@ -1451,9 +1458,7 @@ class GameController:
             pygame.draw.rect(self.screen, color_button_color, color_button_rect, border_radius=10)
             color_text = get_translation('settings_color')
             try:
-                color_surface = self.font_small.render(color_text, True, text_color)
-                color_text_rect = color_surface.get_rect(center=color_button_rect.center)
-                self.screen.blit(color_surface, color_text_rect)
+                self.text_small.draw(self.screen, color_text, text_color, center=color_button_rect.center)
             except Exception as e:
                 print(f"颜色设置按钮文本渲染错误: {e}")
             
@@ -1462,9 +1467,7 @@ class GameController:
             pygame.draw.rect(self.screen, hand_tracking_settings_button_color, hand_tracking_settings_button_rect, border_radius=10)
             hand_tracking_settings_text = get_translation('menu_gesture_mode')
             try:
-                hand_tracking_settings_surface = self.font_small.render(hand_tracking_settings_text, True, text_color)
-                hand_tracking_settings_text_rect = hand_tracking_settings_surface.get_rect(center=hand_tracking_settings_button_rect.center)
-                self.screen.blit(hand_tracking_settings_surface, hand_tracking_settings_text_rect)
+                self.text_small.draw(self.screen, hand_tracking_settings_text, text_color, center=hand_tracking_settings_button_rect.center)
             except Exception as e:
                 print(f"手势控制设置按钮文本渲染错误: {e}")
             
@@ -1473,9 +1476,7 @@ class GameController:
             pygame.draw.rect(self.screen, menu_button_color, menu_button_rect, border_radius=10)
             menu_text = get_translation('game_return_menu')
             try:
-                menu_surface = self.font_small.render(menu_text, True, text_color)
-                menu_text_rect = menu_surface.get_rect(center=menu_button_rect.center)
-                self.screen.blit(menu_surface, menu_text_rect)
+                self.text_small.draw(self.screen, menu_text, text_color, center=menu_button_rect.center)
             except Exception as e:
                 print(f"主菜单按钮文本渲染错误: {e}")
             
@@ -1484,9 +1485,7 @@ class GameController:
             pygame.draw.rect(self.screen, exit_button_color, exit_button_rect, border_radius=10)
             exit_text = get_translation('menu_exit')
             try:
-                exit_surface = self.font_small.render(exit_text, True, text_color)
-                exit_text_rect = exit_surface.get_rect(center=exit_button_rect.center)
-                self.screen.blit(exit_surface, exit_text_rect)
+                self.text_small.draw(self.screen, exit_text, text_color, center=exit_button_rect.center)
             except Exception as e:
                 print(f"退出按钮文本渲染错误: {e}")
             
@@ -1496,9 +1495,7 @@ class GameController:
             pygame.draw.rect(self.screen, language_button_color, language_button_rect, border_radius=10)
             language_text = get_translation('settings_language')
             try:
-                language_surface = self.font_small.render(language_text, True, text_color)
-                language_text_rect = language_surface.get_rect(center=language_button_rect.center)
-                self.screen.blit(language_surface, language_text_rect)
+                self.text_small.draw(self.screen, language_text, text_color, center=language_button_rect.center)
             except Exception as e:
                 print(f"语言设置按钮文本渲染错误: {e}")
             
@@ -1530,8 +1527,7 @@ class GameController:
             # 标题文本
             title_text = get_translation('settings_language')
             try:
-                title_surface = self.font_large.render(title_text, True, (255, 255, 255))
-                title_height = title_surface.get_height()
+                title_height = self.text_large.size(title_text)[1]
             except Exception as e:
                 print(f"标题渲染错误: {e}")
                 title_height = 80  
@@ -1559,8 +1555,7 @@ class GameController:
             
             # 绘制标题
             try:
-                title_rect = title_surface.get_rect(center=(self.screen_width//2, menu_start_y + title_height//2))
-                self.screen.blit(title_surface, title_rect)
+                self.text_large.draw(self.screen, title_text, (255, 255, 255), center=(self.screen_width//2, menu_start_y + title_height//2))
             except Exception as e:
                 print(f"标题渲染错误: {e}")
                 # 备用方案
@@ -1597,9 +1592,7 @@ class GameController:
                 
                 # 绘制语言名称
                 try:
-                    lang_surface = self.font_small.render(lang['name'], True, text_color)
-                    lang_text_rect = lang_surface.get_rect(center=lang_button_rect.center)
-                    self.screen.blit(lang_surface, lang_text_rect)
+                    self.text_small.draw(self.screen, lang['name'], text_color, center=lang_button_rect.center)
                 except Exception as e:
                     print(f"语言选项渲染错误: {e}")
                 
@@ -1614,8 +1607,7 @@ class GameController:
             title_text = get_translation('menu_gesture_mode')
             try:
 
-                title_surface = self.font_large.render(title_text, True, (255, 255, 255))
-                title_height = title_surface.get_height()
+                title_height = self.text_large.size(title_text)[1]
             except Exception as e:
                 print(f"标题渲染错误: {e}")
                 title_height = 80  
@@ -1635,8 +1627,7 @@ class GameController:
             
 
             try:
-                title_rect = title_surface.get_rect(center=(self.screen_width//2, menu_start_y + title_height//2))
-                self.screen.blit(title_surface, title_rect)
+                self.text_large.draw(self.screen, title_text, (255, 255, 255), center=(self.screen_width//2, menu_start_y + title_height//2))
             except Exception as e:
                 print(f"标题渲染错误: {e}")
 
@@ -1682,9 +1673,7 @@ class GameController:
                 camera_toggle_text = get_translation('settings_hide_camera')
             
             try:
-                camera_toggle_surface = self.font_small.render(camera_toggle_text, True, text_color)
-                camera_toggle_text_rect = camera_toggle_surface.get_rect(center=camera_toggle_button_rect.center)
-                self.screen.blit(camera_toggle_surface, camera_toggle_text_rect)
+                self.text_small.draw(self.screen, camera_toggle_text, text_color, center=camera_toggle_button_rect.center)
             except Exception as e:
                 print(f"摄像头开关按钮文本渲染错误: {e}")
             
@@ -1692,9 +1681,7 @@ class GameController:
             pygame.draw.rect(self.screen, back_button_color, back_button_rect, border_radius=10)
             back_text = get_translation('settings_return')
             try:
-                back_surface = self.font_small.render(back_text, True, text_color)
-                back_text_rect = back_surface.get_rect(center=back_button_rect.center)
-                self.screen.blit(back_surface, back_text_rect)
+                self.text_small.draw(self.screen, back_text, text_color, center=back_button_rect.center)
             except Exception as e:
                 print(f"返回按钮文本渲染错误: {e}")
             
@@ -1704,9 +1691,7 @@ class GameController:
             else:
                 status_text = get_translation('settings_camera') + ": " + get_translation('menu_show') + " (显示摄像头画面)"
             try:
-                status_surface = self.font_small.render(status_text, True, (200, 200, 200))
-                status_rect = status_surface.get_rect(center=(self.screen_width//2, back_button_rect.bottom + 40))
-                self.screen.blit(status_surface, status_rect)
+                self.text_small.draw(self.screen, status_text, (200, 200, 200), center=(self.screen_width//2, back_button_rect.bottom + 40))
             except Exception as e:
                 print(f"状态提示渲染错误: {e}")
             
@@ -1715,91 +1700,49 @@ class GameController:
             if keys[pygame.K_ESCAPE]:
                 self.game_mode = 'settings_menu'
 
-    def get_hand_position(self, img):
-        """获取手部位置，如果手势追踪不可用则返回None"""
-        try:
-            # 检查图像是否有效
-            if img is None or len(img.shape) != 3 or img.shape[2] < 3:
-                return None
-            
-            # 直接在BGR图像上进行检测，避免颜色转换，提高性能
-            # cvzone的HandDetector实际上支持BGR格式，无需转换
-            hands, _ = self.hand_detector.findHands(img, draw=False, flipType=False)
-            
-            if hands:
-                hand = hands[0]
-                lmList = hand['lmList']
-                # lmList包含21个手部关键点，索引8是食指指尖
-                # 优化：即使只有部分关键点，只要有食指指尖（索引8）就能工作
-                if len(lmList) >= 9:  # 确保至少有9个关键点，包含食指指尖
-                    # 获取食指指尖坐标（索引8）
-                    index_x = int(lmList[8][0])
-                    index_y = int(lmList[8][1])
-                    
-                    # 摄像头分辨率固定为1280x720，需要映射到游戏窗口分辨率
-                    # 计算缩放比例
-                    cam_width = 1280
-                    cam_height = 720
-                    
-                    # 将摄像头坐标映射到游戏窗口坐标
-                    scale_x = self.screen_width / cam_width
-                    scale_y = self.screen_height / cam_height
-                    
-                    # 应用缩放，确保蛇跟着手指方向正确移动
-                    game_x = int(index_x * scale_x)
-                    game_y = int(index_y * scale_y)
-                    
-                    # 确保坐标在游戏窗口范围内
-                    game_x = max(0, min(self.screen_width, game_x))
-                    game_y = max(0, min(self.screen_height, game_y))
-                    
-                    return game_x, game_y
+    def get_hand_position(self):
+        """获取后台检测线程最近一次发布的手部位置（游戏窗口坐标），没有结果时返回None"""
+        if self.hand_detection_worker is None:
             return None
-        except Exception as e:
-            print(f"获取手部位置错误: {e}")
+        detection = self.hand_detection_worker.latest()
+        if detection is None or detection.position is None:
+            return None
+        # 摄像头卡住或检测停滞时结果会过期，超过max_detection_age的结果不再使用
+        if time.perf_counter() - detection.timestamp > self.max_detection_age:
             return None
+        # 按实际的摄像头帧尺寸映射到游戏窗口坐标，确保蛇跟着手指方向正确移动
+        return map_to_screen(detection.position, detection.frame_size, (self.screen_width, self.screen_height))
+
+    def start_hand_detection(self):
+        """启动后台手部检测线程"""
+        self.stop_hand_detection()
+        if self.hand_detector is not None and self.capture is not None and self.capture.isOpened():
+            self.hand_detection_worker = create_hand_detection_worker(
+                self.hand_detector, self.capture, self.detection_mode, inference_size=self.inference_size
+            )
+
+    def stop_hand_detection(self):
+        """停止后台手部检测线程"""
+        if self.hand_detection_worker is not None:
+            self.hand_detection_worker.stop()
+            self.hand_detection_worker = None
+
+    def release_camera(self):
+        """停止手部检测并释放摄像头"""
+        self.stop_hand_detection()
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
 
     def draw_opencv_image(self, img):
         """将OpenCV图像绘制到pygame屏幕上"""
-        # 确保图像数据类型正确
-        if img.dtype != np.uint8:
-            img = img.astype(np.uint8)
-        
-        # 将OpenCV图像转换为pygame表面
-        if len(img.shape) == 3:
-            if img.shape[2] == 3:
-                # BGR to RGB
-                img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-                # pygame.surfarray.make_surface期望行优先数据，而OpenCV是列优先
-                # 需要转置图像数据，将(height, width, channels)转换为(width, height, channels)
-                surface = pygame.surfarray.make_surface(np.transpose(img_rgb, (1, 0, 2)))
-            elif img.shape[2] == 4:
-                # BGRA to RGBA
-                img_rgba = cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
-                # 转置图像数据
-                surface = pygame.surfarray.make_surface(np.transpose(img_rgba, (1, 0, 2)))
-            else:
-                return  
-        elif len(img.shape) == 2:
-            # 灰度图转换为RGB
-            img_rgb = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
-            # 转置图像数据
-            surface = pygame.surfarray.make_surface(np.transpose(img_rgb, (1, 0, 2)))
-        else:
-            return  # 不支持的图像维度
-        
-        # 将表面绘制到屏幕上
-        self.screen.blit(surface, (0, 0))
+        self.frame_presenter.present(self.screen, img)
 
     def initialize_camera(self):
         try:
-            if self.capture is not None:
-                self.capture.release()
-            # 使用指定的分辨率初始化摄像头
-            self.capture = cv2.VideoCapture(0)
-            if self.capture.isOpened():
-                self.capture.set(3, 1280)  # 设置宽度
-                self.capture.set(4, 720)   # 设置高度
+            self.release_camera()
+            # 使用指定的分辨率初始化摄像头，由后台线程持续读取，游戏循环只取最新帧
+            self.capture = ThreadedCapture(0, width=1280, height=720)
         except Exception as e:
             print(f"摄像头初始化错误: {e}")
             self.capture = None
@@ -1808,8 +1751,8 @@ class GameController:
         game = self.hand_tracking_game
         try:
             # 使用改进的中文文本渲染函数，配合翻译功能
-            img = put_chinese_text_pil(img, get_translation('game_score').format(game.score), (int(self.screen_width * 0.023), int(self.screen_height * 0.04)), 40, (50, 130, 246))
-            img = put_chinese_text_pil(img, get_translation('game_high_score').format(self.high_score_gesture), (int(self.screen_width * 0.023), int(self.screen_height * 0.11)), 40, (50, 130, 246))
+            img, _ = put_chinese_text_pil(img, get_translation('game_score').format(game.score), (int(self.screen_width * 0.023), int(self.screen_height * 0.04)), 40, (50, 130, 246))
+            img, _ = put_chinese_text_pil(img, get_translation('game_high_score').format(self.high_score_gesture), (int(self.screen_width * 0.023), int(self.screen_height * 0.11)), 40, (50, 130, 246))
         except Exception as e:
             # 如果中文文本失败，则使用英文文本作为后备
             cv2.putText(img, get_translation('game_score').format(game.score), (int(self.screen_width * 0.023), int(self.screen_height * 0.04)), 
@@ -1826,10 +1769,10 @@ class GameController:
         try:
             # 使用改进的中文文本渲染函数
             img = put_rainbow_text_pil(img, get_translation('game_game_over'), (self.screen_width//2 - 160, self.screen_height//2 - 100), 80)
-            img = put_chinese_text_pil(img, get_translation('game_final_score').format(game.score), (self.screen_width//2 - 120, self.screen_height//2), 60, (50, 130, 246))
-            img = put_chinese_text_pil(img, get_translation('game_high_score').format(self.high_score_gesture), (self.screen_width//2 - 120, self.screen_height//2 + 40), 40, (50, 130, 246))
+            img, _ = put_chinese_text_pil(img, get_translation('game_final_score').format(game.score), (self.screen_width//2 - 120, self.screen_height//2), 60, (50, 130, 246))
+            img, _ = put_chinese_text_pil(img, get_translation('game_high_score').format(self.high_score_gesture), (self.screen_width//2 - 120, self.screen_height//2 + 40), 40, (50, 130, 246))
 
-            img = put_chinese_text_pil(img, get_translation('gesture_return_menu'), (self.screen_width//2 - 180, self.screen_height//2 + 140), 40, (255, 255, 255))
+            img, _ = put_chinese_text_pil(img, get_translation('gesture_return_menu'), (self.screen_width//2 - 180, self.screen_height//2 + 140), 40, (255, 255, 255))
         except Exception as e:
             # 如果中文文本失败，则使用英文文本作为后备
             cv2.putText(img, get_translation('game_game_over'), (self.screen_width//2 - 150, self.screen_height//2 - 100), 
@@ -1843,7 +1786,7 @@ class GameController:
         return img
 
     def cleanup(self):
-        if self.capture: self.capture.release()
+        self.release_camera()
         pygame.quit()
 
 if __name__ == '__main__':
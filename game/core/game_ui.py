@@ -2,11 +2,11 @@ import cv2
 import numpy as np
 from game.utils.chinese_text import put_chinese_text, put_rainbow_text
 import random
-from PIL import ImageFont
 import pygame
 import os
-from game.utils.improved_chinese_text import put_chinese_text_pil, put_rainbow_text_pil
+from game.utils.improved_chinese_text import put_chinese_text_pil, put_rainbow_text_pil, get_chinese_text_size, get_chinese_text_sizes
 from game.utils.language_manager import get_translation
+from game.utils.particle_system import ParticleSystem
 
 
 gradient_colors_data = {
@@ -17,123 +17,99 @@ gradient_colors_data = {
 }
 
 
-global_particles = []
+# 全局粒子系统，粒子数超过容量时丢弃最旧的粒子
+global_particles = ParticleSystem(capacity=4096)
 shockwaves = []
 
 def get_text_size(text, size):
-    """使用Pillow计算中文文本的渲染尺寸"""
-    font_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "utils", "fonts", "simhei.ttf")
-    try:
-        font = ImageFont.truetype(font_path, size)
-    except IOError:
-        try:
-            font = ImageFont.truetype("msyh.ttc", size)
-        except IOError:
-            try:
-                font = ImageFont.truetype("simsun.ttc", size)
-            except IOError:
-                # 使用系统默认字体并确保能正确显示中文
-                try:
-                    font = ImageFont.truetype("arial.ttf", size)
-                except:
-                    font = ImageFont.load_default()
-    
-    # getbbox返回(left, top, right, bottom)
-    if hasattr(font, 'getbbox'):
-        bbox = font.getbbox(text)
-        return bbox[2] - bbox[0], bbox[3] - bbox[1]
-    else:
-        # 兼容旧版本Pillow
-        text_width, text_height = font.getsize(text)
-        return text_width, text_height
-
-class EnhancedParticle:
-    """增强版粒子类，支持颜色渐变"""
-    def __init__(self, x, y, start_color, end_color, velocity_range=(-3, 3), lifespan_range=(15, 30), size_range=(2, 6), gravity=0.05):
-
-        self.x, self.y = float(x), float(y)
-        self.vx, self.vy = random.uniform(velocity_range[0], velocity_range[1]), random.uniform(velocity_range[0], velocity_range[1])
-        self.lifespan = self.initial_lifespan = random.randint(lifespan_range[0], lifespan_range[1])
-        self.start_color, self.end_color = np.array(start_color), np.array(end_color)
-        self.color = self.start_color
-        self.size = random.uniform(size_range[0], size_range[1])
-        self.gravity = gravity
-
-    def update(self):
-        self.x += self.vx; self.y += self.vy; self.vy += self.gravity; self.lifespan -= 1
-        life_ratio = max(0, self.lifespan / self.initial_lifespan)
-        self.color = self.end_color + (self.start_color - self.end_color) * life_ratio
-        self.size = max(0, self.size * life_ratio)
-
-    def draw(self, surface):
-        if self.lifespan > 0 and self.size > 0:
-            draw_color = tuple(self.color.astype(int))
-            if isinstance(surface, np.ndarray): cv2.circle(surface, (int(self.x), int(self.y)), int(self.size), [int(x) for x in draw_color], cv2.FILLED)
-            elif isinstance(surface, pygame.Surface): pygame.draw.circle(surface, draw_color, (int(self.x), int(self.y)), int(self.size))
+    """使用共享的字体缓存计算中文文本的渲染尺寸，结果按(文本, 字号)缓存"""
+    return get_chinese_text_size(text, size)
+
+def get_text_sizes(texts, size):
+    """批量计算同一字号下多个文本的渲染尺寸"""
+    return get_chinese_text_sizes(texts, size)
+
+_ring_masks = {}
+def _ring_mask(radius, thickness):
+    """
+    半径和线宽对应的抗锯齿圆环，返回环上像素相对圆心的偏移(dy, dx)和覆盖率(0~1)。
+    冲击波每一步的半径和线宽都是固定的，每种组合只用cv2.circle计算一次。
+    """
+    key = (radius, thickness)
+    ring = _ring_masks.get(key)
+    if ring is None:
+        half = radius + thickness // 2 + 2
+        canvas = np.zeros((2 * half + 1, 2 * half + 1), dtype=np.uint8)
+        cv2.circle(canvas, (half, half), radius, 255, thickness, cv2.LINE_AA)
+        dy, dx = np.nonzero(canvas)
+        ring = (dy - half, dx - half, canvas[dy, dx].astype(np.float32) / 255)
+        _ring_masks[key] = ring
+    return ring
 
 class Shockwave:
     """冲击波效果类"""
     def __init__(self, x, y, end_radius=250, lifespan=30, color=(255, 255, 255), thickness=8):
-        self.x, self.y, self.lifespan, self.initial_lifespan = x, y, lifespan, lifespan
+        self.x, self.y, self.lifespan, self.initial_lifespan = int(x), int(y), lifespan, lifespan
         self.end_radius, self.color, self.initial_thickness = end_radius, color, thickness
 
     def update(self): self.lifespan -= 1
 
-    def draw(self, surface):
-        if self.lifespan > 0:
-            life_ratio = 1.0 - (self.lifespan / self.initial_lifespan)
-            current_radius = int(self.end_radius * life_ratio)
-            current_alpha = 1.0 - life_ratio
-            current_thickness = int(self.initial_thickness * current_alpha)
-            if current_thickness > 0 and isinstance(surface, np.ndarray):
-                overlay = surface.copy()
-                cv2.circle(overlay, (self.x, self.y), current_radius, self.color, current_thickness, cv2.LINE_AA)
-                cv2.addWeighted(overlay, current_alpha, surface, 1 - current_alpha, 0, surface)
+    def ring(self):
+        """当前的(半径, 线宽, 不透明度)，不需要绘制时返回None"""
+        if self.lifespan <= 0:
+            return None
+        life_ratio = 1.0 - (self.lifespan / self.initial_lifespan)
+        current_alpha = 1.0 - life_ratio
+        current_thickness = int(self.initial_thickness * current_alpha)
+        if current_thickness <= 0:
+            return None
+        return int(self.end_radius * life_ratio), current_thickness, current_alpha
+
+    def draw(self, surface): draw_shockwaves(surface, [self])
+
+def draw_shockwaves(surface, waves):
+    """
+    绘制冲击波：只取出圆环上的像素，与圆环颜色按 不透明度×覆盖率 混合后写回，
+    不复制整帧也不对整帧做addWeighted，开销只与圆环的大小有关。
+    多个冲击波按顺序依次混合，重叠处与逐个叠加绘制的结果相同。
+    """
+    if not isinstance(surface, np.ndarray):
+        return surface
+    height, width = surface.shape[:2]
+    for sw in waves:
+        ring = sw.ring()
+        if ring is None:
+            continue
+        radius, thickness, alpha = ring
+        dy, dx, coverage = _ring_mask(radius, thickness)
+        ys, xs = dy + sw.y, dx + sw.x
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        ys, xs = ys[inside], xs[inside]
+        pixels = surface[ys, xs].astype(np.float32)
+        pixels += (np.asarray(sw.color, dtype=np.float32) - pixels) * (coverage[inside] * alpha)[:, None]
+        surface[ys, xs] = (pixels + 0.5).astype(np.uint8)
+    return surface
 
 def emit_particle_burst(count, pos, colors, vel_range=(-4, 4), life_range=(30, 60), size_range=(3, 8), grav=0.02):
-    for _ in range(count):
-        # 生成径向速度，使粒子从中心均匀向外扩散
-        angle = random.uniform(0, 2 * np.pi)
-        speed = random.uniform(vel_range[0], vel_range[1])
-        # 确保vx和vy是标量值，不是numpy数组
-        vx = float(speed * np.cos(angle))
-        vy = float(speed * np.sin(angle))
-        # 创建粒子
-        particle = EnhancedParticle(pos[0], pos[1], *random.choice(colors), (-4, 4), life_range, size_range, grav)
-        # 覆盖速度，使用径向速度
-        particle.vx = vx
-        particle.vy = vy
-        global_particles.append(particle)
+    # 径向速度，使粒子从中心均匀向外扩散
+    global_particles.emit_burst(count, pos, colors, vel_range, life_range, size_range, grav)
 def emit_particle_trail(count, pos, colors, vel_range=(-2, 2), life_range=(20, 40), size_range=(2, 5), grav=0.02):
-    for _ in range(count): global_particles.append(EnhancedParticle(pos[0], pos[1], *random.choice(colors), vel_range, life_range, size_range, grav))
+    global_particles.emit_trail(count, pos, colors, vel_range, life_range, size_range, grav)
 def create_shockwave(position): shockwaves.append(Shockwave(position[0], position[1]))
 
 def draw_and_update_effects(surface):
-    global global_particles, shockwaves
+    global shockwaves
     
-    # 优化：限制最大粒子数量，避免过多粒子导致卡顿
-    max_particles = 100  # 设置最大粒子数量
-    if len(global_particles) > max_particles:
-        # 只保留最新的max_particles个粒子
-        global_particles = global_particles[-max_particles:]
+    # 更新和绘制粒子：所有粒子一次向量化更新，按半径分批绘制
+    global_particles.update_and_draw(surface)
     
-    # 更新和绘制粒子
-    active_particles = []
-    for p in global_particles:
-        if p.lifespan > 0:
-            p.update()
-            active_particles.append(p)
-            p.draw(surface)
-    
-    global_particles = active_particles
-    
-    # 更新和绘制冲击波
+    # 更新冲击波后依次绘制
     active_shockwaves = []
     for sw in shockwaves:
         if sw.lifespan > 0:
             sw.update()
             active_shockwaves.append(sw)
-            sw.draw(surface)
+    draw_shockwaves(surface, active_shockwaves)
     
     shockwaves = active_shockwaves
     return surface
@@ -141,9 +117,20 @@ def draw_and_update_effects(surface):
 background_stars = []
 def initialize_stars(w, h, n=250):
     global background_stars; background_stars = [{'x': random.randint(0, w), 'y': random.randint(0, h), 'b': random.uniform(0.4, 1.0), 'c': random.choice([(255,200,150),(200,255,150),(150,200,255),(255,150,255)]), 'ts': random.uniform(0.05,0.2), 'tp': random.uniform(0,6.28)} for _ in range(n)]
+_background_gradients = {}
+def _background_gradient(h, w):
+    """星空背景的渐变只和尺寸有关，生成一次后每帧用copyto原地填充"""
+    gradient = _background_gradients.get((h, w))
+    if gradient is None:
+        gradient = np.empty((h, w, 3), dtype=np.uint8)
+        for i in range(h): cv2.line(gradient, (0, i), (w, i), (int(60+40*(i/h)), int(50-30*(i/h)), int(20+40*(i/h))), 1)
+        _background_gradients.clear(); _background_gradients[(h, w)] = gradient
+    return gradient
+
 def draw_starry_background(img):
+    """在img上原地绘制星空背景，会覆盖img的全部内容"""
     if not background_stars or len(background_stars) != 250: initialize_stars(img.shape[1], img.shape[0])
-    for i in range(img.shape[0]): cv2.line(img, (0, i), (img.shape[1], i), (int(60+40*(i/img.shape[0])), int(50-30*(i/img.shape[0])), int(20+40*(i/img.shape[0]))), 1)
+    np.copyto(img, _background_gradient(img.shape[0], img.shape[1]))
     for s in background_stars:
         s['tp'] += s['ts']; t = (np.sin(s['tp'])+1)/2; c = tuple(int(c*s['b']*t) for c in s['c']); cv2.circle(img, (s['x'],s['y']), random.choice([1,2]), c, -1)
     return img
@@ -170,9 +157,6 @@ def draw_startup_animation(img, frame):
         if pts: head=pts[-1]; emit_particle_trail(2,head,[((255,255,255),(200,200,200))],vel_range=(-2,2),life_range=(20,40),size_range=(2,5),grav=0.02); cv2.circle(img,head,20,(255,255,255),-1); cv2.circle(img,head,30,(255,255,255),2)
     img = draw_and_update_effects(img)
     
-    # 导入PIL模块
-    from PIL import Image, ImageDraw
-    
     # 主加载文字
     text = get_translation('loading')
     font_size = 40
@@ -191,18 +175,7 @@ def draw_startup_animation(img, frame):
     creator_font_size = 20
     
     # 测量文字大小，动态计算按钮宽度
-    from game.utils.improved_chinese_text import _get_font
-    temp_img = Image.new('RGB', (1, 1))
-    temp_draw = ImageDraw.Draw(temp_img)
-    font = _get_font(creator_font_size)
-    try:
-        bbox = temp_draw.textbbox((0, 0), creator_text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        left, top, right, bottom = bbox  # 提取bbox的四个值
-    except AttributeError:
-        text_width, text_height = temp_draw.textsize(creator_text, font=font)
-        left, top, right, bottom = 0, 0, text_width, text_height  # 兼容旧版本PIL
+    text_width, text_height = get_text_size(creator_text, creator_font_size)
     
     # 动态计算按钮宽度，确保能容纳所有文字，增加20px的内边距
     button_width = text_width + 20
@@ -258,7 +231,7 @@ def draw_rounded_rectangle(img, top_left, bottom_right, color, radius, thickness
 def draw_mode_selection_screen(img, hovered_button=None, clicked_button=None, current_language='zh_cn'):
     """绘制游戏模式选择界面，包括自定义中文按钮"""
     h,w,_=img.shape
-    bg=draw_starry_background(np.zeros_like(img))
+    bg=draw_starry_background(img)
     
     # 根据当前语言设置标题和按钮文本
     from game.utils.language_manager import get_translation
@@ -354,7 +327,7 @@ def draw_mode_selection_screen(img, hovered_button=None, clicked_button=None, cu
 def draw_settings_screen(img, current_color, mouse_pos=None, hovered_color=None, current_language='zh_cn'):
     """绘制游戏设置界面，直接展示颜色块，不使用边框"""
     h, w, _ = img.shape
-    bg = draw_starry_background(np.zeros_like(img))
+    bg = draw_starry_background(img)
     
     # 导入翻译函数
     from game.utils.language_manager import get_translation
@@ -570,7 +543,7 @@ def draw_settings_screen(img, current_color, mouse_pos=None, hovered_color=None,
 
 def draw_game_over_screen(img,score, length):
     h,w,_=img.shape
-    bg=draw_starry_background(np.zeros_like(img))
+    bg=draw_starry_background(img)
 
     try:
         # 使用改进的中文文本渲染函数
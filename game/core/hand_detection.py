@@ -0,0 +1,316 @@
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+
+def detect_index_fingertip(detector, img):
+    """
+    在图像上检测手部，返回食指指尖在图像坐标系中的位置(x, y)，未检测到时返回None。
+    detector需要提供与cvzone.HandDetector相同的findHands接口。
+    """
+    # 直接在BGR图像上进行检测，避免颜色转换，提高性能
+    hands, _ = detector.findHands(img, draw=False, flipType=False)
+    if hands:
+        lmList = hands[0]['lmList']
+        # lmList包含21个手部关键点，索引8是食指指尖
+        if len(lmList) >= 9:
+            return int(lmList[8][0]), int(lmList[8][1])
+    return None
+
+
+def map_to_screen(position, frame_size, screen_size):
+    """把摄像头坐标映射到游戏窗口坐标，并限制在窗口范围内"""
+    frame_width, frame_height = frame_size
+    screen_width, screen_height = screen_size
+    game_x = int(position[0] * screen_width / frame_width)
+    game_y = int(position[1] * screen_height / frame_height)
+    return max(0, min(screen_width, game_x)), max(0, min(screen_height, game_y))
+
+
+def _offset_hand(hand, dx, dy):
+    """把裁剪区域内检测到的手部坐标平移回原图坐标"""
+    moved = dict(hand)
+    moved['lmList'] = [(lm[0] + dx, lm[1] + dy) + tuple(lm[2:]) for lm in hand['lmList']]
+    if 'bbox' in hand:
+        x, y, w, h = hand['bbox']
+        moved['bbox'] = (x + dx, y + dy, w, h)
+    if 'center' in hand:
+        moved['center'] = (hand['center'][0] + dx, hand['center'][1] + dy)
+    return moved
+
+
+def _scale_hand(hand, scale_x, scale_y):
+    """把缩小后的图像上检测到的手部坐标放大回原图坐标"""
+    scaled = dict(hand)
+    scaled['lmList'] = [(int(round(lm[0] * scale_x)), int(round(lm[1] * scale_y))) + tuple(lm[2:]) for lm in hand['lmList']]
+    if 'bbox' in hand:
+        x, y, w, h = hand['bbox']
+        scaled['bbox'] = (int(round(x * scale_x)), int(round(y * scale_y)), int(round(w * scale_x)), int(round(h * scale_y)))
+    if 'center' in hand:
+        scaled['center'] = (int(round(hand['center'][0] * scale_x)), int(round(hand['center'][1] * scale_y)))
+    return scaled
+
+
+def parse_inference_size(value):
+    """
+    解析推理分辨率：'640x360'或(640, 360)返回(宽, 高)；
+    None、空字符串或'full'表示使用摄像头原始分辨率，返回None。
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip().lower()
+        if value in ('', 'full'):
+            return None
+        width, height = value.split('x')
+        value = (width, height)
+    width, height = int(value[0]), int(value[1])
+    if width <= 0 or height <= 0:
+        raise ValueError(f"推理分辨率无效: {value}")
+    return width, height
+
+
+class ScaledHandDetector:
+    """
+    降分辨率推理包装器，接口与cvzone.HandDetector的findHands相同。
+    检测前把帧缩小到inference_size(宽, 高)，再按帧的实际尺寸把关键点映射回原图坐标。
+    只需要食指指尖一个关键点，较低的分辨率通常也足够准确，推理耗时明显降低。
+    """
+
+    def __init__(self, detector, inference_size):
+        self.detector = detector
+        self.inference_size = inference_size
+        self._buffer = None
+
+    def findHands(self, img, draw=False, flipType=False):
+        if flipType:
+            img = cv2.flip(img, 1)
+        img_height, img_width = img.shape[:2]
+        inference_width, inference_height = self.inference_size
+        # 帧本身不比推理分辨率大时直接检测
+        if inference_width >= img_width and inference_height >= img_height:
+            hands, _ = self.detector.findHands(img, draw=False, flipType=False)
+            return hands, img
+
+        shape = (inference_height, inference_width) + img.shape[2:]
+        if self._buffer is None or self._buffer.shape != shape:
+            self._buffer = np.empty(shape, dtype=img.dtype)
+        cv2.resize(img, (inference_width, inference_height), dst=self._buffer, interpolation=cv2.INTER_AREA)
+
+        hands, _ = self.detector.findHands(self._buffer, draw=False, flipType=False)
+        scale_x = img_width / inference_width
+        scale_y = img_height / inference_height
+        return [_scale_hand(hand, scale_x, scale_y) for hand in hands], img
+
+
+def unwrap_detector(detector):
+    """去掉RoiHandTracker、ScaledHandDetector等包装，返回实际的检测器"""
+    while isinstance(detector, (RoiHandTracker, ScaledHandDetector)):
+        detector = detector.detector
+    return detector
+
+
+def wrap_detector(detector, roi_tracking=True, inference_size=None):
+    """按配置给检测器加上感兴趣区域跟踪和降分辨率推理"""
+    if roi_tracking:
+        detector = RoiHandTracker(detector)
+    if inference_size is not None:
+        # 缩放在最外层，感兴趣区域在缩小后的图像上计算
+        detector = ScaledHandDetector(detector, inference_size)
+    return detector
+
+
+class RoiHandTracker:
+    """
+    感兴趣区域跟踪包装器，接口与cvzone.HandDetector的findHands相同。
+    上一帧找到手后，只在其边界框向外扩展的区域内检测，再把关键点映射回原图坐标；
+    跟丢或每隔full_search_interval帧时重新在整帧中搜索。
+    """
+
+    def __init__(self, detector, expand=0.6, min_roi_size=160, full_search_interval=30):
+        self.detector = detector
+        self.expand = expand
+        self.min_roi_size = min_roi_size
+        self.full_search_interval = full_search_interval
+        # 检测器能接收裁剪区域原点时，它内部的历史记录可以统一保存原图坐标
+        self._pass_origin = getattr(detector, 'accepts_roi_origin', False)
+        self._bbox = None
+        self._frames_since_full = 0
+
+        # 统计信息
+        self.roi_detections = 0
+        self.full_detections = 0
+        self.roi_misses = 0
+
+    def _roi(self, img_width, img_height):
+        """根据上一帧的边界框计算扩展后的检测区域(x0, y0, x1, y1)"""
+        x, y, w, h = self._bbox
+        size = max(w, h)
+        margin = int(size * self.expand)
+        half = max(size // 2 + margin, self.min_roi_size // 2)
+        cx, cy = x + w // 2, y + h // 2
+        x0, y0 = max(0, cx - half), max(0, cy - half)
+        x1, y1 = min(img_width, cx + half), min(img_height, cy + half)
+        if x1 - x0 <= 0 or y1 - y0 <= 0:
+            return None
+        return x0, y0, x1, y1
+
+    def _detect(self, img, origin):
+        if self._pass_origin:
+            return self.detector.findHands(img, draw=False, flipType=False, origin=origin)
+        return self.detector.findHands(img, draw=False, flipType=False)
+
+    def findHands(self, img, draw=False, flipType=False):
+        if flipType:
+            img = cv2.flip(img, 1)
+        img_height, img_width = img.shape[:2]
+
+        if self._bbox is not None and self._frames_since_full < self.full_search_interval:
+            roi = self._roi(img_width, img_height)
+            if roi is not None:
+                x0, y0, x1, y1 = roi
+                hands, _ = self._detect(img[y0:y1, x0:x1], (x0, y0))
+                if hands:
+                    hands = [_offset_hand(hand, x0, y0) for hand in hands]
+                    self._bbox = hands[0].get('bbox')
+                    self._frames_since_full += 1
+                    self.roi_detections += 1
+                    return hands, img
+                self.roi_misses += 1
+
+        # 没有上一帧的位置、跟丢或到了定期全图搜索的时间
+        hands, _ = self._detect(img, (0, 0))
+        self._bbox = hands[0].get('bbox') if hands else None
+        self._frames_since_full = 0
+        self.full_detections += 1
+        return hands, img
+
+    def reset(self):
+        """清除跟踪状态，下一帧进行全图搜索"""
+        self._bbox = None
+        self._frames_since_full = 0
+
+
+class HandDetection:
+    """一次检测的结果：指尖位置（摄像头坐标）、帧尺寸(宽, 高)、帧的采集时间和序号"""
+
+    __slots__ = ('position', 'frame_size', 'timestamp', 'seq')
+
+    def __init__(self, position, frame_size, timestamp, seq):
+        self.position = position
+        self.frame_size = frame_size
+        self.timestamp = timestamp
+        self.seq = seq
+
+
+class HandDetectionWorker:
+    """
+    后台手部检测线程。
+    从ThreadedCapture取最新的摄像头帧运行findHands，并发布最近一次的指尖位置，
+    游戏循环调用latest()时直接拿到已有的结果，不会等待推理完成。
+    """
+
+    def __init__(self, detector, capture, mirror=True, latency_history=120):
+        self.detector = detector
+        self.capture = capture
+        # 画面是镜像显示的，检测也在镜像后的帧上进行，保证手指方向与画面一致
+        self.mirror = mirror
+        self._latest = None
+        self._lock = threading.Lock()
+        self._frame = None
+
+        # 统计信息
+        self.detections = 0
+        self.errors = 0
+        self.detection_fps = 0.0
+        self._latencies = deque(maxlen=latency_history)
+        self._fps_window_start = time.perf_counter()
+        self._fps_window_frames = 0
+
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="HandDetectionWorker", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _prepare_frame(self, frame):
+        """镜像到工作线程自己的缓冲区，frame已经是从采集缓冲区拷贝出来的帧"""
+        if not self.mirror:
+            return frame
+        if self._frame is None or self._frame.shape != frame.shape:
+            self._frame = np.empty_like(frame)
+        cv2.flip(frame, 1, dst=self._frame)
+        return self._frame
+
+    def _run(self):
+        last_seq = -1
+        while self._running:
+            # 拷贝一份，避免采集线程复用槽位时改写正在检测的帧
+            success, frame, timestamp, seq = self.capture.read_latest(copy=True, newer_than=last_seq, timeout=0.1)
+            if not success or seq == last_seq:
+                continue
+            last_seq = seq
+            frame = self._prepare_frame(frame)
+
+            start = time.perf_counter()
+            try:
+                position = detect_index_fingertip(self.detector, frame)
+            except Exception as e:
+                self.errors += 1
+                if self.errors == 1:
+                    print(f"手部检测错误: {e}")
+                continue
+            finished = time.perf_counter()
+
+            with self._lock:
+                self._latest = HandDetection(position, (frame.shape[1], frame.shape[0]), timestamp, seq)
+            self._latencies.append(finished - start)
+            self.detections += 1
+            self._fps_window_frames += 1
+            elapsed = finished - self._fps_window_start
+            if elapsed >= 1.0:
+                self.detection_fps = self._fps_window_frames / elapsed
+                self._fps_window_start = finished
+                self._fps_window_frames = 0
+
+    def latest(self):
+        """返回最近一次的检测结果HandDetection，还没有结果时返回None"""
+        with self._lock:
+            return self._latest
+
+    def staleness(self):
+        """最近一次结果距今的时间（秒），从帧的采集时间算起"""
+        latest = self.latest()
+        if latest is None:
+            return None
+        return time.perf_counter() - latest.timestamp
+
+    def stats(self):
+        """返回检测统计，推理耗时单位为毫秒"""
+        latencies = np.asarray(self._latencies, dtype=np.float64) * 1000
+        if latencies.size:
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+        else:
+            p50 = p90 = p99 = None
+        return {
+            'detections': self.detections,
+            'errors': self.errors,
+            'detection_fps': self.detection_fps,
+            'latency_p50_ms': p50,
+            'latency_p90_ms': p90,
+            'latency_p99_ms': p99,
+            'staleness_s': self.staleness(),
+        }
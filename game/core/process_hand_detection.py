@@ -0,0 +1,408 @@
+import os
+import threading
+import time
+from collections import deque
+from multiprocessing import get_context, shared_memory
+
+import cv2
+import numpy as np
+
+from game.core.hand_detection import (
+    HandDetection,
+    HandDetectionWorker,
+    detect_index_fingertip,
+    parse_inference_size,
+    unwrap_detector,
+    wrap_detector,
+)
+
+# 控制区(int64)各字段的下标
+_CTRL_LATEST = 0      # 最新一帧所在的缓冲区，-1表示还没有帧
+_CTRL_HELD = 1        # 检测进程正在使用的缓冲区，-1表示空闲
+_CTRL_SEQ = 2         # 两个缓冲区中帧的序号，占2、3两个位置
+_CTRL_STATE = 4       # 检测进程状态：0启动中，1就绪，-1失败
+_CTRL_STOP = 5        # 非0时检测进程退出
+_CTRL_SIZE = 6
+
+# 结果槽(float64)各字段的下标，字段0是顺序锁计数，奇数表示正在写入
+_SLOT_LOCK = 0
+_SLOT_SEQ = 1
+_SLOT_TIMESTAMP = 2
+_SLOT_HAS_HAND = 3
+_SLOT_X = 4
+_SLOT_Y = 5
+_SLOT_INFERENCE_MS = 6
+_SLOT_ERRORS = 7      # 检测进程中检测出错的次数
+# 结果槽之后是两个缓冲区中帧的采集时间，由主进程在锁内写入，不受顺序锁保护
+_FRAME_TIMESTAMPS = 8
+_SLOT_SIZE = 10
+
+# 环境变量SNAKE_DETECTION_MODE可选thread（默认）或process
+DETECTION_MODE_ENV = 'SNAKE_DETECTION_MODE'
+# 环境变量SNAKE_INFERENCE_SIZE设置推理分辨率，例如640x360或320x180，默认full（摄像头原始分辨率）
+INFERENCE_SIZE_ENV = 'SNAKE_INFERENCE_SIZE'
+
+
+def detector_spec(detector):
+    """
+    根据进程内的检测器实例生成可以传给子进程的描述(类型, 参数)，不支持的检测器返回None。
+    """
+    detector = unwrap_detector(detector)
+    class_name = type(detector).__name__
+    if class_name == 'TFLiteHandDetector':
+        return ('tflite', {
+            'max_hands': detector.max_hands,
+            'min_detection_confidence': detector.min_detection_confidence,
+            'min_tracking_confidence': detector.min_tracking_confidence,
+        })
+    if class_name == 'HandDetector' and type(detector).__module__.startswith('cvzone'):
+        return ('cvzone', {'detectionCon': detector.detectionCon, 'maxHands': detector.maxHands})
+    return None
+
+
+def _create_detector(spec):
+    """在检测进程中按描述创建检测器"""
+    kind, kwargs = spec
+    if kind == 'tflite':
+        from game.core.tflite_hand_detector import TFLiteHandDetector
+        detector = TFLiteHandDetector(**kwargs)
+        if not detector.is_loaded:
+            raise RuntimeError("MediaPipe检测器未就绪")
+        return detector
+    if kind == 'cvzone':
+        from cvzone.HandTrackingModule import HandDetector
+        return HandDetector(**kwargs)
+    if callable(kind):
+        return kind(**kwargs)
+    raise ValueError(f"未知的检测器类型: {kind}")
+
+
+def _write_slot(slot, seq, timestamp, position, inference_ms):
+    """顺序锁写入：计数先变为奇数，写完数据后再变为偶数"""
+    slot[_SLOT_LOCK] += 1
+    slot[_SLOT_SEQ] = seq
+    slot[_SLOT_TIMESTAMP] = timestamp
+    slot[_SLOT_HAS_HAND] = 1.0 if position is not None else 0.0
+    if position is not None:
+        slot[_SLOT_X], slot[_SLOT_Y] = position
+    slot[_SLOT_INFERENCE_MS] = inference_ms
+    slot[_SLOT_LOCK] += 1
+
+
+def _write_errors(slot, errors):
+    """顺序锁写入出错次数，保留上一次的检测结果"""
+    slot[_SLOT_LOCK] += 1
+    slot[_SLOT_ERRORS] = errors
+    slot[_SLOT_LOCK] += 1
+
+
+def _read_slot(slot):
+    """顺序锁读取：读取前后计数相同且为偶数时数据才完整，否则重试"""
+    while True:
+        lock_before = slot[_SLOT_LOCK]
+        if lock_before % 2 == 0:
+            values = slot[:_FRAME_TIMESTAMPS].copy()
+            if slot[_SLOT_LOCK] == lock_before:
+                return values
+        time.sleep(0)
+
+
+def _detection_process_main(spec, roi_tracking, inference_size, frame_shm_name, ctrl_shm_name, slot_shm_name, frame_shape, lock, frame_event):
+    """检测进程入口：从共享内存双缓冲中取帧检测，结果写入顺序锁结果槽"""
+    frame_shm = shared_memory.SharedMemory(name=frame_shm_name)
+    ctrl_shm = shared_memory.SharedMemory(name=ctrl_shm_name)
+    slot_shm = shared_memory.SharedMemory(name=slot_shm_name)
+    try:
+        frames = np.ndarray((2,) + tuple(frame_shape), dtype=np.uint8, buffer=frame_shm.buf)
+        ctrl = np.ndarray((_CTRL_SIZE,), dtype=np.int64, buffer=ctrl_shm.buf)
+        slot = np.ndarray((_SLOT_SIZE,), dtype=np.float64, buffer=slot_shm.buf)
+        try:
+            detector = wrap_detector(_create_detector(spec), roi_tracking, inference_size)
+        except Exception as e:
+            print(f"检测进程初始化检测器失败: {e}")
+            ctrl[_CTRL_STATE] = -1
+            return
+        ctrl[_CTRL_STATE] = 1
+
+        last_seq = -1
+        errors = 0
+        while not ctrl[_CTRL_STOP]:
+            frame_event.wait(0.1)
+            frame_event.clear()
+            with lock:
+                index = int(ctrl[_CTRL_LATEST])
+                if index < 0 or ctrl[_CTRL_SEQ + index] <= last_seq:
+                    continue
+                ctrl[_CTRL_HELD] = index
+                seq = int(ctrl[_CTRL_SEQ + index])
+                timestamp = slot[_FRAME_TIMESTAMPS + index]
+
+            start = time.perf_counter()
+            error = None
+            try:
+                position = detect_index_fingertip(detector, frames[index])
+            except Exception as e:
+                error = e
+            inference_ms = (time.perf_counter() - start) * 1000
+
+            with lock:
+                ctrl[_CTRL_HELD] = -1
+            last_seq = seq
+            if error is not None:
+                # 与线程检测相同：只打印第一次错误，不用None覆盖上一次的结果
+                errors += 1
+                if errors == 1:
+                    print(f"检测进程手部检测错误: {error}")
+                _write_errors(slot, errors)
+                continue
+            _write_slot(slot, seq, timestamp, position, inference_ms)
+    finally:
+        frame_shm.close()
+        ctrl_shm.close()
+        slot_shm.close()
+
+
+class ProcessHandDetectionWorker:
+    """
+    在独立进程中运行手部检测，避免推理与pygame渲染争抢GIL。
+    摄像头帧通过multiprocessing.shared_memory双缓冲传给检测进程，不做pickle；
+    检测结果写入共享内存中的顺序锁结果槽，读取时不需要加锁。
+    接口与HandDetectionWorker一致。
+    """
+
+    def __init__(self, spec, capture, mirror=True, roi_tracking=True, inference_size=None,
+                 latency_history=120, startup_timeout=15.0):
+        self.spec = spec
+        self.roi_tracking = roi_tracking
+        self.inference_size = inference_size
+        self.capture = capture
+        self.mirror = mirror
+        self.startup_timeout = startup_timeout
+        self._context = get_context('spawn')
+        self._lock = self._context.Lock()
+        self._frame_event = self._context.Event()
+        self._process = None
+        self._feeder = None
+        self._running = False
+        self._shms = []
+        self._frames = None
+        self._ctrl = None
+        self._slot = None
+        self._frame_size = None
+
+        # 统计信息
+        self.frames_sent = 0
+        self.frames_skipped = 0
+        self.detections = 0
+        self.errors = 0
+        self.detection_fps = 0.0
+        self._latencies = deque(maxlen=latency_history)
+        self._last_result_seq = -1
+        self._fps_window_start = time.perf_counter()
+        self._fps_window_frames = 0
+
+    def start(self):
+        """启动检测进程，成功返回True；摄像头没有帧或检测器无法在子进程中创建时返回False"""
+        success, frame, _, _ = self.capture.read_latest(copy=True, newer_than=-1, timeout=2.0)
+        if not success:
+            print("进程检测模式启动失败: 摄像头没有帧")
+            return False
+        frame_shape = frame.shape
+        self._frame_size = (frame_shape[1], frame_shape[0])
+
+        try:
+            frame_shm = shared_memory.SharedMemory(create=True, size=2 * frame.nbytes)
+            ctrl_shm = shared_memory.SharedMemory(create=True, size=_CTRL_SIZE * 8)
+            slot_shm = shared_memory.SharedMemory(create=True, size=_SLOT_SIZE * 8)
+            self._shms = [frame_shm, ctrl_shm, slot_shm]
+            self._frames = np.ndarray((2,) + frame_shape, dtype=np.uint8, buffer=frame_shm.buf)
+            self._ctrl = np.ndarray((_CTRL_SIZE,), dtype=np.int64, buffer=ctrl_shm.buf)
+            self._slot = np.ndarray((_SLOT_SIZE,), dtype=np.float64, buffer=slot_shm.buf)
+            self._ctrl[:] = 0
+            self._ctrl[_CTRL_LATEST] = -1
+            self._ctrl[_CTRL_HELD] = -1
+            self._ctrl[_CTRL_SEQ:_CTRL_SEQ + 2] = -1
+            self._slot[:] = 0
+            self._slot[_SLOT_SEQ] = -1
+
+            self._process = self._context.Process(
+                target=_detection_process_main,
+                args=(self.spec, self.roi_tracking, self.inference_size, frame_shm.name, ctrl_shm.name, slot_shm.name, frame_shape, self._lock, self._frame_event),
+                name="HandDetectionProcess",
+                daemon=True,
+            )
+            self._process.start()
+        except Exception as e:
+            print(f"进程检测模式启动失败: {e}")
+            self.stop()
+            return False
+
+        deadline = time.perf_counter() + self.startup_timeout
+        while self._ctrl[_CTRL_STATE] == 0 and self._process.is_alive() and time.perf_counter() < deadline:
+            time.sleep(0.05)
+        if self._ctrl[_CTRL_STATE] != 1:
+            print("进程检测模式启动失败: 检测进程未就绪")
+            self.stop()
+            return False
+
+        self._running = True
+        self._feeder = threading.Thread(target=self._feed, name="HandDetectionFeeder", daemon=True)
+        self._feeder.start()
+        return True
+
+    def _feed(self):
+        """把摄像头的新帧写入检测进程当前没有使用的缓冲区"""
+        last_seq = -1
+        while self._running:
+            success, frame, timestamp, seq = self.capture.read_latest(copy=True, newer_than=last_seq, timeout=0.1)
+            self._poll_result()
+            if not success or seq == last_seq:
+                continue
+            last_seq = seq
+            if frame.shape != self._frames.shape[1:]:
+                self.frames_skipped += 1
+                continue
+
+            with self._lock:
+                latest = int(self._ctrl[_CTRL_LATEST])
+                held = int(self._ctrl[_CTRL_HELD])
+                # 可写的缓冲区既不能正被检测进程使用，也不能是还没被取走的最新帧
+                if latest < 0:
+                    index = 0
+                elif held == latest or held < 0:
+                    index = 1 - latest
+                else:
+                    index = -1
+                if index >= 0:
+                    # 写入期间把该缓冲区的序号置为-1，检测进程不会取到写了一半的帧
+                    self._ctrl[_CTRL_SEQ + index] = -1
+            if index < 0:
+                self.frames_skipped += 1
+                continue
+
+            if self.mirror:
+                cv2.flip(frame, 1, dst=self._frames[index])
+            else:
+                np.copyto(self._frames[index], frame)
+
+            with self._lock:
+                self._slot[_FRAME_TIMESTAMPS + index] = timestamp
+                self._ctrl[_CTRL_SEQ + index] = seq
+                self._ctrl[_CTRL_LATEST] = index
+            self._frame_event.set()
+            self.frames_sent += 1
+
+    def _poll_result(self):
+        """读取结果槽，更新检测帧率和推理耗时统计"""
+        values = _read_slot(self._slot)
+        self.errors = int(values[_SLOT_ERRORS])
+        seq = int(values[_SLOT_SEQ])
+        if seq <= self._last_result_seq:
+            return values
+        self._last_result_seq = seq
+        self._latencies.append(values[_SLOT_INFERENCE_MS] / 1000)
+        self.detections += 1
+        self._fps_window_frames += 1
+        now = time.perf_counter()
+        elapsed = now - self._fps_window_start
+        if elapsed >= 1.0:
+            self.detection_fps = self._fps_window_frames / elapsed
+            self._fps_window_start = now
+            self._fps_window_frames = 0
+        return values
+
+    def latest(self):
+        """返回最近一次的检测结果HandDetection，还没有结果时返回None"""
+        if not self._shms:
+            return None
+        values = _read_slot(self._slot)
+        if values[_SLOT_SEQ] < 0:
+            return None
+        position = None
+        if values[_SLOT_HAS_HAND]:
+            position = (int(values[_SLOT_X]), int(values[_SLOT_Y]))
+        return HandDetection(position, self._frame_size, values[_SLOT_TIMESTAMP], int(values[_SLOT_SEQ]))
+
+    def staleness(self):
+        """最近一次结果距今的时间（秒），从帧的采集时间算起"""
+        latest = self.latest()
+        if latest is None:
+            return None
+        return time.perf_counter() - latest.timestamp
+
+    def stats(self):
+        """返回检测统计，推理耗时单位为毫秒"""
+        latencies = np.asarray(self._latencies, dtype=np.float64) * 1000
+        if latencies.size:
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+        else:
+            p50 = p90 = p99 = None
+        return {
+            'detections': self.detections,
+            'errors': self.errors,
+            'detection_fps': self.detection_fps,
+            'latency_p50_ms': p50,
+            'latency_p90_ms': p90,
+            'latency_p99_ms': p99,
+            'staleness_s': self.staleness(),
+            'frames_sent': self.frames_sent,
+            'frames_skipped': self.frames_skipped,
+        }
+
+    def stop(self):
+        """停止检测进程并释放共享内存"""
+        self._running = False
+        if self._feeder is not None:
+            self._feeder.join(timeout=1.0)
+            self._feeder = None
+        if self._process is not None:
+            if self._shms:
+                self._ctrl[_CTRL_STOP] = 1
+            self._frame_event.set()
+            self._process.join(timeout=2.0)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join(timeout=1.0)
+            self._process = None
+        self._frames = self._ctrl = self._slot = None
+        for shm in self._shms:
+            try:
+                shm.close()
+                shm.unlink()
+            except Exception as e:
+                print(f"释放共享内存失败: {e}")
+        self._shms = []
+
+
+def create_hand_detection_worker(detector, capture, mode=None, roi_tracking=True, inference_size=None):
+    """
+    创建并启动手部检测工作者。
+    mode为'process'时在独立进程中检测，未指定时读取环境变量SNAKE_DETECTION_MODE，默认在线程中检测。
+    进程模式无法启动时自动回退到进程内的线程检测。
+    roi_tracking为True时用RoiHandTracker包装检测器，只在上一帧手部附近检测。
+    inference_size为推理分辨率，如'640x360'，未指定时读取环境变量SNAKE_INFERENCE_SIZE。
+    """
+    if mode is None:
+        mode = os.environ.get(DETECTION_MODE_ENV, 'thread')
+    if inference_size is None:
+        inference_size = os.environ.get(INFERENCE_SIZE_ENV)
+    try:
+        inference_size = parse_inference_size(inference_size)
+    except ValueError as e:
+        print(f"推理分辨率设置错误: {e}，使用摄像头原始分辨率")
+        inference_size = None
+
+    if mode == 'process':
+        spec = detector_spec(detector)
+        if spec is None:
+            print(f"检测器{type(detector).__name__}不支持进程模式，使用线程检测")
+        else:
+            worker = ProcessHandDetectionWorker(spec, capture, roi_tracking=roi_tracking, inference_size=inference_size)
+            if worker.start():
+                print("手部检测运行在独立进程中")
+                return worker
+            print("回退到线程检测")
+
+    worker = HandDetectionWorker(wrap_detector(detector, roi_tracking, inference_size), capture)
+    worker.start()
+    return worker
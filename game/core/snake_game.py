@@ -1,32 +1,34 @@
-import math
 import random
 import os
-import cvzone
 import cv2
 import numpy as np
 
+from game.utils.asset_manager import asset_manager
+from game.utils.snake_trail import SnakeTrail
+from game.utils.snake_renderer import SnakeBodyRenderer
+from game.utils.sprite import Sprite, blit_sprites
 from game.utils.improved_chinese_text import put_chinese_text_with_background, put_chinese_text_pil
 from game.utils.language_manager import get_translation
 
 class SnakeGame:
     def __init__(self, food_path, width=1280, height=720, snake_color=(200,0,200), gradient_colors_data=None):
         self.width, self.height = width, height
-        self.points = []            
-        self.lengths = []           
-        self.currentLength = 0      
+        self.trail = SnakeTrail()   # 蛇身各点和总长度
         self.base_allowed_length = 150    
         self.allowedLength = self.base_allowed_length    
         self.previousHead = 0, 0    
         self.snake_color = snake_color  
         self.gradient_colors_data = gradient_colors_data if gradient_colors_data is not None else {}  
+        self.body_renderer = SnakeBodyRenderer(thickness=20, head_radius=20)
 
 
-        self.imgFood = cv2.imread(food_path, cv2.IMREAD_UNCHANGED)
+        self.imgFood = asset_manager.load(food_path)
         if self.imgFood is None:
 
             self.imgFood = np.zeros((50, 50, 4), dtype=np.uint8)
             cv2.circle(self.imgFood, (25, 25), 25, (0, 255, 255, 255), cv2.FILLED)
         self.hFood, self.wFood, _ = self.imgFood.shape
+        self.spriteFood = Sprite(self.imgFood)
         self.foodPoint = 0, 0
         self.randomFoodLocation()
 
@@ -41,18 +43,12 @@ class SnakeGame:
         
         for file in obstacle_files:
             img_path = os.path.join(os.path.dirname(__file__), '..', 'assets', file)
-            img = cv2.imread(img_path, cv2.IMREAD_UNCHANGED)
-            if img is not None:
-
-                img_resized = cv2.resize(img, fixed_obstacle_size)
-                
-
-                if len(img_resized.shape) == 3 and img_resized.shape[2] == 3:
-
-                    img_resized = cv2.cvtColor(img_resized, cv2.COLOR_RGB2RGBA)
-                
+            # 同一张图片只解码和缩放一次，多个障碍物共享同一个只读数组
+            img_resized = asset_manager.get(img_path, size=fixed_obstacle_size, alpha=True)
+            if img_resized is not None:
                 self.obstacles.append({
                     'image': img_resized,
+                    'sprite': asset_manager.get_sprite(img_path, size=fixed_obstacle_size),
                     'x': random.randint(100, self.width - fixed_obstacle_size[0] - 100),
                     'y': random.randint(100, self.height - fixed_obstacle_size[1] - 100),
                     'width': fixed_obstacle_size[0],
@@ -98,15 +94,13 @@ class SnakeGame:
         border_text = "边缘地带"
         try:
             from game.utils.improved_chinese_text import put_chinese_text_pil
-            imgMain = put_chinese_text_pil(imgMain, border_text, (screen_margin + 10, screen_margin + 10), 20, border_color)
+            imgMain, _ = put_chinese_text_pil(imgMain, border_text, (screen_margin + 10, screen_margin + 10), 20, border_color)
         except Exception as e:
             # 如果中文文字渲染失败，使用英文或不显示
             pass
 
     def reset(self):
-        self.points = []
-        self.lengths = []
-        self.currentLength = 0
+        self.trail.clear()
         self.allowedLength = self.base_allowed_length
         self.previousHead = 0, 0
         self.score = 0
@@ -189,7 +183,7 @@ class SnakeGame:
             text_width, text_height = get_text_size(text, font_size)
             restart_text_x = restart_button_x + (button_width - text_width) // 2  # 精确水平居中
             restart_text_y = button_y + (button_height + text_height) // 2 - 30 # 精确垂直居中
-            imgMain = put_chinese_text_pil(imgMain, text, 
+            imgMain, _ = put_chinese_text_pil(imgMain, text, 
                                          (restart_text_x, restart_text_y), 
                                          font_size, (255, 255, 255))
             
@@ -202,7 +196,7 @@ class SnakeGame:
             text_width, text_height = get_text_size(text, font_size)
             menu_text_x = menu_button_x + (button_width - text_width) // 2  # 精确水平居中
             menu_text_y = button_y + (button_height + text_height) // 2 - 30  # 精确垂直居中
-            imgMain = put_chinese_text_pil(imgMain, text, 
+            imgMain, _ = put_chinese_text_pil(imgMain, text, 
                                          (menu_text_x, menu_text_y), 
                                          font_size, (255, 255, 255))
             
@@ -215,7 +209,7 @@ class SnakeGame:
             text_width, text_height = get_text_size(text, font_size)
             exit_text_x = exit_button_x + (button_width - text_width) // 2  # 精确水平居中
             exit_text_y = button_y + (button_height + text_height) // 2 - 30  # 精确垂直居中
-            imgMain = put_chinese_text_pil(imgMain, text, 
+            imgMain, _ = put_chinese_text_pil(imgMain, text, 
                                          (exit_text_x, exit_text_y), 
                                          font_size, (255, 255, 255))
         else:
@@ -261,25 +255,13 @@ class SnakeGame:
                 self.obstacle_refresh_timer = 0
             
             if currentHead:
-                px, py = self.previousHead
                 cx, cy = currentHead
 
-                self.points.append([cx, cy])  
-                
-                # 只有当points列表有两个或以上点时才计算距离，避免初始距离过大
-                if len(self.points) > 1:
-                    distance = math.hypot(cx - px, cy - py)  # 两点之间的距离
-                    self.lengths.append(distance)            # 添加蛇的距离列表内容
-                    self.currentLength += distance
-                    
-                    # Length Reduction 收缩长度
-                    if self.currentLength > self.allowedLength:
-                        for i, length in enumerate(self.lengths):
-                            self.currentLength -= length
-                            self.lengths.pop(i)
-                            self.points.pop(i)
-                            if self.currentLength < self.allowedLength:
-                                break
+                # 第一个点不计算距离，避免初始距离过大
+                self.trail.append(cx, cy)
+
+                # Length Reduction 收缩长度，从蛇尾裁剪
+                self.trail.trim(self.allowedLength)
                 
                 self.previousHead = cx, cy
 
@@ -293,28 +275,21 @@ class SnakeGame:
                     print(self.score)
 
                 # Draw Snake 画蛇
-                if self.points:
+                if self.trail:
                     # 确定蛇的颜色
                     snake_color = self.snake_color
                     if isinstance(snake_color, str):
                         # 如果是渐变颜色名称，使用默认颜色
                         snake_color = (200, 0, 200)
                     
-                    for i, point in enumerate(self.points):
-                         if i != 0:
-                            self.points[i-1] = tuple(self.points[i-1])
-                            self.points[i] = tuple(self.points[i])
-                            cv2.line(imgMain, self.points[i - 1], self.points[i], snake_color, 20)
-                    # 对列表最后一个点也就是蛇头使用相同颜色
-                    self.points[-1] = tuple(self.points[-1])
-                    cv2.circle(imgMain, self.points[-1], 20, snake_color, cv2.FILLED)
+                    # 蛇身一次polylines画完，蛇头使用相同颜色
+                    self.body_renderer.draw(imgMain, self.trail.points, snake_color)
 
                 # Draw Food 画食物
-                imgMain = cvzone.overlayPNG(imgMain, self.imgFood, (rx - self.wFood // 2, ry - self.hFood // 2))
+                self.spriteFood.blit(imgMain, (rx - self.wFood // 2, ry - self.hFood // 2))
 
                 # Draw Obstacles 画障碍物
-                for obstacle in self.obstacles:
-                    imgMain = cvzone.overlayPNG(imgMain, obstacle['image'], (obstacle['x'], obstacle['y']))
+                blit_sprites(imgMain, [(obstacle['sprite'], (obstacle['x'], obstacle['y'])) for obstacle in self.obstacles])
 
                 # 显示中文得分
                 imgMain = put_chinese_text_with_background(imgMain, get_translation('game_score').format(self.score), (50, 80), 40, (50, 130, 246), (0, 0, 0))
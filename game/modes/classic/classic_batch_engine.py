@@ -0,0 +1,295 @@
+import random
+
+import numpy as np
+
+from game.core.game_ui import gradient_colors_data
+from game.modes.classic.classic_snake_game import (
+    COLOR_CHANGE_COLORS, EFFECT_DURATIONS, FOOD_COLORS, MAX_BOMBS, OTHER_FOOD_COLORS,
+    OTHER_FOOD_PROPERTIES, OTHER_FOOD_WEIGHTS,
+)
+from game.utils.food_table import BatchFoodTable
+from game.utils.occupancy_grid import EMPTY, FOOD, OBSTACLE, OTHER_FOOD, SNAKE, BatchOccupancyGrid
+
+# 游戏结束原因的编码，0表示游戏仍在进行，名称与ClassicSnakeGame.game_over_cause相同
+CAUSES = (None, 'edge', 'self', 'obstacle', 'bomb')
+EDGE, SELF, OBSTACLE_HIT, BOMB = 1, 2, 3, 4
+
+# effects数组的列
+EFFECT_COLUMNS = {'speed_up': 0, 'speed_down': 1, 'freeze': 2}
+
+
+class ClassicBatchEngine:
+    """
+    批量运行经典模式：count个互相独立的棋盘同步推进，规则与ClassicSnakeGame.step相同。
+    占用网格、蛇身、蛇头方向、效果时间、计时器都保存在第一维为棋盘编号的NumPy数组里，
+    每一步的计时、速度、移动、碰撞和蛇尾移除对所有棋盘只做一次数组运算；
+    吃到食物、刷新食物、重新开始这类不常发生的事件按棋盘逐个处理。
+    每个棋盘有自己的随机数生成器，调用顺序与ClassicSnakeGame完全相同，
+    所以使用同样种子的random.Random时，两者每一步的状态都一致。
+    """
+
+    def __init__(self, count, width=1280, height=720, rngs=None, seed=0, tick_rate=60, auto_reset=False):
+        self.count = count
+        self.grid_size = 30
+        self.grid_width = max(1, (width - 20) // self.grid_size)
+        self.grid_height = max(1, (height - 20) // self.grid_size)
+        self.rngs = rngs if rngs is not None else [random.Random(seed + board) for board in range(count)]
+        self.tick_interval = 1.0 / tick_rate
+        # auto_reset为True时游戏结束的棋盘在这一步结束后立即重新开始，结果记录在completed中
+        self.auto_reset = auto_reset
+        self.completed = []
+
+        # 可以调整的规则参数，默认值与ClassicSnakeGame相同
+        self.other_food_weights = list(OTHER_FOOD_WEIGHTS)
+        self.base_move_interval = 0.2
+        self.move_interval_step = 0.005
+        self.min_move_interval = 0.04
+        self.food_refresh_interval = 10.0
+
+        self.grid = BatchOccupancyGrid(count, self.grid_width, self.grid_height)
+        self.foods = BatchFoodTable(count)
+        self.fake_foods = BatchFoodTable(count)
+        self.obstacles = [[] for _ in range(count)]
+
+        # 蛇身保存在环形缓冲区中：第k段是bodies[b, (head_slots[b] + k) % 容量]，第0段是蛇头
+        self.bodies = np.zeros((count, self.grid_width * self.grid_height + 1, 2), dtype=np.int64)
+        self.head_slots = np.zeros(count, dtype=np.int64)
+        self.lengths = np.zeros(count, dtype=np.int64)
+        self.max_lengths = np.zeros(count, dtype=np.int64)
+        self.directions = np.zeros((count, 2), dtype=np.int64)
+
+        self.effects = np.zeros((count, len(EFFECT_COLUMNS)), dtype=np.float64)
+        self.color_change = np.zeros(count, dtype=bool)
+        self.acceleration_time = np.zeros(count, dtype=np.float64)
+        self.move_timers = np.zeros(count, dtype=np.float64)
+        self.food_refresh_timers = np.zeros(count, dtype=np.float64)
+        self.sim_times = np.zeros(count, dtype=np.float64)
+        # 分数翻倍可能超出int64，使用Python整数
+        self.scores = np.zeros(count, dtype=object)
+        self.causes = np.zeros(count, dtype=np.int8)
+        self.ticks = 0
+
+        for board in range(count):
+            self.reset(board)
+
+    @property
+    def game_over(self):
+        return self.causes != 0
+
+    def cause(self, board):
+        """第board个棋盘的游戏结束原因，游戏仍在进行时返回None"""
+        return CAUSES[self.causes[board]]
+
+    def snake(self, board):
+        """第board个棋盘的蛇身[(x, y), ...]，第一个是蛇头"""
+        indices = (self.head_slots[board] + np.arange(self.lengths[board])) % self.bodies.shape[1]
+        return [tuple(point) for point in self.bodies[board, indices].tolist()]
+
+    def reset(self, board):
+        """重新开始第board个棋盘，与ClassicSnakeGame.reset相同"""
+        head = (self.grid_width // 2, self.grid_height // 2)
+        self.head_slots[board] = 0
+        self.bodies[board, 0] = head
+        self.lengths[board] = 1
+        self.max_lengths[board] = 1
+        self.directions[board] = (1, 0)
+        self.grid.clear(board)
+        self.grid.set(board, head, SNAKE)
+        self.foods.clear(board)
+        self.fake_foods.clear(board)
+
+        self.scores[board] = 0
+        self.causes[board] = 0
+        self.effects[board] = 0
+        self.color_change[board] = False
+        self.acceleration_time[board] = 0
+        self.move_timers[board] = 0
+        self.sim_times[board] = 0
+
+        self._generate_obstacles(board)
+        for _ in range(self.rngs[board].randint(10, 15)):
+            pos, color = self._place_food(board)
+            if pos is None:
+                break
+            self._add_food(board, pos, color)
+        self._generate_other_foods(board)
+        self.food_refresh_timers[board] = 0
+
+    def _generate_obstacles(self, board):
+        self.obstacles[board] = []
+        rng = self.rngs[board]
+        head = tuple(self.bodies[board, self.head_slots[board]].tolist())
+        for _ in range(rng.randint(5, 8)):
+            pos = self.grid.sample_free(board, rng=rng, avoid=head, min_distance=2)
+            if pos is None:
+                break
+            self.grid.set(board, pos, OBSTACLE)
+            self.obstacles[board].append(pos)
+
+    def _place_food(self, board):
+        rng = self.rngs[board]
+        pos = self.grid.sample_free(board, rng=rng)
+        if pos is not None:
+            self.grid.set(board, pos, FOOD)
+        return pos, rng.choice(FOOD_COLORS)
+
+    def _add_food(self, board, pos, color):
+        self.foods.add(board, pos, color, double_score=self.rngs[board].random() < 0.2)
+
+    def _add_other_food(self, board):
+        rng = self.rngs[board]
+        pos = self.grid.sample_free(board, rng=rng)
+        if pos is None:
+            return None
+        self.grid.set(board, pos, OTHER_FOOD)
+        prop = rng.choices(OTHER_FOOD_PROPERTIES, weights=self.other_food_weights)[0]
+        if prop == 'bomb' and self.fake_foods.count_property(board, 'bomb') >= MAX_BOMBS:
+            prop = rng.choice(['color_change', 'speed_up', 'speed_down', 'freeze', 'none'])
+        return self.fake_foods.add(board, pos, rng.choice(OTHER_FOOD_COLORS), prop)
+
+    def _generate_other_foods(self, board):
+        for row in range(self.fake_foods.counts[board]):
+            self.grid.release(board, self.fake_foods.position(board, row))
+        self.fake_foods.clear(board)
+        for _ in range(self.rngs[board].randint(20, 28)):
+            if self._add_other_food(board) is None:
+                break
+
+    def _refresh_foods(self, board):
+        for row in range(self.foods.counts[board]):
+            self.grid.release(board, self.foods.position(board, row))
+        self.foods.clear(board)
+        for _ in range(self.rngs[board].randint(3, 5)):
+            pos, color = self._place_food(board)
+            if pos is None:
+                break
+            self._add_food(board, pos, color)
+        self._generate_other_foods(board)
+
+    def _eat_food(self, board, pos):
+        row = self.foods.find(board, pos)
+        if self.foods.double_score[board, row]:
+            self.scores[board] = 2 if self.scores[board] == 0 else self.scores[board] * 2
+        else:
+            self.scores[board] += 1
+        self.foods.remove(board, row)
+        new_pos, new_color = self._place_food(board)
+        if new_pos is not None:
+            self._add_food(board, new_pos, new_color)
+
+    def _eat_other_food(self, board, pos):
+        rng = self.rngs[board]
+        row = self.fake_foods.find(board, pos)
+        prop = self.fake_foods.property(board, row)
+        if prop == 'bomb':
+            self.causes[board] = BOMB
+            return
+        if prop == 'color_change':
+            # 蛇的颜色只影响显示，这里只按相同的顺序消耗随机数
+            self.color_change[board] = True
+            if rng.random() < 0.5:
+                rng.choice(COLOR_CHANGE_COLORS)
+            else:
+                rng.choice(list(gradient_colors_data.keys()))
+        elif prop in EFFECT_COLUMNS:
+            self.effects[board, EFFECT_COLUMNS[prop]] = EFFECT_DURATIONS[prop]
+        self.scores[board] += 1
+        self.fake_foods.remove(board, row)
+        self._add_other_food(board)
+        for _ in range(4 - self.fake_foods.counts[board]):
+            if self._add_other_food(board) is None:
+                break
+
+    def step(self, dt=None):
+        """所有进行中的棋盘推进一个逻辑步，dt默认为tick_interval"""
+        dt = self.tick_interval if dt is None else dt
+        boards = np.flatnonzero(self.causes == 0)
+        if len(boards):
+            self._step_boards(boards, dt)
+        self.ticks += 1
+        if self.auto_reset:
+            for board in np.flatnonzero(self.causes != 0):
+                self.completed.append((self.cause(board), self.scores[board], int(self.max_lengths[board])))
+                self.reset(board)
+
+    def _step_boards(self, boards, dt):
+        self.sim_times[boards] += dt
+
+        # 更新效果的剩余时间
+        effects = self.effects[boards]
+        effects = np.where(effects > 0, effects - dt, effects)
+        effects[effects < 0] = 0
+        self.effects[boards] = effects
+
+        # 根据蛇的长度计算基础移动间隔
+        base = np.maximum(self.min_move_interval,
+                          self.base_move_interval - (self.lengths[boards] - 1) * self.move_interval_step)
+        freeze = effects[:, EFFECT_COLUMNS['freeze']] > 0
+
+        self.fake_foods.age(dt * 0.01, boards)
+
+        # 食物自动刷新
+        self.food_refresh_timers[boards] += dt
+        for board in boards[self.food_refresh_timers[boards] >= self.food_refresh_interval]:
+            self._refresh_foods(board)
+            self.food_refresh_timers[board] = 0.0
+
+        interval = base
+        slow = effects[:, EFFECT_COLUMNS['speed_down']] > 0
+        interval[slow] *= 25
+        acceleration = self.acceleration_time[boards]
+        accelerating = acceleration > 0
+        interval[accelerating] = np.maximum(self.min_move_interval, interval[accelerating] * 0.5)
+        acceleration[accelerating] -= dt
+        acceleration[acceleration < 0] = 0
+        self.acceleration_time[boards] = acceleration
+        fast = effects[:, EFFECT_COLUMNS['speed_up']] > 0
+        interval[fast] = np.maximum(self.min_move_interval, interval[fast] * 0.5)
+
+        # 移动计时，保留超出的时间，积压超过一次移动时丢弃
+        timers = self.move_timers[boards] + dt
+        movers = (timers >= interval) & ~freeze
+        timers[movers] -= interval[movers]
+        timers[movers & (timers >= interval)] = 0.0
+        self.move_timers[boards] = timers
+
+        self._move(boards[movers])
+
+    def _move(self, boards):
+        if len(boards) == 0:
+            return
+        capacity = self.bodies.shape[1]
+        heads = self.bodies[boards, self.head_slots[boards]] + self.directions[boards]
+        xs, ys = heads[:, 0], heads[:, 1]
+
+        # 碰撞检测：超出网格、蛇身、障碍物
+        inside = (xs >= 0) & (xs < self.grid_width) & (ys >= 0) & (ys < self.grid_height)
+        kinds = np.full(len(boards), -1, dtype=np.int64)
+        kinds[inside] = self.grid.cells[boards[inside], ys[inside], xs[inside]]
+        self.causes[boards[~inside]] = EDGE
+        self.causes[boards[kinds == SNAKE]] = SELF
+        self.causes[boards[kinds == OBSTACLE]] = OBSTACLE_HIT
+        alive = inside & (kinds != SNAKE) & (kinds != OBSTACLE)
+        boards, xs, ys, kinds = boards[alive], xs[alive], ys[alive], kinds[alive]
+
+        # 在蛇头位置插入新的身体段
+        slots = (self.head_slots[boards] - 1) % capacity
+        self.head_slots[boards] = slots
+        self.bodies[boards, slots, 0] = xs
+        self.bodies[boards, slots, 1] = ys
+        self.lengths[boards] += 1
+        self.grid.set_many(boards, xs, ys, SNAKE)
+
+        # 吃到食物的棋盘逐个处理，蛇身变长
+        for board, x, y in zip(boards[kinds == FOOD].tolist(), xs[kinds == FOOD].tolist(), ys[kinds == FOOD].tolist()):
+            self._eat_food(board, (x, y))
+        for board, x, y in zip(boards[kinds == OTHER_FOOD].tolist(), xs[kinds == OTHER_FOOD].tolist(), ys[kinds == OTHER_FOOD].tolist()):
+            self._eat_other_food(board, (x, y))
+
+        # 没吃到食物的棋盘移除蛇尾
+        empty = boards[kinds == EMPTY]
+        tails = self.bodies[empty, (self.head_slots[empty] + self.lengths[empty] - 1) % capacity]
+        self.lengths[empty] -= 1
+        self.grid.release_many(empty, tails[:, 0], tails[:, 1])
+
+        self.max_lengths[boards] = np.maximum(self.max_lengths[boards], self.lengths[boards])
@@ -3,6 +3,7 @@ import random
 import math
 import numpy as np
 import time
+from collections import deque
 
 
 try:
@@ -17,33 +18,92 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.
 
 from game.core.game_ui import emit_particle_burst, draw_and_update_effects
 from game.utils.language_manager import get_translation
+from game.utils.glyph_atlas import PygameGlyphAtlas
+from game.utils.occupancy_grid import FOOD, OBSTACLE, OTHER_FOOD, SNAKE, OccupancyGrid
+from game.utils.food_table import FoodTable
+
+# 真食物的颜色对(主颜色, 浅色)
+FOOD_COLORS = [((255,105,180),(255,200,220)), ((135,206,250),(200,230,255)), ((255,255,0),(255,255,200))]
+# 其他食物都使用随机颜色，不根据属性区分
+OTHER_FOOD_COLORS = [
+    ((255, 105, 180), (255, 200, 220)),  # 粉色
+    ((135, 206, 250), (200, 230, 255)),  # 蓝色
+    ((255, 255, 0), (255, 255, 200)),    # 黄色
+    ((255, 69, 0), (255, 150, 100)),     # 橙色
+    ((144, 238, 144), (200, 255, 200)),  # 浅绿色
+    ((255, 182, 193), (255, 200, 210)),  # 浅粉色
+    ((176, 224, 230), (200, 235, 240)),  # 浅蓝色
+    ((221, 160, 221), (230, 180, 230)),  # 浅紫色
+]
+# 其他食物的属性：炸弹、变色、加速、减速、冻结、无效果
+OTHER_FOOD_PROPERTIES = ['bomb', 'color_change', 'speed_up', 'speed_down', 'freeze', 'none']
+# 概率分布：炸弹概率为1%，其他食物占35%
+OTHER_FOOD_WEIGHTS = [0.01, 0.16, 0.16, 0.16, 0.16, 0.35]
+# 场上最多的炸弹数量
+MAX_BOMBS = 6
+# 加速、减速、冻结效果的持续时间（秒）
+EFFECT_DURATIONS = {'speed_up': 5.0, 'speed_down': 12.0, 'freeze': 30.0}
+# 变色食物可能变成的纯色
+COLOR_CHANGE_COLORS = [
+    (255, 182, 193), (144, 238, 144), (173, 216, 230), (255, 255, 0),
+    (255, 165, 0), (128, 0, 128), (255, 255, 255), (128, 128, 128),
+    (255, 0, 0), (0, 255, 255), (255, 0, 255), (50, 205, 50),
+    (0, 128, 128), (0, 0, 128), (255, 215, 0), (192, 192, 192)
+]
+
+
+def _pygame_clock():
+    """默认时钟：pygame启动以来的秒数"""
+    return pygame.time.get_ticks() / 1000.0
+
 
 class ClassicSnakeGame:
-    def __init__(self, snake_color=(255, 182, 193), width=1280, height=720, gradient_colors_data=None): # 增加gradient_colors_data参数
+    def __init__(self, snake_color=(255, 182, 193), width=1280, height=720, gradient_colors_data=None, clock=None, tick_rate=60,
+                 headless=False, rng=None, event_sink=None): # 增加gradient_colors_data参数
+        """
+        headless为True时只保留规则状态，不加载字体，不能调用draw，用于无界面的批量模拟。
+        rng为随机数生成器（需要random.Random的接口），默认使用random模块。
+        event_sink(event, data)接收吃到食物、触发效果、游戏结束等事件；
+        默认在有界面时播放音效和粒子特效，无界面时丢弃事件。
+        """
+        self.headless = headless
+        self.rng = rng if rng is not None else random
+        if event_sink is None and not headless:
+            event_sink = self._present_event
+        self.event_sink = event_sink
         self.WHITE, self.BLACK = (255,255,255), (0,0,0)
         self.snake_color = snake_color
-        self.FOOD_COLORS = [((255,105,180),(255,200,220)), ((135,206,250),(200,230,255)), ((255,255,0),(255,255,200))]
+        self.FOOD_COLORS = FOOD_COLORS
+        self.OTHER_FOOD_COLORS = OTHER_FOOD_COLORS
+        # 其他食物属性的概率分布，可以在模拟时调整
+        self.other_food_weights = list(OTHER_FOOD_WEIGHTS)
         self.width, self.height, self.grid_size = width, height, 30
 
         self.grid_width = max(1, (self.width - 20) // self.grid_size)
         self.grid_height = max(1, (self.height - 20) // self.grid_size)
-        
-        from game.utils.improved_chinese_text import get_font_path
-        font_path = get_font_path()
-        if font_path:
-            try:
-                self.font_large = pygame.font.Font(font_path, 80)
-                self.font_small = pygame.font.Font(font_path, 40)
-            except Exception:
-                self.font_large, self.font_small = pygame.font.Font(None, 80), pygame.font.Font(None, 40)
+        # 网格占用表，与蛇身、食物、障碍物保持同步，用于随机放置时直接抽取空闲格子
+        self.grid = OccupancyGrid(self.grid_width, self.grid_height)
+        # 真食物和其他食物各用一张食物表保存，绘制和碰撞检测都直接读取食物表
+        self.foods = FoodTable()
+        self.fake_foods = FoodTable()
+        
+        if headless:
+            self.font_large = self.font_small = None
+            self.text_large = self.text_small = None
         else:
-            self.font_large, self.font_small = pygame.font.Font(None, 80), pygame.font.Font(None, 40)
+            self._load_fonts()
         
         self.high_score, self.score = 0, 0
         self.max_length_record = 0  # 历史最长记录
         self.current_game_max_length = 0  # 当前游戏的最长记录
         self.gradient_colors_data = gradient_colors_data if gradient_colors_data is not None else {} 
 
+        # 固定步长的逻辑更新：clock返回以秒为单位的时间，可以替换成测试或无界面运行用的时钟
+        self.clock = clock if clock is not None else _pygame_clock
+        self.tick_interval = 1.0 / tick_rate
+        # 一帧最多补运行的逻辑步数，落后更多时丢弃多余的时间
+        self.max_ticks_per_frame = 8
+
         self.last_countdown_update = 0  
         self.current_freeze_display = 0  
         self.boom_sound = None
@@ -51,12 +111,74 @@ class ClassicSnakeGame:
         self.sound_played_this_frame = False  # 标志位，确保每个帧只播放一次音效
         self.reset()
 
+    def _load_fonts(self):
+        from game.utils.improved_chinese_text import get_font_path
+        font_path = get_font_path()
+        if font_path:
+            try:
+                self.font_large = pygame.font.Font(font_path, 80)
+                self.font_small = pygame.font.Font(font_path, 40)
+            except Exception:
+                self.font_large, self.font_small = pygame.font.Font(None, 80), pygame.font.Font(None, 40)
+        else:
+            self.font_large, self.font_small = pygame.font.Font(None, 80), pygame.font.Font(None, 40)
+        # 字符图集：每个字符只渲染一次，HUD和菜单文字直接从图集贴到屏幕上
+        self.text_large = PygameGlyphAtlas(self.font_large)
+        self.text_small = PygameGlyphAtlas(self.font_small)
+
+    def _emit(self, event, **data):
+        """把规则产生的事件交给event_sink"""
+        if self.event_sink is not None:
+            self.event_sink(event, data)
+
+    def _play_sound(self, sound, error_message, once_per_frame=False):
+        if not sound or (once_per_frame and self.sound_played_this_frame):
+            return
+        try:
+            sound.play()
+            if once_per_frame:
+                self.sound_played_this_frame = True  # 标记为已播放
+        except Exception as e:
+            print(f"{error_message}: {e}")
+
+    def _present_event(self, event, data):
+        """默认的事件处理：播放音效和粒子特效"""
+        if event == 'food_eaten':
+            emit_particle_burst(30, data['position'], [data['color']])
+            # 播放吃到食物音效，确保每个帧只播放一次
+            self._play_sound(self.boom_sound, "播放吃到食物音效失败", once_per_frame=True)
+        elif event == 'other_food_eaten':
+            emit_particle_burst(20, data['position'], [data['color']])
+            # 炸弹不播放吃到食物音效
+            if data['property'] != 'bomb':
+                self._play_sound(self.boom_sound, "播放吃到食物音效失败", once_per_frame=True)
+        elif event == 'effect':
+            # 在屏幕正上方添加粒子特效
+            emit_particle_burst(30, (self.width // 2, 50), [data['colors']])
+        elif event == 'game_over':
+            self._play_sound(self.fail_sound, "播放游戏结束音效失败")
+
+    def _end_game(self, cause, reason):
+        """
+        结束游戏。cause是与语言无关的结束原因（'edge'、'self'、'obstacle'、'bomb'），
+        reason是显示用的文字。
+        """
+        self.game_over = True
+        self.game_over_cause = cause
+        self.game_over_reason = reason
+        self._emit('game_over', cause=cause, score=self.score, length=len(self.snake))
+
     def reset(self):
         # 更新历史最长记录
         if self.current_game_max_length > self.max_length_record:
             self.max_length_record = self.current_game_max_length
         
-        self.snake, self.direction = [(self.grid_width//2, self.grid_height//2)], (1,0)
+        # 蛇身用双端队列保存，蛇头在左端，移动时两端增删都是O(1)
+        self.snake, self.direction = deque([(self.grid_width//2, self.grid_height//2)]), (1,0)
+        self.grid.clear()
+        self.grid.set(self.snake[0], SNAKE)
+        self.foods.clear()
+        self.fake_foods.clear()
         if self.score > self.high_score: self.high_score = self.score
         self.score, self.game_over, self.game_started = 0, False, False
         self.current_game_max_length = 1  # 初始长度为1
@@ -64,13 +186,19 @@ class ClassicSnakeGame:
         self.has_started = False
 
         self.game_over_reason = None
+        self.game_over_cause = None
 
         self.base_move_interval = 0.2  
         self.move_interval = self.base_move_interval
         self.min_move_interval = 0.04  
         self.acceleration_time = 0  
         self.acceleration_duration = 0.5  
-        self.last_move_time = 0
+        # 固定步长的时间累加器和模拟时间（秒）
+        self.accumulator = 0.0
+        self.interpolation_alpha = 0.0
+        self.sim_time = 0.0
+        self.move_timer = 0.0
+        self._last_clock_time = None
 
         self.food_blink_timer = 0
         self.food_blink_interval = 1.0  
@@ -78,11 +206,6 @@ class ClassicSnakeGame:
         
         self.sound_played_this_frame = False  # 重置音效播放标志位
 
-        self.fake_foods = []
-        self.fake_foods_colors = []
-        self.fake_foods_age = []
-        self.fake_foods_properties = []  
-        
 
         self.effects = {
             'speed_up': 0,      
@@ -99,16 +222,12 @@ class ClassicSnakeGame:
         self._generate_obstacles()
         
 
-        self.foods = []  
-        self.food_colors = []  
-        self.is_double_score_foods = []  
-        
 
-        for _ in range(random.randint(10, 15)):
+        for _ in range(self.rng.randint(10, 15)):
             pos, color = self._place_food()
-            self.foods.append(pos)
-            self.food_colors.append(color)
-            self.is_double_score_foods.append(random.random() < 0.2)  
+            if pos is None:
+                break
+            self._add_food(pos, color)
         
 
         self._generate_other_foods()
@@ -119,7 +238,7 @@ class ClassicSnakeGame:
         
 
         self.food_refresh_interval = 10.0  
-        self.last_food_refresh_time = pygame.time.get_ticks() / 1000.0  
+        self.food_refresh_timer = 0.0  
         
 
         self.last_countdown_update = 0  
@@ -128,89 +247,65 @@ class ClassicSnakeGame:
     def _generate_other_foods(self):
         """生成多个食物，增加游戏难度和多样性"""
         # 清除旧的食物
-        self.fake_foods = []
-        self.fake_foods_colors = []
-        self.fake_foods_age = []
-        self.fake_foods_properties = []  # 存储每个食物的属性
+        for row in range(len(self.fake_foods)):
+            self.grid.release(self.fake_foods.position(row))
+        self.fake_foods.clear()
         
         # 增加食物数量：生成20-28个食物，提高游戏难度
-        num_other_foods = random.randint(20, 28)
-        bomb_count = 0
-        
-        # 食物属性列表和概率分布
-        # 属性包括：炸弹、变色、加速、减速、冻结
-        properties = ['bomb', 'color_change', 'speed_up', 'speed_down', 'freeze', 'none']
-        # 概率分布：炸弹概率为1%，其他食物占35%
-        weights = [0.01, 0.16, 0.16, 0.16, 0.16, 0.35]
+        num_other_foods = self.rng.randint(20, 28)
         
         for i in range(num_other_foods):
-            pos = self._place_other_food()
-            self.fake_foods.append(pos)
-            
-            # 随机选择食物属性
-            prop = random.choices(properties, weights=weights)[0]
-            
-            # 限制炸弹数量，每轮最多生成6个炸弹
-            if prop == 'bomb' and bomb_count >= 6:
-                prop = random.choice(['color_change', 'speed_up', 'speed_down', 'freeze', 'none'])
-            elif prop == 'bomb':
-                bomb_count += 1
-            
-            # 所有食物都使用随机颜色，不根据属性区分
-            # 创建一个包含多种颜色对的列表，用于随机选择
-            all_colors = [
-                ((255, 105, 180), (255, 200, 220)),  # 粉色
-                ((135, 206, 250), (200, 230, 255)),  # 蓝色
-                ((255, 255, 0), (255, 255, 200)),    # 黄色
-                ((255, 69, 0), (255, 150, 100)),     # 橙色
-                ((144, 238, 144), (200, 255, 200)),  # 浅绿色
-                ((255, 182, 193), (255, 200, 210)),  # 浅粉色
-                ((176, 224, 230), (200, 235, 240)),  # 浅蓝色
-                ((221, 160, 221), (230, 180, 230)),  # 浅紫色
-            ]
-            
-            # 随机选择一个颜色对
-            food_color = random.choice(all_colors)
-            self.fake_foods_colors.append(food_color)
-            self.fake_foods_age.append(0)
-            self.fake_foods_properties.append(prop)
+            if self._add_other_food() is None:
+                break
+
+    def _add_other_food(self):
+        """放置一个其他食物并随机选择属性和颜色，没有空闲格子时返回None"""
+        pos = self._place_other_food()
+        if pos is None:
+            return None
+        
+        prop = self.rng.choices(OTHER_FOOD_PROPERTIES, weights=self.other_food_weights)[0]
+        
+        # 限制炸弹数量，场上最多6个炸弹
+        if prop == 'bomb' and self.fake_foods.count_property('bomb') >= MAX_BOMBS:
+            prop = self.rng.choice(['color_change', 'speed_up', 'speed_down', 'freeze', 'none'])
+        
+        food_color = self.rng.choice(self.OTHER_FOOD_COLORS)
+        return self.fake_foods.add(pos, food_color, prop)
     
+    def _add_food(self, pos, color):
+        """添加一个真食物，20%概率是分数翻倍的特殊食物"""
+        self.foods.add(pos, color, double_score=self.rng.random() < 0.2)
+
     def _place_other_food(self):
-        """放置其他食物"""
-        while True:
-            pos = (random.randint(0, self.grid_width-1), random.randint(0, self.grid_height-1))
-            if pos not in self.snake and pos not in self.foods and pos not in self.obstacles:
-                return pos
+        """放置其他食物，从空闲格子中直接抽取，没有空闲格子时返回None"""
+        pos = self.grid.sample_free(rng=self.rng)
+        if pos is not None:
+            self.grid.set(pos, OTHER_FOOD)
+        return pos
 
     def _place_food(self):
-        while True:
-            pos = (random.randint(0, self.grid_width-1), random.randint(0, self.grid_height-1))
-
-            if pos not in self.snake and pos not in self.obstacles and pos not in self.foods:
-                return pos, random.choice(self.FOOD_COLORS)
+        """放置真食物，返回(位置, 颜色)，没有空闲格子时位置为None"""
+        pos = self.grid.sample_free(rng=self.rng)
+        if pos is not None:
+            self.grid.set(pos, FOOD)
+        return pos, self.rng.choice(self.FOOD_COLORS)
     
     def _generate_obstacles(self):
         """生成随机障碍物，增加游戏难度"""
         # 清除旧的障碍物
+        for pos in self.obstacles:
+            self.grid.release(pos)
         self.obstacles = []
         
         # 生成3-5个障碍物
-        num_obstacles = random.randint(5, 8)
+        num_obstacles = self.rng.randint(5, 8)
         for _ in range(num_obstacles):
-            while True:
-                # 随机生成障碍物位置
-                obstacle_pos = (random.randint(0, self.grid_width-1), random.randint(0, self.grid_height-1))
-                # 确保障碍物不会出现在蛇的初始位置或周围
-                snake_head = self.snake[0]
-                # 计算障碍物与蛇头的曼哈顿距离
-                distance_to_head = abs(obstacle_pos[0] - snake_head[0]) + abs(obstacle_pos[1] - snake_head[1])
-                
-                if (distance_to_head >= 2 and 
-                    obstacle_pos not in self.snake and 
-                    (not hasattr(self, 'foods') or obstacle_pos not in self.foods) and
-                    (not hasattr(self, 'fake_foods') or obstacle_pos not in self.fake_foods)):
-                    break
-            
+            # 确保障碍物不会出现在蛇头周围：与蛇头的曼哈顿距离至少为2
+            obstacle_pos = self.grid.sample_free(rng=self.rng, avoid=self.snake[0], min_distance=2)
+            if obstacle_pos is None:
+                break
+            self.grid.set(obstacle_pos, OBSTACLE)
             self.obstacles.append(obstacle_pos)
 
     def handle_input(self, event):
@@ -265,19 +360,49 @@ class ClassicSnakeGame:
                     sys.exit()
 
     def update(self):
-        if self.game_over or not self.game_started: return
+        """
+        每帧调用一次：把时钟流逝的时间加到累加器里，再按固定步长tick_interval调用若干次step。
+        渲染变慢时一帧会补运行多次逻辑，渲染很快时可能一次也不运行，移动速度和效果时间都不再依赖帧率。
+        不足一步的剩余时间比例保存在interpolation_alpha中供draw使用，返回本帧运行的逻辑步数。
+        """
+        if self.game_over or not self.game_started:
+            self._last_clock_time = None
+            return 0
         
         # 重置音效播放标志位，确保每个帧只播放一次音效
         self.sound_played_this_frame = False
         
-        current_time = pygame.time.get_ticks()
-        time_since_last_move = current_time - self.last_move_time
-        delta_time = time_since_last_move / 1000.0  # 转换为秒
+        now = self.clock()
+        if self._last_clock_time is None:
+            self._last_clock_time = now
+        self.accumulator += now - self._last_clock_time
+        self._last_clock_time = now
+        
+        ticks = 0
+        while self.accumulator >= self.tick_interval:
+            if ticks >= self.max_ticks_per_frame:
+                # 落后太多（例如窗口被拖动），丢弃多余的时间
+                self.accumulator = 0.0
+                break
+            self.accumulator -= self.tick_interval
+            self.step(self.tick_interval)
+            ticks += 1
+            if self.game_over:
+                self.accumulator = 0.0
+                break
+        self.interpolation_alpha = self.accumulator / self.tick_interval
+        return ticks
+
+    def step(self, dt):
+        """按固定时间步长dt（秒）推进一次游戏逻辑"""
+        if self.game_over or not self.game_started: return
+        
+        self.sim_time += dt
         
         # 更新各种效果的剩余时间
         for effect in self.effects:
             if effect != 'color_change' and self.effects[effect] > 0:
-                self.effects[effect] -= delta_time
+                self.effects[effect] -= dt
                 # 确保效果时间不会为负数
                 if self.effects[effect] < 0:
                     self.effects[effect] = 0
@@ -293,20 +418,11 @@ class ClassicSnakeGame:
         # 确保速度不超过合理上限（最小移动间隔）
         self.base_move_interval = max(self.min_move_interval, length_based_speed)
         
-        # 应用效果
-        current_move_interval = self.base_move_interval
-        
-        # 检查冻结效果
+        # 检查冻结效果，冻结状态下不移动
         freeze_effect = self.effects['freeze'] > 0
-        if freeze_effect:
-            # 如果处于冻结状态，不移动
-            # 更新真食物闪烁
-            blink_time = 0.3  # 固定闪烁时间（秒）
-            self.food_visible = (current_time % (int(blink_time * 1000) * 2)) < int(blink_time * 1000)
         
         # 更新假食物年龄
-        for i in range(len(self.fake_foods_age)):
-            self.fake_foods_age[i] += delta_time * 0.01
+        self.fake_foods.age(dt * 0.01)
         
         # 更新效果提示时间
         if self.effect_display:
@@ -318,30 +434,29 @@ class ClassicSnakeGame:
                 if self.effects['freeze'] <= 0:
                     self.effect_display = None
             else:
-                # 其他效果：正常倒计时
+                # 其他效果：正常倒计时，time按逻辑步数计
                 self.effect_display['time'] -= 1
                 if self.effect_display['time'] <= 0:
                     self.effect_display = None
         
         # 检查食物是否需要自动刷新
-        current_time_sec = current_time / 1000.0
-        if current_time_sec - self.last_food_refresh_time >= self.food_refresh_interval:
+        self.food_refresh_timer += dt
+        if self.food_refresh_timer >= self.food_refresh_interval:
             # 重新生成真食物，支持多个真食物
-            self.foods = []  # 清空现有真食物
-            self.food_colors = []
-            self.is_double_score_foods = []
+            for row in range(len(self.foods)):
+                self.grid.release(self.foods.position(row))
+            self.foods.clear()  # 清空现有真食物
             
-            # 生成3-5个新的真食物
-            for _ in range(random.randint(3, 5)):
+            # 生成3-5个新的真食物，20%概率生成特殊食物
+            for _ in range(self.rng.randint(3, 5)):
                 pos, color = self._place_food()
-                self.foods.append(pos)
-                self.food_colors.append(color)
-                self.is_double_score_foods.append(random.random() < 0.2)  # 20%概率生成特殊食物
+                if pos is None:
+                    break
+                self._add_food(pos, color)
             
             # 重新生成其他食物
             self._generate_other_foods()
-            # 更新上次刷新时间
-            self.last_food_refresh_time = current_time_sec
+            self.food_refresh_timer = 0.0
         
         # 初始化当前移动间隔为基础速度
         current_move_interval = self.base_move_interval
@@ -355,7 +470,7 @@ class ClassicSnakeGame:
         if self.acceleration_time > 0:
             # 同方向按键加速：比当前速度快2倍
             current_move_interval = max(self.min_move_interval, current_move_interval * 0.5)
-            self.acceleration_time -= delta_time
+            self.acceleration_time -= dt
             if self.acceleration_time <= 0:
                 self.acceleration_time = 0
         
@@ -364,86 +479,53 @@ class ClassicSnakeGame:
             # 加速效果：比当前速度快2倍，确保总是大于当前速度
             current_move_interval = max(self.min_move_interval, current_move_interval * 0.5)
         
-        # 独立的真食物闪烁更新，确保一直稳定闪烁
+        # 真食物闪烁按模拟时间计算
         blink_time = 0.3  # 固定闪烁时间（秒）
-        # 使用当前时间的毫秒值取模，确保闪烁稳定
-        self.food_visible = (current_time % (int(blink_time * 1000) * 2)) < int(blink_time * 1000)
+        self.food_visible = (self.sim_time % (blink_time * 2)) < blink_time
         
         # 检查是否需要移动
         # 使用计算好的current_move_interval，确保加速和减速效果生效
         # 冻结状态下不移动
-        # 重新计算当前时间，确保时间准确
-        current_time_now = pygame.time.get_ticks()
-        time_since_last_move_now = current_time_now - self.last_move_time
-        
-        if time_since_last_move_now >= current_move_interval * 1000 and not freeze_effect:
-            self.last_move_time = current_time_now
+        self.move_timer += dt
+        if self.move_timer >= current_move_interval and not freeze_effect:
+            # 保留超出的时间，使平均移动速度与步长无关；积压超过一次移动时直接丢弃
+            self.move_timer -= current_move_interval
+            if self.move_timer >= current_move_interval:
+                self.move_timer = 0.0
             
             hx, hy = self.snake[0]; dx, dy = self.direction; nh = (hx+dx, hy+dy)
+            # 从网格占用表查出新蛇头所在格子的内容，超出网格时为None
+            cell = self.grid.kind(nh)
             
             # 修复碰撞检测，确保蛇不会移出屏幕边界或撞到障碍物
-            if not (0 <= nh[0] < self.grid_width and 0 <= nh[1] < self.grid_height):
+            if cell is None:
                 # 碰到屏幕边缘
-                self.game_over_reason = get_translation('classic_edge_death')
-                self.game_over = True
-                # 播放游戏结束音效
-                if self.fail_sound:
-                    try:
-                        self.fail_sound.play()
-                    except Exception as e:
-                        print(f"播放游戏结束音效失败: {e}")
+                self._end_game('edge', get_translation('classic_edge_death'))
                 return  # 游戏结束，退出update方法
-            elif nh in self.snake:
+            elif cell == SNAKE:
                 # 碰到自己身体
-                self.game_over_reason = get_translation('classic_self_death')
-                self.game_over = True
-                # 播放游戏结束音效
-                if self.fail_sound:
-                    try:
-                        self.fail_sound.play()
-                    except Exception as e:
-                        print(f"播放游戏结束音效失败: {e}")
+                self._end_game('self', get_translation('classic_self_death'))
                 return  # 游戏结束，退出update方法
-            elif nh in self.obstacles:
+            elif cell == OBSTACLE:
                 # 碰到障碍物
-                self.game_over_reason = get_translation('classic_obstacle_death')
-                self.game_over = True
-                # 播放游戏结束音效
-                if self.fail_sound:
-                    try:
-                        self.fail_sound.play()
-                    except Exception as e:
-                        print(f"播放游戏结束音效失败: {e}")
+                self._end_game('obstacle', get_translation('classic_obstacle_death'))
                 return  # 游戏结束，退出update方法
             # 蛇移动：在蛇头位置插入新的身体段
-            self.snake.insert(0, nh)
+            self.snake.appendleft(nh)
+            # 蛇头所在格子的食物会在下面被吃掉，这里直接标记为蛇身
+            self.grid.set(nh, SNAKE)
             
             # 检查是否吃到食物
-            food_eaten = False
-            eaten_index = -1
-            
-            # 使用列表副本进行遍历，避免在遍历过程中修改列表导致的问题
-            for i, food in enumerate(self.foods.copy()):
-                if self.snake[0] == food:
-                    food_eaten = True
-                    eaten_index = i
-                    break
+            food_eaten = cell == FOOD
+            eaten_index = self.foods.find(nh) if food_eaten else -1
             
             if food_eaten:
                 # 吃到了食物
-                pos_px = (self.foods[eaten_index][0]*self.grid_size+self.grid_size//2+10, self.foods[eaten_index][1]*self.grid_size+self.grid_size//2+10)
-                emit_particle_burst(30, pos_px, [self.food_colors[eaten_index]])
-                
-                # 播放吃到食物音效，确保每个帧只播放一次
-                if self.boom_sound and not self.sound_played_this_frame:
-                    try:
-                        self.boom_sound.play()
-                        self.sound_played_this_frame = True  # 标记为已播放
-                    except Exception as e:
-                        print(f"播放吃到食物音效失败: {e}")
+                pos_px = (nh[0]*self.grid_size+self.grid_size//2+10, nh[1]*self.grid_size+self.grid_size//2+10)
+                self._emit('food_eaten', position=pos_px, color=self.foods.color(eaten_index))
                 
                 # 检查是否是分数翻倍食物
-                if self.is_double_score_foods[eaten_index]:
+                if self.foods.double_score[eaten_index]:
                     if self.score == 0:  # 第一次吃食物
                         self.score += 1  # 先加1分
                         self.score *= 2
@@ -451,9 +533,7 @@ class ClassicSnakeGame:
                         self.score *= 2   # 然后分数翻倍
                     # 显示分数翻倍效果提示
                     self.effect_display = {'text': get_translation('effect_double_score'), 'time': 60, 'color': (255, 215, 0)}
-                    # 在屏幕正上方添加粒子特效
-                    screen_top_center = (self.width // 2, 50)
-                    emit_particle_burst(30, screen_top_center, [((255, 215, 0), (255, 235, 150))])
+                    self._emit('effect', effect='double_score', colors=((255, 215, 0), (255, 235, 150)))
                 else:
                     # 普通食物：加1分
                     self.score += 1
@@ -463,41 +543,24 @@ class ClassicSnakeGame:
                     self.high_score = self.score
                 
                 # 吃到食物后，移除被吃掉的食物
-                self.foods.pop(eaten_index)
-                self.food_colors.pop(eaten_index)
-                self.is_double_score_foods.pop(eaten_index)
+                self.foods.remove(eaten_index)
                 
-                # 生成新的食物
+                # 生成新的食物，20%概率生成特殊食物
                 new_pos, new_color = self._place_food()
-                self.foods.append(new_pos)
-                self.food_colors.append(new_color)
-                self.is_double_score_foods.append(random.random() < 0.2)  # 20%概率生成特殊食物
+                if new_pos is not None:
+                    self._add_food(new_pos, new_color)
             
             # 检查是否吃到其他食物或炸弹
             else:
                 game_over, other_food_eaten = self._check_other_foods()
                 # 只有在没吃到其他食物或炸弹的情况下，才缩短蛇身
                 if not other_food_eaten and not game_over:
-                    self.snake.pop()
+                    self.grid.release(self.snake.pop())
             
             # 更新当前游戏的最长记录
             current_length = len(self.snake)
             if current_length > self.current_game_max_length:
                 self.current_game_max_length = current_length
-            
-            # 检查游戏是否结束，确保游戏结束音效只播放一次
-            if self.game_over and not hasattr(self, 'game_over_sound_played'):
-                # 播放游戏结束音效
-                if self.fail_sound:
-                    try:
-                        self.fail_sound.play()
-                        self.game_over_sound_played = True  # 标记为已播放
-                    except Exception as e:
-                        print(f"播放游戏结束音效失败: {e}")
-        
-        # 更新假食物年龄
-        for i in range(len(self.fake_foods_age)):
-            self.fake_foods_age[i] += delta_time * 0.01
     
     def _check_other_foods(self):
         """检查其他食物和炸弹，处理各种属性效果"""
@@ -505,144 +568,65 @@ class ClassicSnakeGame:
         to_remove = []
         other_food_eaten = False  
         
-        # 使用列表副本进行遍历，避免在遍历过程中修改列表导致的无限循环
-        for i, other_food in enumerate(self.fake_foods.copy()):
-            if snake_head == other_food:
-                prop = self.fake_foods_properties[i]
-                pos_px = (other_food[0]*self.grid_size+self.grid_size//2+10, other_food[1]*self.grid_size+self.grid_size//2+10)
-                
-                emit_particle_burst(20, pos_px, [self.fake_foods_colors[i]])
-                
-                # 播放吃到食物音效（炸弹除外），确保每个帧只播放一次
-                if prop != 'bomb' and self.boom_sound and not self.sound_played_this_frame:
-                    try:
-                        self.boom_sound.play()
-                        self.sound_played_this_frame = True  # 标记为已播放
-                    except Exception as e:
-                        print(f"播放吃到食物音效失败: {e}")
-                
-                if prop == 'bomb':
-                    self.game_over = True
-                    self.game_over_reason = 'bomb'
-                    # 播放游戏结束音效
-                    if self.fail_sound:
-                        try:
-                            self.fail_sound.play()
-                        except Exception as e:
-                            print(f"播放游戏结束音效失败: {e}")
-                    return True, False  # 吃到炸弹，返回True表示游戏结束，False表示没有吃到可生长的食物
-                
-                # 吃到了非炸弹的食物，标记为需要生长
-                other_food_eaten = True
-                
-                if prop == 'color_change':
-                    self.effects['color_change'] = True
-                    from core.game_ui import gradient_colors_data
-                    if random.random() < 0.5:
-                        self.snake_color = random.choice([
-                            (255, 182, 193), (144, 238, 144), (173, 216, 230), (255, 255, 0),
-                            (255, 165, 0), (128, 0, 128), (255, 255, 255), (128, 128, 128),
-                            (255, 0, 0), (0, 255, 255), (255, 0, 255), (50, 205, 50),
-                            (0, 128, 128), (0, 0, 128), (255, 215, 0), (192, 192, 192)
-                        ])
-                    else:
-                        self.snake_color = random.choice(list(gradient_colors_data.keys()))
-                    self.effect_display = {'text': get_translation('effect_color_change'), 'time': 60, 'color': (255, 0, 255)}
-                    screen_top_center = (self.width // 2, 50)
-                    emit_particle_burst(30, screen_top_center, [((255, 0, 255), (255, 150, 255))])
-                elif prop == 'speed_up':
-                    self.effects['speed_up'] = 5.0
-                    self.effect_display = {'text': get_translation('effect_speed_up'), 'time': 60, 'color': (0, 255, 0)}
-                    screen_top_center = (self.width // 2, 50)
-                    emit_particle_burst(30, screen_top_center, [((0, 255, 0), (150, 255, 150))])
-                elif prop == 'speed_down':
-                    self.effects['speed_down'] = 12.0
-                    self.effect_display = {'text': get_translation('effect_speed_down'), 'time': 90, 'color': (0, 0, 255)}
-                    screen_top_center = (self.width // 2, 50)
-                    emit_particle_burst(30, screen_top_center, [((0, 0, 255), (150, 150, 255))])
-                elif prop == 'freeze':
-                    self.effects['freeze'] = 30.0
-                    self.effect_display = {'text': get_translation('effect_freeze'), 'time': 60, 'color': (0, 0, 255)}
-                    screen_top_center = (self.width // 2, 50)
-                    emit_particle_burst(30, screen_top_center, [((255, 255, 255), (200, 200, 200))])
-                elif prop == 'none':
-                    # 普通假食物，只加分，无特效
-                    pass
-                
-                # 除了炸弹外，所有假食物都加分
-                self.score += 1
-                
-                to_remove.append(i)
+        # 通过位置索引直接找到蛇头所在格子的其他食物
+        i = self.fake_foods.find(snake_head)
+        if i is not None:
+            prop = self.fake_foods.property(i)
+            pos_px = (snake_head[0]*self.grid_size+self.grid_size//2+10, snake_head[1]*self.grid_size+self.grid_size//2+10)
+            
+            self._emit('other_food_eaten', position=pos_px, color=self.fake_foods.color(i), property=prop)
+            
+            if prop == 'bomb':
+                self._end_game('bomb', 'bomb')
+                return True, False  # 吃到炸弹，返回True表示游戏结束，False表示没有吃到可生长的食物
+            
+            # 吃到了非炸弹的食物，标记为需要生长
+            other_food_eaten = True
+            
+            if prop == 'color_change':
+                self.effects['color_change'] = True
+                from core.game_ui import gradient_colors_data
+                if self.rng.random() < 0.5:
+                    self.snake_color = self.rng.choice(COLOR_CHANGE_COLORS)
+                else:
+                    self.snake_color = self.rng.choice(list(gradient_colors_data.keys()))
+                self.effect_display = {'text': get_translation('effect_color_change'), 'time': 60, 'color': (255, 0, 255)}
+                self._emit('effect', effect=prop, colors=((255, 0, 255), (255, 150, 255)))
+            elif prop == 'speed_up':
+                self.effects['speed_up'] = EFFECT_DURATIONS['speed_up']
+                self.effect_display = {'text': get_translation('effect_speed_up'), 'time': 60, 'color': (0, 255, 0)}
+                self._emit('effect', effect=prop, colors=((0, 255, 0), (150, 255, 150)))
+            elif prop == 'speed_down':
+                self.effects['speed_down'] = EFFECT_DURATIONS['speed_down']
+                self.effect_display = {'text': get_translation('effect_speed_down'), 'time': 90, 'color': (0, 0, 255)}
+                self._emit('effect', effect=prop, colors=((0, 0, 255), (150, 150, 255)))
+            elif prop == 'freeze':
+                self.effects['freeze'] = EFFECT_DURATIONS['freeze']
+                self.effect_display = {'text': get_translation('effect_freeze'), 'time': 60, 'color': (0, 0, 255)}
+                self._emit('effect', effect=prop, colors=((255, 255, 255), (200, 200, 200)))
+            elif prop == 'none':
+                # 普通假食物，只加分，无特效
+                pass
+            
+            # 除了炸弹外，所有假食物都加分
+            self.score += 1
+            
+            to_remove.append(i)
         
         # 先移除所有需要移除的其他食物
         for i in sorted(to_remove, reverse=True):
-            self.fake_foods.pop(i)
-            self.fake_foods_colors.pop(i)
-            self.fake_foods_age.pop(i)
-            self.fake_foods_properties.pop(i)
+            self.fake_foods.remove(i)
         
         # 然后生成新的其他食物，保持食物数量稳定
         for _ in range(len(to_remove)):
-            pos = self._place_other_food()
-            self.fake_foods.append(pos)
-            
-            properties = ['bomb', 'color_change', 'speed_up', 'speed_down', 'freeze', 'none']
-            weights = [0.01, 0.16, 0.16, 0.16, 0.16, 0.35]  
-            prop = random.choices(properties, weights=weights)[0]
-            
-            bomb_count = sum(1 for p in self.fake_foods_properties if p == 'bomb')
-            if prop == 'bomb' and bomb_count >= 6:
-                prop = random.choice(['color_change', 'speed_up', 'speed_down', 'freeze', 'none'])
-            elif prop == 'bomb':
-                bomb_count += 1
-            
-            # 所有食物都使用随机颜色
-            all_colors = [
-                ((255, 105, 180), (255, 200, 220)),  
-                ((135, 206, 250), (200, 230, 255)),  
-                ((255, 255, 0), (255, 255, 200)),    
-                ((255, 69, 0), (255, 150, 100)),     
-                ((144, 238, 144), (200, 255, 200)),  
-                ((255, 182, 193), (255, 200, 210)),  
-                ((176, 224, 230), (200, 235, 240)),  
-                ((221, 160, 221), (230, 180, 230)),  
-            ]
-            food_color = random.choice(all_colors)
-            self.fake_foods_colors.append(food_color)
-            self.fake_foods_age.append(0)
-            self.fake_foods_properties.append(prop)
+            if self._add_other_food() is None:
+                break
         
         if len(self.fake_foods) < 4:
             needed = 4 - len(self.fake_foods)
             for _ in range(needed):
-                pos = self._place_other_food()
-                self.fake_foods.append(pos)
-                
-                properties = ['bomb', 'color_change', 'speed_up', 'speed_down', 'freeze', 'none']
-                weights = [0.01, 0.16, 0.16, 0.16, 0.16, 0.35]  
-                prop = random.choices(properties, weights=weights)[0]
-                
-                bomb_count = sum(1 for p in self.fake_foods_properties if p == 'bomb')
-                if prop == 'bomb' and bomb_count >= 6:
-                    prop = random.choice(['color_change', 'speed_up', 'speed_down', 'freeze', 'none'])
-                elif prop == 'bomb':
-                    bomb_count += 1
-                
-                # 所有食物都使用随机颜色
-                all_colors = [
-                    ((255, 105, 180), (255, 200, 220)),  
-                    ((135, 206, 250), (200, 230, 255)),  
-                    ((255, 255, 0), (255, 255, 200)),    
-                    ((255, 69, 0), (255, 150, 100)),     
-                    ((144, 238, 144), (200, 255, 200)),  
-                    ((255, 182, 193), (255, 200, 210)),  
-                    ((176, 224, 230), (200, 235, 240)),  
-                    ((221, 160, 221), (230, 180, 230)),  
-                ]
-                food_color = random.choice(all_colors)
-                self.fake_foods_colors.append(food_color)
-                self.fake_foods_age.append(0)
-                self.fake_foods_properties.append(prop)
+                if self._add_other_food() is None:
+                    break
         
         return False, other_food_eaten  # 未吃到炸弹，返回False表示游戏未结束，other_food_eaten表示是否吃到了可生长的食物
 
@@ -678,7 +662,14 @@ class ClassicSnakeGame:
             
         return (255, 182, 193) 
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=None):
+        """
+        绘制当前状态。alpha为上一次逻辑更新之后经过的时间占一个逻辑步长的比例（0~1），
+        默认使用update算出的interpolation_alpha，动画按插值后的模拟时间计算，渲染频率可以与逻辑更新频率不同。
+        """
+        if alpha is None:
+            alpha = self.interpolation_alpha
+        render_time_ms = int((self.sim_time + alpha * self.tick_interval) * 1000)
 
         screen.fill((240, 240, 240)) 
         grid_color = (220, 220, 220) 
@@ -688,8 +679,8 @@ class ClassicSnakeGame:
             pygame.draw.line(screen, grid_color, (10, y), (self.width-10, y)) 
 
 
-        # 炫彩动态边框
-        current_time = pygame.time.get_ticks()
+        # 炫彩动态边框，游戏未开始或结束时也保持变化，使用时钟时间
+        current_time = int(self.clock() * 1000)
         # 使用正弦函数生成彩虹色，确保RGB值在0-255范围内
         r = int((1 + math.sin(current_time * 0.001)) * 127.5)
         g = int((1 + math.sin(current_time * 0.001 + 2 * math.pi / 3)) * 127.5)
@@ -722,28 +713,29 @@ class ClassicSnakeGame:
         if not self.game_over:
 
             # 绘制主要食物
-            for i in range(len(self.foods)):
-                food_pos = (self.foods[i][0]*self.grid_size+self.grid_size//2+10, self.foods[i][1]*self.grid_size+self.grid_size//2+10)
+            positions, colors, double_score = self.foods.rows()
+            for (x, y), color, is_double_score in zip(positions, colors, double_score):
+                food_pos = (x*self.grid_size+self.grid_size//2+10, y*self.grid_size+self.grid_size//2+10)
                 
-                if self.is_double_score_foods[i]:
+                if is_double_score:
                     # 分数翻倍食物保持原有金色外观
                     gold_color = (255, 215, 0)
                     pygame.draw.circle(screen, gold_color, food_pos, self.grid_size//2, width=3)
                     pygame.draw.circle(screen, gold_color, food_pos, self.grid_size//3)
                 else:
                     # 普通食物使用随机颜色
-                    pygame.draw.circle(screen, self.food_colors[i][0], food_pos, self.grid_size//3)
+                    pygame.draw.circle(screen, color, food_pos, self.grid_size//3)
             
             # 绘制其他食物
-            for i, other_food in enumerate(self.fake_foods):
-                other_color = self.fake_foods_colors[i][0]
-                other_pos = (other_food[0]*self.grid_size+self.grid_size//2+10, other_food[1]*self.grid_size+self.grid_size//2+10)
+            positions, colors, _ = self.fake_foods.rows()
+            for (x, y), other_color in zip(positions, colors):
+                other_pos = (x*self.grid_size+self.grid_size//2+10, y*self.grid_size+self.grid_size//2+10)
                 pygame.draw.circle(screen, other_color, other_pos, self.grid_size//3)
             
             total_segments = len(self.snake)
 
             is_frozen = self.effects['freeze'] > 0
-            current_time_ms = pygame.time.get_ticks()
+            current_time_ms = render_time_ms
             
             for i, seg in enumerate(self.snake):
                 snake_fill_color = self._get_segment_color(i, total_segments) 
@@ -824,17 +816,17 @@ class ClassicSnakeGame:
                             pygame.draw.circle(screen, self.BLACK, eye_pos, 3)
         
 
-        score_txt = self.font_small.render(get_translation('game_score').format(self.score), True, self.BLACK)
-        hs_txt = self.font_small.render(get_translation('game_high_score').format(self.high_score), True, self.BLACK)
-        max_length_txt = self.font_small.render(get_translation('game_max_length_record').format(self.max_length_record), True, self.BLACK)
-        screen.blit(score_txt, (15,15)); screen.blit(hs_txt, (15,55)); screen.blit(max_length_txt, (15,95))
+        self.text_small.draw(screen, get_translation('game_score').format(self.score), self.BLACK, topleft=(15,15))
+        self.text_small.draw(screen, get_translation('game_high_score').format(self.high_score), self.BLACK, topleft=(15,55))
+        self.text_small.draw(screen, get_translation('game_max_length_record').format(self.max_length_record), self.BLACK, topleft=(15,95))
         
 
         if self.effect_display:
 
-            effect_txt = self.font_large.render(self.effect_display['text'], True, self.effect_display['color'])
+            effect_size = self.text_large.size(self.effect_display['text'])
 
-            txt_rect = effect_txt.get_rect(center=(self.width//2, 80))
+            txt_rect = pygame.Rect((0, 0), effect_size)
+            txt_rect.center = (self.width//2, 80)
             
 
             if get_translation('effect_freeze') in self.effect_display['text']:
@@ -846,38 +838,34 @@ class ClassicSnakeGame:
                 shadow_colors = [(0, 0, 0), (100, 100, 255), (0, 0, 150)]
                 shadow_offsets = [(5, 5), (3, 3), (1, 1)]
                 for color, offset in zip(shadow_colors, shadow_offsets):
-                    shadow_txt = self.font_large.render(self.effect_display['text'], True, color)
-                    screen.blit(shadow_txt, (txt_rect.x + offset[0], txt_rect.y + offset[1]))
+                    self.text_large.draw(screen, self.effect_display['text'], color, topleft=(txt_rect.x + offset[0], txt_rect.y + offset[1]))
                 
 
-                current_time = pygame.time.get_ticks()
-                if current_time % 200 < 100:
+                if render_time_ms % 200 < 100:
                     dynamic_border_rect = pygame.Rect(bg_rect.x - 5, bg_rect.y - 5, bg_rect.width + 10, bg_rect.height + 10)
                     pygame.draw.rect(screen, (100, 150, 255, 200), dynamic_border_rect, border_radius=20, width=3)
             
 
-            screen.blit(effect_txt, txt_rect)
+            self.text_large.draw(screen, self.effect_display['text'], self.effect_display['color'], topleft=txt_rect.topleft)
         if self.game_over:
             overlay = pygame.Surface((self.width,self.height), pygame.SRCALPHA); overlay.fill((255,255,255,180)); screen.blit(overlay,(0,0))
             
 
             if self.game_over_reason == 'bomb':
-                over_txt=self.font_large.render(get_translation('classic_bomb_death'),True,self.BLACK)
+                over_text = get_translation('classic_bomb_death')
             elif self.game_over_reason:
-                over_txt=self.font_large.render(self.game_over_reason,True,self.BLACK)
+                over_text = self.game_over_reason
             else:
-                over_txt=self.font_large.render(get_translation('game_game_over'),True,self.BLACK)
+                over_text = get_translation('game_game_over')
                 
 
-            screen.blit(over_txt, over_txt.get_rect(center=(self.width/2,self.height/2-120)))
+            self.text_large.draw(screen, over_text, self.BLACK, center=(self.width/2,self.height/2-120))
             
 
-            score_txt=self.font_small.render(get_translation('game_final_score').format(self.score),True,self.BLACK)
-            screen.blit(score_txt, score_txt.get_rect(center=(self.width/2,self.height/2-60)))
+            self.text_small.draw(screen, get_translation('game_final_score').format(self.score), self.BLACK, center=(self.width/2,self.height/2-60))
             
             # 显示此次游戏的身长
-            length_txt=self.font_small.render(get_translation('game_body_length').format(self.current_game_max_length),True,self.BLACK)
-            screen.blit(length_txt, length_txt.get_rect(center=(self.width/2,self.height/2-20)))
+            self.text_small.draw(screen, get_translation('game_body_length').format(self.current_game_max_length), self.BLACK, center=(self.width/2,self.height/2-20))
             
 
             # 动态计算按钮宽度，确保能容纳最长文本
@@ -886,9 +874,9 @@ class ClassicSnakeGame:
             exit_text = get_translation('menu_exit')
             
             # 计算文本宽度
-            menu_text_width = self.font_small.size(menu_text)[0]
-            restart_text_width = self.font_small.size(restart_text)[0]
-            exit_text_width = self.font_small.size(exit_text)[0]
+            menu_text_width = self.text_small.size(menu_text)[0]
+            restart_text_width = self.text_small.size(restart_text)[0]
+            exit_text_width = self.text_small.size(exit_text)[0]
             
             # 设置按钮宽度为最长文本宽度加上40像素内边距
             button_width = max(menu_text_width, restart_text_width, exit_text_width) + 40
@@ -915,22 +903,18 @@ class ClassicSnakeGame:
             
 
             pygame.draw.rect(screen, button_color, restart_rect, border_radius=5)
-            restart_txt = self.font_small.render(get_translation('game_restart'), True, text_color)
-            screen.blit(restart_txt, restart_txt.get_rect(center=restart_rect.center))
+            self.text_small.draw(screen, restart_text, text_color, center=restart_rect.center)
             
 
             pygame.draw.rect(screen, button_color, menu_rect, border_radius=5)
-            menu_txt = self.font_small.render(get_translation('game_return_menu'), True, text_color)
-            screen.blit(menu_txt, menu_txt.get_rect(center=menu_rect.center))
+            self.text_small.draw(screen, menu_text, text_color, center=menu_rect.center)
             
 
             pygame.draw.rect(screen, exit_button_color, exit_rect, border_radius=5)
-            exit_txt = self.font_small.render(get_translation('menu_exit'), True, text_color)
-            screen.blit(exit_txt, exit_txt.get_rect(center=exit_rect.center))
+            self.text_small.draw(screen, exit_text, text_color, center=exit_rect.center)
         elif not self.game_started:
 
-            start_txt = self.font_small.render(get_translation('classic_start_prompt'),True,self.BLACK)
-            screen.blit(start_txt, start_txt.get_rect(center=(self.width/2,self.height/3)))
+            self.text_small.draw(screen, get_translation('classic_start_prompt'), self.BLACK, center=(self.width/2,self.height/3))
         return screen
 
     def _get_eye_pos(self, rect):
@@ -8,14 +8,16 @@ import os
 from PIL import Image, ImageDraw, ImageFont
 
 
+from game.utils.asset_manager import asset_manager
+from game.utils.snake_trail import SnakeTrail
+from game.utils.snake_renderer import SnakeBodyRenderer, build_gradient_lut
+from game.utils.sprite import Sprite, blit_sprites
 from game.utils.improved_chinese_text import put_chinese_text_pil
 from game.utils.language_manager import get_translation
 
 class SnakeGame:
     def __init__(self, food_path, high_score=0):             # 构造方法
-        self.points = []            
-        self.lengths = []           
-        self.currentLength = 0      
+        self.trail = SnakeTrail()   # 蛇身各点和总长度
         self.base_allowed_length = 150    
         self.allowedLength = self.base_allowed_length    
         self.previousHead = None    # 初始化为None，根据实际屏幕尺寸设置
@@ -39,27 +41,25 @@ class SnakeGame:
         }
         
         self.gradient_frame = 0  
+        # 渐变色按颜色名称缓存一个周期内每帧的颜色
+        self.gradient_luts = {}
+        self.body_renderer = SnakeBodyRenderer(thickness=20, head_radius=20)
 
-        self.imgFood = cv2.imread(food_path, cv2.IMREAD_UNCHANGED)
+        self.imgFood = asset_manager.load(food_path)
         if self.imgFood is None:
             self.imgFood = np.zeros((50, 50, 4), dtype=np.uint8)
             cv2.circle(self.imgFood, (25, 25), 25, (0, 255, 255, 255), cv2.FILLED)
         self.hFood, self.wFood, _ = self.imgFood.shape
+        self.spriteFood = Sprite(self.imgFood)
         
-        base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-        obstacle_path = os.path.join(base_path, "resources", "assets", "images", "stone.png")
-        self.imgObstacle = cv2.imread(obstacle_path, cv2.IMREAD_UNCHANGED)
+        scale_factor = 0.15
+        self.imgObstacle = asset_manager.get("stone.png", scale=scale_factor, alpha=True)
         if self.imgObstacle is None:
             self.imgObstacle = np.zeros((30, 30, 4), dtype=np.uint8)
             cv2.rectangle(self.imgObstacle, (0, 0), (30, 30), (128, 128, 128, 255), cv2.FILLED)
-
-        if self.imgObstacle.shape[2] == 3:
-            self.imgObstacle = cv2.cvtColor(self.imgObstacle, cv2.COLOR_RGB2RGBA)
-        
-        scale_factor = 0.15
-        self.wObstacle = int(self.imgObstacle.shape[1] * scale_factor)
-        self.hObstacle = int(self.imgObstacle.shape[0] * scale_factor)
-        self.imgObstacle = cv2.resize(self.imgObstacle, (self.wObstacle, self.hObstacle))
+            self.imgObstacle = cv2.resize(self.imgObstacle, (int(30 * scale_factor), int(30 * scale_factor)))
+        self.hObstacle, self.wObstacle = self.imgObstacle.shape[:2]
+        self.spriteObstacle = asset_manager.get_sprite("stone.png", scale=scale_factor) or Sprite(self.imgObstacle)
         
         self.obstacles = []  
         self.num_obstacles = 5  
@@ -140,9 +140,7 @@ class SnakeGame:
             self.obstacles.append(obstacle_pos)
 
     def reset(self):
-        self.points = []
-        self.lengths = []
-        self.currentLength = 0
+        self.trail.clear()
         self.allowedLength = self.base_allowed_length
         # 初始化为None，在update方法中根据实际屏幕尺寸设置
         self.previousHead = None  # 屏幕中心
@@ -158,6 +156,19 @@ class SnakeGame:
 
         self.last_detected_head = None
 
+    def get_current_snake_color(self, frame):
+        """返回第frame帧蛇身的BGR颜色，渐变色从预先计算的颜色表中查找"""
+        if isinstance(self.snake_color, tuple):
+            rgb_color = self.snake_color
+            return (rgb_color[2], rgb_color[1], rgb_color[0])
+        if isinstance(self.snake_color, str) and self.snake_color in self.gradient_colors_data:
+            lut = self.gradient_luts.get(self.snake_color)
+            if lut is None:
+                lut = build_gradient_lut(self.gradient_colors_data[self.snake_color])
+                self.gradient_luts[self.snake_color] = lut
+            return tuple(lut[frame % len(lut)].tolist())
+        return (255, 0, 0)
+
     def update(self, imgMain, currentHead, mouse_pos=None, mouse_clicked=False, high_score=0):
         # 重置音效播放标志位，确保每个帧只播放一次音效
         self.sound_played_this_frame = False
@@ -168,7 +179,7 @@ class SnakeGame:
         if self.gameOver:
 
             try:
-                from game.utils.improved_chinese_text import put_rainbow_text_pil, put_chinese_text_pil, put_chinese_text_with_background
+                from game.utils.improved_chinese_text import put_rainbow_text_pil, put_chinese_text_pil, put_chinese_text_with_background, get_chinese_text_size, get_chinese_text_sizes
                 
 
                 screen_height, screen_width, _ = imgMain.shape
@@ -185,7 +196,7 @@ class SnakeGame:
                 game_over_font_size = 80
                 
                 # 动态计算游戏结束文本位置
-                game_over_size = put_chinese_text_pil(imgMain, game_over_text, (0, 0), game_over_font_size, (255, 0, 0))[1]
+                game_over_size = get_chinese_text_size(game_over_text, game_over_font_size)
                 game_over_width = game_over_size[0]
                 game_over_height = game_over_size[1]
                 game_over_x = center_x - game_over_width // 2
@@ -195,7 +206,7 @@ class SnakeGame:
                 # 分数文本 - 动态计算位置，实现居中
                 score_text = get_translation('game_final_score').format(self.score)
                 score_font_size = 60
-                score_size = put_chinese_text_pil(imgMain, score_text, (0, 0), score_font_size, (50, 130, 246))[1]
+                score_size = get_chinese_text_size(score_text, score_font_size)
                 score_width = score_size[0]
                 score_height = score_size[1]
                 score_x = center_x - score_width // 2
@@ -205,7 +216,7 @@ class SnakeGame:
                 # 最高分文本 - 动态计算位置，实现居中
                 high_score_text = get_translation('game_high_score').format(self.high_score)
                 high_score_font_size = 40
-                high_score_size = put_chinese_text_pil(imgMain, high_score_text, (0, 0), high_score_font_size, (50, 130, 246))[1]
+                high_score_size = get_chinese_text_size(high_score_text, high_score_font_size)
                 high_score_width = high_score_size[0]
                 high_score_height = high_score_size[1]
                 high_score_x = center_x - high_score_width // 2
@@ -224,24 +235,8 @@ class SnakeGame:
                 restart_text = get_translation('game_restart')
                 menu_text = get_translation('game_return_menu')
                 
-                # 使用与绘制相同的字体来测量文本宽度
-                from PIL import Image, ImageDraw, ImageFont
-                from game.utils.improved_chinese_text import _get_font
-                temp_img = Image.new('RGB', (1, 1))
-                temp_draw = ImageDraw.Draw(temp_img)
-                
-                # 使用实际绘制时使用的字体
-                font = _get_font(button_font_size)
-                
-                # 测量文本宽度
-                try:
-                    restart_bbox = temp_draw.textbbox((0, 0), restart_text, font=font)
-                    restart_text_width = restart_bbox[2] - restart_bbox[0]
-                    menu_bbox = temp_draw.textbbox((0, 0), menu_text, font=font)
-                    menu_text_width = menu_bbox[2] - menu_bbox[0]
-                except AttributeError:
-                    restart_text_width, _ = temp_draw.textsize(restart_text, font=font)
-                    menu_text_width, _ = temp_draw.textsize(menu_text, font=font)
+                # 使用与绘制相同的字体一次测量两个按钮的文本尺寸
+                (restart_text_width, restart_text_height), (menu_text_width, menu_text_height) = get_chinese_text_sizes([restart_text, menu_text], button_font_size)
                 
                 # 计算按钮宽度，取文本宽度加内边距的最大值
                 button_width = max(restart_text_width + button_padding, menu_text_width + button_padding, 220)  # 增加最小宽度
@@ -273,16 +268,6 @@ class SnakeGame:
 
                 # 绘制重启按钮文本
                 button_text = get_translation('game_restart')
-                # 先测量文本尺寸
-                temp_img = Image.new('RGB', (1, 1))
-                temp_draw = ImageDraw.Draw(temp_img)
-                font = _get_font(button_font_size)
-                try:
-                    restart_bbox = temp_draw.textbbox((0, 0), button_text, font=font)
-                    restart_text_width = restart_bbox[2] - restart_bbox[0]
-                    restart_text_height = restart_bbox[3] - restart_bbox[1]
-                except AttributeError:
-                    restart_text_width, restart_text_height = temp_draw.textsize(button_text, font=font)
                 # 计算文本位置，确保完全居中
                 restart_text_x = restart_button_x + (button_width - restart_text_width) // 2
                 restart_text_y = button_y + 25  # 使用固定偏移量，根据按钮高度80px，25px的偏移量应该能让文字居中
@@ -295,13 +280,6 @@ class SnakeGame:
 
                 # 绘制返回菜单按钮文本
                 menu_button_text = get_translation('game_return_menu')
-                # 先测量文本尺寸
-                try:
-                    menu_bbox = temp_draw.textbbox((0, 0), menu_button_text, font=font)
-                    menu_text_width = menu_bbox[2] - menu_bbox[0]
-                    menu_text_height = menu_bbox[3] - menu_bbox[1]
-                except AttributeError:
-                    menu_text_width, menu_text_height = temp_draw.textsize(menu_button_text, font=font)
                 # 计算文本位置，确保完全居中
                 menu_text_x = menu_button_x + (button_width - menu_text_width) // 2
                 menu_text_y = button_y + 25  # 使用固定偏移量，根据按钮高度80px，25px的偏移量应该能让文字居中
@@ -454,26 +432,12 @@ class SnakeGame:
                 print("警告：smooth_cx或smooth_cy不是有效的数字，使用默认值(0, 0)")
             
             # 处理初始情况，self.previousHead为None时
-            if self.previousHead is None:
-                # 初始位置，不计算距离
-                self.previousHead = (cx, cy)
-                self.points.append([cx, cy])
-            else:
-                px, py = self.previousHead
-                self.points.append([cx, cy])             
-                distance = math.hypot(cx - px, cy - py)  
-                self.lengths.append(distance)            
-                self.currentLength += distance
-                self.previousHead = (cx, cy)
-
-
-            if self.currentLength > self.allowedLength:
-                for i, length in enumerate(self.lengths):
-                    self.currentLength -= length
-                    self.lengths.pop(i)
-                    self.points.pop(i)
-                    if self.currentLength < self.allowedLength:
-                        break
+            # 第一个点不计算距离，之后每个点累加与上一个点的距离
+            self.trail.append(cx, cy)
+            self.previousHead = (cx, cy)
+
+            # 超出允许长度时从蛇尾裁剪
+            self.trail.trim(self.allowedLength)
 
 
             rx, ry = self.foodPoint
@@ -502,66 +466,18 @@ class SnakeGame:
                 print("障碍物已刷新")
 
 
-            def get_current_snake_color(frame):
-                if isinstance(self.snake_color, tuple):
-
-
-                    rgb_color = self.snake_color
-                    bgr_color = (rgb_color[2], rgb_color[1], rgb_color[0])
-                    return bgr_color
-                elif isinstance(self.snake_color, str) and self.snake_color in self.gradient_colors_data:
-
-                    gradient_data = self.gradient_colors_data[self.snake_color]
-                    if isinstance(gradient_data, list):
-
-                        total_segments = len(gradient_data)
-                        segment_index = frame % total_segments
-                        segment = gradient_data[segment_index]
-                        start_color, end_color = segment
-                    else:
-
-                        start_color, end_color = gradient_data
-                    
-
-                    gradient_speed = 3  
-                    segment_length = 50  
-                    t = (frame // gradient_speed) % segment_length / segment_length
-
-                    rgb_color = tuple(int(start_c + (end_c - start_c) * t) for start_c, end_c in zip(start_color, end_color))
-
-                    bgr_color = (rgb_color[2], rgb_color[1], rgb_color[0])
-                    return bgr_color
-                else:
-
-                    return (255, 0, 0)
-            
-
             self.gradient_frame += 1
             
 
-            if self.points:
-                current_color = get_current_snake_color(self.gradient_frame)
-                for i, point in enumerate(self.points):
-                     if i != 0:
-                        self.points[i-1] = tuple(self.points[i-1])
-                        self.points[i] = tuple(self.points[i])
-                        cv2.line(imgMain, self.points[i - 1], self.points[i], current_color, 20)
+            if self.trail:
+                current_color = self.get_current_snake_color(self.gradient_frame)
+                head_color = tuple(max(0, c - 30) for c in current_color[:3])
+                self.body_renderer.draw(imgMain, self.trail.points, current_color, head_color)
 
-                self.points[-1] = tuple(self.points[-1])
 
-                head_color = current_color
-                if isinstance(head_color, tuple) and len(head_color) >= 3:
-
-                    head_color = tuple(max(0, c - 30) for c in head_color[:3])
-                cv2.circle(imgMain, self.points[-1], 20, head_color, cv2.FILLED)
-
-
-            imgMain = cvzone.overlayPNG(imgMain, self.imgFood, (rx - self.wFood // 2, ry - self.hFood // 2))
-            
-
-            for obstacle_pos in self.obstacles:
-                ox, oy = obstacle_pos
-                imgMain = cvzone.overlayPNG(imgMain, self.imgObstacle, (ox - self.wObstacle // 2, oy - self.hObstacle // 2))
+            # 食物和障碍物用预乘alpha的精灵一次性原地绘制
+            blit_sprites(imgMain, [(self.spriteFood, (rx - self.wFood // 2, ry - self.hFood // 2))] +
+                         [(self.spriteObstacle, (ox - self.wObstacle // 2, oy - self.hObstacle // 2)) for ox, oy in self.obstacles])
 
 
             try:
@@ -596,9 +512,9 @@ class SnakeGame:
                 # 初始位置特殊处理：如果是游戏开始后的第一个位置，跳过碰撞检测
                 # 只有当蛇有足够长度且不是初始位置时才进行碰撞检测
                 # 添加更多安全检查：确保屏幕尺寸有效，且蛇头位置有效
-                # 游戏刚启动时，self.points列表长度会很快增加到2，所以需要额外的初始位置保护
-                is_initial_position = (len(self.points) == 2 and self.currentLength <= self.base_allowed_length + 10)
-                if len(self.points) > 2 and not is_initial_position and self.previousHead is not None and screen_width > 0 and screen_height > 0:  # 确保蛇有足够长度且不是初始位置
+                # 游戏刚启动时，蛇身的点数会很快增加到2，所以需要额外的初始位置保护
+                is_initial_position = (len(self.trail) == 2 and self.trail.length <= self.base_allowed_length + 10)
+                if len(self.trail) > 2 and not is_initial_position and self.previousHead is not None and screen_width > 0 and screen_height > 0:  # 确保蛇有足够长度且不是初始位置
                     # 检查cx和cy是否有效（不为默认的0,0），防止未检测到手部时触发边缘检测
                     if (cx != 0 or cy != 0):
                         # 正常的边缘检测逻辑
@@ -0,0 +1,145 @@
+import os
+
+import cv2
+
+from game.utils.sprite import Sprite
+
+# 图片资源目录：项目根目录下的 resources/assets/images
+ASSET_IMAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "resources", "assets", "images")
+
+
+class AssetManager:
+    """
+    图片资源管理器。
+    每张图片只解码一次，按目标尺寸缩放后的结果也会缓存，之后的每一帧直接复用。
+    返回的数组是只读的，调用方需要在图片上绘制时传copy=True拿到可写的副本。
+    按屏幕尺寸缩放的图片在屏幕尺寸变化时自动失效。
+    """
+
+    def __init__(self, base_dir=ASSET_IMAGE_DIR):
+        self.base_dir = base_dir
+        # 键为(路径, 读取标志, 是否带alpha通道)，值为解码后的只读数组，文件不存在时为None
+        self._decoded = {}
+        # 键为(路径, 读取标志, 是否带alpha通道, (宽, 高))，值为缩放后的只读数组
+        self._resized = {}
+        # 键为(路径, (宽, 高))，值为预乘alpha的精灵
+        self._sprites = {}
+        self._screen_size = None
+        self._screen_keys = set()
+
+        # 统计信息
+        self.decodes = 0
+        self.resizes = 0
+        self.hits = 0
+
+    def resolve(self, name):
+        """资源名转换为文件路径，绝对路径或带目录的相对路径保持不变"""
+        if os.path.isabs(name) or os.path.dirname(name):
+            return os.path.normpath(name)
+        return os.path.join(self.base_dir, name)
+
+    @staticmethod
+    def _freeze(img):
+        img.flags.writeable = False
+        return img
+
+    def load(self, name, flags=cv2.IMREAD_UNCHANGED, alpha=False):
+        """
+        返回原始尺寸的只读图片，文件不存在或无法解码时返回None。
+        alpha为True时把三通道图片转换为BGRA。
+        """
+        path = self.resolve(name)
+        key = (path, flags, alpha)
+        if key in self._decoded:
+            self.hits += 1
+            return self._decoded[key]
+
+        img = None
+        if alpha:
+            img = self.load(path, flags)
+            if img is not None and img.ndim == 3 and img.shape[2] == 3:
+                img = self._freeze(cv2.cvtColor(img, cv2.COLOR_BGR2BGRA))
+        elif os.path.exists(path):
+            img = cv2.imread(path, flags)
+            self.decodes += 1
+            if img is None:
+                print(f"图片解码失败: {path}")
+            else:
+                self._freeze(img)
+        self._decoded[key] = img
+        return img
+
+    def get(self, name, size=None, scale=None, flags=cv2.IMREAD_UNCHANGED, alpha=False, copy=False):
+        """
+        返回缩放到size(宽, 高)或按scale比例缩放的图片，缩放结果会被缓存。
+        默认返回只读数组，copy为True时返回可写的副本。文件不存在时返回None。
+        """
+        img = self.load(name, flags, alpha)
+        if img is None:
+            return None
+        if scale is not None:
+            size = (int(img.shape[1] * scale), int(img.shape[0] * scale))
+        if size is not None and (img.shape[1], img.shape[0]) != tuple(size):
+            key = (self.resolve(name), flags, alpha, tuple(size))
+            resized = self._resized.get(key)
+            if resized is None:
+                resized = self._freeze(cv2.resize(img, tuple(size)))
+                self._resized[key] = resized
+                self.resizes += 1
+            else:
+                self.hits += 1
+            img = resized
+        return img.copy() if copy else img
+
+    def get_sprite(self, name, size=None, scale=None):
+        """返回用于绘制的精灵Sprite，预乘alpha只在第一次取用时计算，文件不存在时返回None"""
+        img = self.get(name, size=size, scale=scale, alpha=True)
+        if img is None:
+            return None
+        key = (self.resolve(name), (img.shape[1], img.shape[0]))
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = Sprite(img)
+            self._sprites[key] = sprite
+        return sprite
+
+    def get_screen(self, name, screen_size, flags=cv2.IMREAD_COLOR, copy=False):
+        """返回缩放到屏幕尺寸的图片，屏幕尺寸变化时之前缩放的结果会被释放"""
+        screen_size = tuple(screen_size)
+        if screen_size != self._screen_size:
+            self.invalidate_screen()
+            self._screen_size = screen_size
+        self._screen_keys.add((self.resolve(name), flags, False, screen_size))
+        return self.get(name, size=screen_size, flags=flags, copy=copy)
+
+    def invalidate_screen(self):
+        """释放按屏幕尺寸缩放的图片"""
+        for key in self._screen_keys:
+            self._resized.pop(key, None)
+        self._screen_keys.clear()
+        self._screen_size = None
+
+    def clear(self):
+        """释放所有缓存的图片"""
+        self._decoded.clear()
+        self._resized.clear()
+        self._sprites.clear()
+        self._screen_keys.clear()
+        self._screen_size = None
+
+    def stats(self):
+        """返回缓存统计"""
+        return {
+            'decoded': sum(img is not None for img in self._decoded.values()),
+            'resized': len(self._resized),
+            'sprites': len(self._sprites),
+            'decodes': self.decodes,
+            'resizes': self.resizes,
+            'hits': self.hits,
+            'bytes': sum(img.nbytes for img in self._decoded.values() if img is not None)
+                     + sum(img.nbytes for img in self._resized.values()),
+        }
+
+
+# 全局资源管理器实例
+asset_manager = AssetManager()
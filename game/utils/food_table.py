@@ -0,0 +1,171 @@
+import numpy as np
+
+# 食物属性编码，properties列中保存的是下标
+PROPERTY_NAMES = ('none', 'bomb', 'color_change', 'speed_up', 'speed_down', 'freeze')
+PROPERTY_CODES = {name: code for code, name in enumerate(PROPERTY_NAMES)}
+NONE, BOMB, COLOR_CHANGE, SPEED_UP, SPEED_DOWN, FREEZE = range(len(PROPERTY_NAMES))
+
+
+class FoodTable:
+    """
+    食物表：每一列是一个NumPy数组，第i行是第i个食物，有效数据为前count行。
+    位置、颜色对、是否分数翻倍、年龄、属性编码分别存放，年龄可以一次性向量化更新；
+    删除时用最后一行填补被删除的行（不保持顺序），另外维护位置到行号的索引，按位置查找是O(1)。
+    """
+
+    def __init__(self, capacity=32):
+        self.count = 0
+        self.positions = np.zeros((capacity, 2), dtype=np.int32)
+        # colors[i]是(主颜色, 浅色)两个RGB颜色
+        self.colors = np.zeros((capacity, 2, 3), dtype=np.uint8)
+        self.double_score = np.zeros(capacity, dtype=bool)
+        self.ages = np.zeros(capacity, dtype=np.float64)
+        self.properties = np.zeros(capacity, dtype=np.uint8)
+        self._index = {}
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def _grow(self):
+        capacity = len(self.positions) * 2
+        for name in ('positions', 'colors', 'double_score', 'ages', 'properties'):
+            column = getattr(self, name)
+            grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            setattr(self, name, grown)
+
+    def add(self, pos, color, prop='none', double_score=False):
+        """添加一个食物，prop为属性名，返回所在的行号"""
+        if self.count == len(self.positions):
+            self._grow()
+        row = self.count
+        self.positions[row] = pos
+        self.colors[row] = color
+        self.double_score[row] = double_score
+        self.ages[row] = 0
+        self.properties[row] = PROPERTY_CODES[prop]
+        self._index[(int(pos[0]), int(pos[1]))] = row
+        self.count += 1
+        return row
+
+    def remove(self, row):
+        """删除第row行，用最后一行填补它的位置"""
+        last = self.count - 1
+        del self._index[self.position(row)]
+        if row != last:
+            for column in (self.positions, self.colors, self.double_score, self.ages, self.properties):
+                column[row] = column[last]
+            self._index[self.position(row)] = row
+        self.count = last
+
+    def clear(self):
+        self.count = 0
+        self._index.clear()
+
+    def find(self, pos):
+        """返回位于pos的食物的行号，没有时返回None"""
+        return self._index.get(pos)
+
+    def position(self, row):
+        return int(self.positions[row, 0]), int(self.positions[row, 1])
+
+    def color(self, row):
+        """返回第row行的颜色对((r, g, b), (r, g, b))"""
+        main, light = self.colors[row].tolist()
+        return tuple(main), tuple(light)
+
+    def property(self, row):
+        """返回第row行的属性名"""
+        return PROPERTY_NAMES[self.properties[row]]
+
+    def count_property(self, prop):
+        return int(np.count_nonzero(self.properties[:self.count] == PROPERTY_CODES[prop]))
+
+    def age(self, delta):
+        """所有食物的年龄增加delta"""
+        self.ages[:self.count] += delta
+
+    def rows(self):
+        """
+        返回绘制用的(位置列表, 主颜色列表, 是否分数翻倍列表)，都是Python列表，可以直接传给pygame。
+        """
+        n = self.count
+        return self.positions[:n].tolist(), self.colors[:n, 0].tolist(), self.double_score[:n].tolist()
+
+
+class BatchFoodTable:
+    """
+    多张食物表，列的第一维是表的编号，counts[b]是第b张表的食物数量。
+    增删和行的顺序与FoodTable完全相同（删除时用最后一行填补），年龄可以对所有表一次性更新。
+    """
+
+    def __init__(self, tables, capacity=32):
+        self.counts = np.zeros(tables, dtype=np.int64)
+        self.positions = np.zeros((tables, capacity, 2), dtype=np.int32)
+        self.colors = np.zeros((tables, capacity, 2, 3), dtype=np.uint8)
+        self.double_score = np.zeros((tables, capacity), dtype=bool)
+        self.ages = np.zeros((tables, capacity), dtype=np.float64)
+        self.properties = np.zeros((tables, capacity), dtype=np.uint8)
+        self._index = [{} for _ in range(tables)]
+
+    def __len__(self):
+        return len(self.counts)
+
+    def _grow(self):
+        capacity = self.positions.shape[1] * 2
+        for name in ('positions', 'colors', 'double_score', 'ages', 'properties'):
+            column = getattr(self, name)
+            grown = np.zeros((column.shape[0], capacity) + column.shape[2:], dtype=column.dtype)
+            grown[:, :column.shape[1]] = column
+            setattr(self, name, grown)
+
+    def add(self, table, pos, color, prop='none', double_score=False):
+        """在第table张表中添加一个食物，返回所在的行号"""
+        row = int(self.counts[table])
+        if row == self.positions.shape[1]:
+            self._grow()
+        self.positions[table, row] = pos
+        self.colors[table, row] = color
+        self.double_score[table, row] = double_score
+        self.ages[table, row] = 0
+        self.properties[table, row] = PROPERTY_CODES[prop]
+        self._index[table][(int(pos[0]), int(pos[1]))] = row
+        self.counts[table] = row + 1
+        return row
+
+    def remove(self, table, row):
+        last = int(self.counts[table]) - 1
+        index = self._index[table]
+        del index[self.position(table, row)]
+        if row != last:
+            for column in (self.positions, self.colors, self.double_score, self.ages, self.properties):
+                column[table, row] = column[table, last]
+            index[self.position(table, row)] = row
+        self.counts[table] = last
+
+    def clear(self, table):
+        self.counts[table] = 0
+        self._index[table].clear()
+
+    def find(self, table, pos):
+        return self._index[table].get(pos)
+
+    def position(self, table, row):
+        return int(self.positions[table, row, 0]), int(self.positions[table, row, 1])
+
+    def property(self, table, row):
+        return PROPERTY_NAMES[self.properties[table, row]]
+
+    def count_property(self, table, prop):
+        count = self.counts[table]
+        return int(np.count_nonzero(self.properties[table, :count] == PROPERTY_CODES[prop]))
+
+    def age(self, delta, tables=None):
+        """tables中的表（默认所有表）的所有食物年龄增加delta，超出counts的行不会被读取"""
+        if tables is None:
+            self.ages += delta
+        else:
+            self.ages[tables] += delta
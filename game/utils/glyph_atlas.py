@@ -0,0 +1,295 @@
+import numpy as np
+import pygame
+from PIL import Image, ImageDraw
+
+
+class AtlasGlyph:
+    """图集中的一个字符：在图集纹理中的位置、相对笔位置的包围盒和步进宽度"""
+
+    __slots__ = ('x', 'y', 'width', 'height', 'bbox', 'advance')
+
+    def __init__(self, x, y, width, height, bbox, advance):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.bbox = bbox
+        self.advance = advance
+
+
+class _ShelfPacker:
+    """
+    货架式矩形装箱：字符按行从左到右摆放，放不下时另起一行。
+    只负责分配位置，纹理的存储由具体的图集负责。
+    """
+
+    def __init__(self, width, padding=1):
+        self.width = width
+        self.padding = padding
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+    def allocate(self, width, height):
+        """分配一个width×height的位置，返回左上角坐标"""
+        padded_width = width + self.padding
+        if self.shelf_x + padded_width > self.width:
+            self.shelf_y += self.shelf_height
+            self.shelf_x = 0
+            self.shelf_height = 0
+        x, y = self.shelf_x, self.shelf_y
+        self.shelf_x += padded_width
+        self.shelf_height = max(self.shelf_height, height + self.padding)
+        return x, y
+
+    def reset(self):
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+
+class GlyphAtlas:
+    """
+    PIL字体的字符图集。
+    每个(字体, 字号)的字符只光栅化一次，灰度遮罩打包到同一张NumPy纹理中，
+    排版时直接从纹理切片取字符，不再调用FreeType。
+    纹理按需加高，超过max_height时清空重建。
+    """
+
+    def __init__(self, font, width=1024, max_height=2048, padding=1):
+        self.font = font
+        self.max_height = max_height
+        self._packer = _ShelfPacker(width, padding)
+        self.texture = np.zeros((64, width), dtype=np.uint8)
+        self._glyphs = {}
+        self.hits = 0
+        self.misses = 0
+        self.resets = 0
+
+    def __len__(self):
+        return len(self._glyphs)
+
+    def _grow(self, height):
+        """加高纹理到至少height，已有字符位置不变"""
+        new_height = self.texture.shape[0]
+        while new_height < height:
+            new_height *= 2
+        texture = np.zeros((new_height, self.texture.shape[1]), dtype=np.uint8)
+        texture[:self.texture.shape[0]] = self.texture
+        self.texture = texture
+
+    def reset(self):
+        """清空图集"""
+        self._glyphs.clear()
+        self._packer.reset()
+        self.texture[:] = 0
+        self.resets += 1
+
+    def get(self, char):
+        """获取字符在图集中的位置，未命中时光栅化并放入图集"""
+        glyph = self._glyphs.get(char)
+        if glyph is not None:
+            self.hits += 1
+            return glyph
+
+        self.misses += 1
+        try:
+            bbox = self.font.getbbox(char)
+        except AttributeError:
+            # 兼容旧版本Pillow
+            char_width, char_height = self.font.getsize(char)
+            bbox = (0, 0, char_width, char_height)
+        try:
+            advance = self.font.getlength(char)
+        except AttributeError:
+            advance = bbox[2]
+
+        width, height = bbox[2] - bbox[0], bbox[3] - bbox[1]
+        if width <= 0 or height <= 0:
+            glyph = AtlasGlyph(0, 0, 0, 0, bbox, advance)
+            self._glyphs[char] = glyph
+            return glyph
+
+        x, y = self._packer.allocate(width, height)
+        if y + height > self.max_height:
+            self.reset()
+            x, y = self._packer.allocate(width, height)
+        if y + height > self.texture.shape[0]:
+            self._grow(y + height)
+
+        mask = Image.new('L', (width, height), 0)
+        ImageDraw.Draw(mask).text((-bbox[0], -bbox[1]), char, font=self.font, fill=255)
+        self.texture[y:y + height, x:x + width] = np.asarray(mask)
+
+        glyph = AtlasGlyph(x, y, width, height, bbox, advance)
+        self._glyphs[char] = glyph
+        return glyph
+
+    def mask(self, glyph):
+        """返回字符在纹理中的遮罩切片"""
+        return self.texture[glyph.y:glyph.y + glyph.height, glyph.x:glyph.x + glyph.width]
+
+    def layout(self, text, advance_by_bbox=False):
+        """
+        排版字符串，返回[(字形, x, y, 字符序号)]和相对绘制原点的包围盒。
+        advance_by_bbox为True时按字符包围盒宽度步进（彩虹文字的排版方式）。
+        """
+        resets = self.resets
+        glyphs = [self.get(char) for char in text]
+        if self.resets != resets:
+            # 取字符的过程中图集被清空过，前面取到的位置已失效
+            glyphs = [self.get(char) for char in text]
+        placements = []
+        pen_x = 0.0
+        left = top = None
+        right = bottom = 0
+        for index, glyph in enumerate(glyphs):
+            gx = int(round(pen_x))
+            bbox = glyph.bbox
+            if glyph.width > 0:
+                placements.append((glyph, gx + bbox[0], bbox[1], index))
+                left = gx + bbox[0] if left is None else min(left, gx + bbox[0])
+                top = bbox[1] if top is None else min(top, bbox[1])
+                right = max(right, gx + bbox[2])
+                bottom = max(bottom, bbox[3])
+            pen_x += (bbox[2] - bbox[0]) if advance_by_bbox else glyph.advance
+        if left is None:
+            return placements, (0, 0, 0, 0)
+        return placements, (left, top, right, bottom)
+
+    def compose_mask(self, placements, bbox):
+        """把图集中的字符切片拼接为整个字符串的遮罩"""
+        left, top, right, bottom = bbox
+        mask = np.zeros((bottom - top, right - left), dtype=np.uint8)
+        for glyph, gx, gy, _ in placements:
+            region = mask[gy - top:gy - top + glyph.height, gx - left:gx - left + glyph.width]
+            np.maximum(region, self.mask(glyph), out=region)
+        return mask
+
+    def stats(self):
+        """返回图集统计"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'glyphs': len(self._glyphs),
+            'texture_height': self.texture.shape[0],
+            'resets': self.resets,
+        }
+
+
+class PygameGlyphAtlas:
+    """
+    pygame字体的字符图集，用于替代每帧调用font.render。
+    字符以白色抗锯齿方式渲染一次并打包到同一张带alpha的Surface中，
+    每种文字颜色缓存一张着色后的图集，绘制时用Surface.blits直接从图集切片贴到屏幕上。
+    """
+
+    def __init__(self, font, width=1024, max_height=2048, padding=1):
+        self.font = font
+        self.max_height = max_height
+        self.line_height = font.get_height()
+        self._packer = _ShelfPacker(width, padding)
+        self.texture = pygame.Surface((width, 64), pygame.SRCALPHA)
+        self._glyphs = {}
+        self._tinted = {}
+        self.hits = 0
+        self.misses = 0
+        self.resets = 0
+
+    def _grow(self, height):
+        """加高图集到至少height，同时加高已着色的图集"""
+        new_height = self.texture.get_height()
+        while new_height < height:
+            new_height *= 2
+        width = self.texture.get_width()
+        texture = pygame.Surface((width, new_height), pygame.SRCALPHA)
+        texture.blit(self.texture, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        self.texture = texture
+        for color, tinted in list(self._tinted.items()):
+            grown = pygame.Surface((width, new_height), pygame.SRCALPHA)
+            grown.blit(tinted, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self._tinted[color] = grown
+
+    def reset(self):
+        """清空图集"""
+        self._glyphs.clear()
+        self._tinted.clear()
+        self._packer.reset()
+        self.texture.fill((0, 0, 0, 0))
+        self.resets += 1
+
+    def get(self, char):
+        """获取字符在图集中的区域，未命中时渲染并放入图集"""
+        glyph = self._glyphs.get(char)
+        if glyph is not None:
+            self.hits += 1
+            return glyph
+
+        self.misses += 1
+        glyph_surface = self.font.render(char, True, (255, 255, 255))
+        width, height = glyph_surface.get_size()
+        x, y = self._packer.allocate(width, height)
+        if y + height > self.max_height:
+            self.reset()
+            x, y = self._packer.allocate(width, height)
+        if y + height > self.texture.get_height():
+            self._grow(y + height)
+
+        # 目标区域是全透明的，用BLEND_RGBA_MAX原样拷贝像素，避免alpha混合使边缘变暗
+        self.texture.blit(glyph_surface, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        area = pygame.Rect(x, y, width, height)
+        # 已着色的图集只需补上这个新字符
+        for color, tinted in self._tinted.items():
+            tinted.blit(glyph_surface, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            tinted.fill(color, area, special_flags=pygame.BLEND_RGBA_MULT)
+
+        glyph = (area, width)
+        self._glyphs[char] = glyph
+        return glyph
+
+    def _get_tinted(self, color):
+        color = tuple(color[:3]) + (255,)
+        tinted = self._tinted.get(color)
+        if tinted is None:
+            tinted = self.texture.copy()
+            tinted.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+            self._tinted[color] = tinted
+        return tinted
+
+    def size(self, text):
+        """测量文本尺寸(宽, 高)，与font.size的含义相同"""
+        return sum(self.get(char)[1] for char in text), self.line_height
+
+    def draw(self, surface, text, color, topleft=None, center=None):
+        """
+        在surface上绘制文本，位置可以用topleft或center指定，返回文本占用的Rect。
+        """
+        resets = self.resets
+        glyphs = [self.get(char) for char in text]
+        if self.resets != resets:
+            # 取字符的过程中图集被清空过，前面取到的位置已失效
+            glyphs = [self.get(char) for char in text]
+        tinted = self._get_tinted(color)
+        rect = pygame.Rect(0, 0, sum(advance for _, advance in glyphs), self.line_height)
+        if center is not None:
+            rect.center = (int(center[0]), int(center[1]))
+        elif topleft is not None:
+            rect.topleft = (int(topleft[0]), int(topleft[1]))
+
+        x = rect.x
+        blit_sequence = []
+        for area, advance in glyphs:
+            blit_sequence.append((tinted, (x, rect.y), area))
+            x += advance
+        surface.blits(blit_sequence, doreturn=False)
+        return rect
+
+    def stats(self):
+        """返回图集统计"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'glyphs': len(self._glyphs),
+            'tinted': len(self._tinted),
+            'resets': self.resets,
+        }
@@ -2,10 +2,26 @@ import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import os
+from collections import OrderedDict
+from game.utils.text_sprite_cache import TextSpriteCache
+
+# 字体路径只解析一次，之后直接复用结果
+_UNRESOLVED = object()
+_resolved_font_path = _UNRESOLVED
 
 def get_font_path():
     """
     获取中文字体路径。
+    首次调用时扫描字体目录并缓存结果，之后的调用不再访问磁盘。
+    """
+    global _resolved_font_path
+    if _resolved_font_path is _UNRESOLVED:
+        _resolved_font_path = _find_font_path()
+    return _resolved_font_path
+
+def _find_font_path():
+    """
+    扫描中文字体路径。
     首先尝试从fonts目录获取，如果不存在则尝试从系统字体目录获取。
     """
 
@@ -93,12 +109,10 @@ def get_font_path():
 
     return None
 
-def _get_font(font_size):
+def _load_font(font_path, font_size):
     """
-    加载指定大小的字体，如果失败则返回Pillow的默认字体。
+    从磁盘加载指定大小的字体，如果失败则返回Pillow的默认字体。
     """
-
-    font_path = get_font_path()
     if font_path:
         try:
             return ImageFont.truetype(font_path, font_size)
@@ -125,34 +139,111 @@ def _get_font(font_size):
 
     return ImageFont.load_default()
 
-def put_chinese_text_pil(img, text, position, font_size, color):
+class FontRegistry:
     """
-    使用PIL在图像上绘制中文文本。
+    进程级字体缓存，按(字体路径, 字号)缓存ImageFont对象。
+    超出容量时淘汰最久未使用的字体，hits/misses用于确认稳定帧不再有字体I/O。
     """
-    try:
 
-        img_pil = Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
-        draw = ImageDraw.Draw(img_pil)
-        
+    def __init__(self, max_fonts=32):
+        self.max_fonts = max_fonts
+        self._fonts = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, font_path, font_size):
+        """获取字体，未命中时从磁盘加载并放入缓存"""
+        key = (font_path, font_size)
+        font = self._fonts.get(key)
+        if font is not None:
+            self._fonts.move_to_end(key)
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        font = _load_font(font_path, font_size)
+        self._fonts[key] = font
+        if len(self._fonts) > self.max_fonts:
+            self._fonts.popitem(last=False)
+        return font
+
+    def stats(self):
+        """返回缓存命中统计"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._fonts),
+            'capacity': self.max_fonts,
+        }
+
+    def reset_stats(self):
+        """清零命中计数，便于统计某一段时间内的字体加载次数"""
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """清空缓存的字体"""
+        self._fonts.clear()
+
+font_registry = FontRegistry()
+text_sprite_cache = TextSpriteCache()
 
-        font = _get_font(font_size)
-        
+def _get_font(font_size):
+    """
+    从进程级字体缓存中获取指定大小的字体。
+    """
+    return font_registry.get(get_font_path(), font_size)
 
-        rgb_color = (color[2], color[1], color[0])
-        
-        # 测量文本尺寸
-        try:
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-        except AttributeError:
-            text_width, text_height = draw.textsize(text, font=font)
-        
-        draw.text(position, text, font=font, fill=rgb_color)
-        
-
-        img_result = cv2.cvtColor(np.array(img_pil), cv2.COLOR_RGB2BGR)
-        return img_result, (text_width, text_height)
+def get_font_cache_stats():
+    """
+    获取字体缓存的命中统计。
+    """
+    return font_registry.stats()
+
+def get_text_sprite_stats():
+    """
+    获取文本精灵缓存的命中统计。
+    """
+    return text_sprite_cache.stats()
+
+# 文本尺寸缓存，键为(字体路径, 字号, 文本)
+_TEXT_SIZE_CACHE_LIMIT = 2048
+_text_size_cache = OrderedDict()
+
+def get_chinese_text_size(text, font_size):
+    """
+    测量文本尺寸(宽, 高)，结果按(字号, 文本)缓存，不创建任何图像。
+    """
+    font_path = get_font_path()
+    key = (font_path, font_size, text)
+    size = _text_size_cache.get(key)
+    if size is not None:
+        _text_size_cache.move_to_end(key)
+        return size
+
+    size = text_sprite_cache.measure(font_registry.get(font_path, font_size), (font_path, font_size), text)
+    _text_size_cache[key] = size
+    if len(_text_size_cache) > _TEXT_SIZE_CACHE_LIMIT:
+        _text_size_cache.popitem(last=False)
+    return size
+
+def get_chinese_text_sizes(texts, font_size):
+    """
+    批量测量同一字号的多个文本，返回与texts顺序一致的尺寸列表，供布局代码一次取得所有尺寸。
+    """
+    return [get_chinese_text_size(text, font_size) for text in texts]
+
+def put_chinese_text_pil(img, text, position, font_size, color):
+    """
+    使用PIL在图像上绘制中文文本。
+    文本精灵按(文本, 字号, 颜色)缓存，稳定帧只在图像对应区域做一次混合，不再调用FreeType。
+    """
+    try:
+        font_path = get_font_path()
+        font = font_registry.get(font_path, font_size)
+        sprite = text_sprite_cache.get_text_sprite(font, (font_path, font_size), text, color[:3])
+        sprite.blit(img, position)
+        return img, sprite.text_size
     except Exception as e:
         print(f"绘制文本错误: {e}")
 
@@ -170,79 +261,31 @@ def put_chinese_text_pil(img, text, position, font_size, color):
 def put_chinese_text_with_background(img, text, position, font_size, text_color, bg_color, bg_opacity=0.6):
     """
     在带背景的图像上绘制中文文本。
+    背景框和文字合成为一个缓存的精灵，只在文本框区域内原地混合。
     """
+    font_path = get_font_path()
+    font = font_registry.get(font_path, font_size)
+    sprite = text_sprite_cache.get_background_sprite(font, (font_path, font_size), text,
+                                                     text_color[:3], bg_color[:3], bg_opacity)
+    sprite.blit(img, position)
+    return img
 
-    img_pil = Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB)).convert('RGBA')
-    
-
-    txt_layer = Image.new('RGBA', img_pil.size, (255, 255, 255, 0))
-    draw = ImageDraw.Draw(txt_layer)
-    
-
-    font = _get_font(font_size)
-    
-
-    try:
-        bbox = draw.textbbox(position, text, font=font)
-    except AttributeError: 
-        text_width, text_height = draw.textsize(text, font=font)
-        bbox = (position[0], position[1], position[0] + text_width, position[1] + text_height)
-
-
-    bg_position = (bbox[0] - 5, bbox[1] - 5, bbox[2] + 5, bbox[3] + 5)
-
-    rgb_bg_color = (bg_color[2], bg_color[1], bg_color[0])
-    bg_color_rgba = rgb_bg_color + (int(255 * bg_opacity),)
-    draw.rectangle(bg_position, fill=bg_color_rgba)
-    
-
-
-    rgb_text_color = (text_color[2], text_color[1], text_color[0])
-    draw.text(position, text, font=font, fill=rgb_text_color)
-    
-
-    out = Image.alpha_composite(img_pil, txt_layer)
-    
-
-    return cv2.cvtColor(np.array(out.convert('RGB')), cv2.COLOR_RGB2BGR)
+# 彩虹色(RGB)，转换为BGR顺序以便直接与OpenCV图像混合
+_RAINBOW_COLORS = [(255, 0, 0), (255, 165, 0), (255, 255, 0),
+                   (0, 255, 0), (0, 0, 255), (75, 0, 130), (238, 130, 238)]
+_RAINBOW_COLORS_BGR = tuple((b, g, r) for r, g, b in _RAINBOW_COLORS)
 
 def put_rainbow_text_pil(img, text, position, font_size):
     """
     使用PIL在图像上绘制彩虹色中文文本。
+    每个字按顺序循环使用彩虹色，整段文字作为一个精灵缓存。
     """
     try:
-
-        img_pil = Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
-        draw = ImageDraw.Draw(img_pil)
-        
-
-        font = _get_font(font_size)
-        
-
-        rainbow_colors = [(255, 0, 0), (255, 165, 0), (255, 255, 0), 
-                          (0, 255, 0), (0, 0, 255), (75, 0, 130), (238, 130, 238)]
-        
-
-        x, y = position
-        try:
-
-            for i, char in enumerate(text):
-                char_color = rainbow_colors[i % len(rainbow_colors)]
-
-                char_bbox = draw.textbbox((0, 0), char, font=font)
-                char_width = char_bbox[2] - char_bbox[0]
-                draw.text((x, y), char, font=font, fill=char_color)
-                x += char_width
-        except Exception:
-
-            char_width = font_size 
-            for i, char in enumerate(text):
-                char_color = rainbow_colors[i % len(rainbow_colors)]
-                char_position = (position[0] + i * char_width, position[1])
-                draw.text(char_position, char, font=font, fill=char_color)
-
-
-        return cv2.cvtColor(np.array(img_pil), cv2.COLOR_RGB2BGR)
+        font_path = get_font_path()
+        font = font_registry.get(font_path, font_size)
+        sprite = text_sprite_cache.get_rainbow_sprite(font, (font_path, font_size), text, _RAINBOW_COLORS_BGR)
+        sprite.blit(img, position)
+        return img
     except Exception as e:
         print(f"绘制彩虹文本错误: {e}")
 
@@ -0,0 +1,192 @@
+import random
+
+import numpy as np
+
+# 格子的占用类型
+EMPTY = 0
+SNAKE = 1
+FOOD = 2
+OTHER_FOOD = 3
+OBSTACLE = 4
+
+
+class OccupancyGrid:
+    """
+    网格占用表。
+    cells[y, x]记录每个格子的占用类型，另外维护一个空闲格子列表和每个格子在列表中的下标，
+    占用和释放都是O(1)（与列表末尾交换后删除），随机取一个空闲格子也是O(1)，
+    不需要反复随机再检查是否与蛇身、食物、障碍物重叠。
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.cells = np.zeros((height, width), dtype=np.uint8)
+        # _free[:_free_count]是空闲格子的编号(y * width + x)，_slots[编号]是它在_free中的位置
+        self._free = np.arange(width * height, dtype=np.int32)
+        self._slots = np.arange(width * height, dtype=np.int32)
+        self._free_count = width * height
+
+    def clear(self):
+        self.cells.fill(EMPTY)
+        self._free[:] = np.arange(self.width * self.height, dtype=np.int32)
+        self._slots[:] = self._free
+        self._free_count = self.width * self.height
+
+    @property
+    def free_count(self):
+        return self._free_count
+
+    def in_bounds(self, pos):
+        return 0 <= pos[0] < self.width and 0 <= pos[1] < self.height
+
+    def kind(self, pos):
+        """返回格子的占用类型，超出网格时返回None"""
+        if not self.in_bounds(pos):
+            return None
+        return int(self.cells[pos[1], pos[0]])
+
+    def is_free(self, pos):
+        return self.in_bounds(pos) and self.cells[pos[1], pos[0]] == EMPTY
+
+    def set(self, pos, kind):
+        """设置格子的占用类型，同步维护空闲格子列表"""
+        x, y = pos
+        previous = self.cells[y, x]
+        if previous == kind:
+            return
+        self.cells[y, x] = kind
+        cell = y * self.width + x
+        if previous == EMPTY:
+            # 与空闲列表的最后一个交换后删除
+            slot = self._slots[cell]
+            last = self._free[self._free_count - 1]
+            self._free[slot] = last
+            self._slots[last] = slot
+            self._free_count -= 1
+        elif kind == EMPTY:
+            self._free[self._free_count] = cell
+            self._slots[cell] = self._free_count
+            self._free_count += 1
+
+    def release(self, pos):
+        """把格子标记为空闲"""
+        self.set(pos, EMPTY)
+
+    def sample_free(self, rng=random, avoid=None, min_distance=0, attempts=16):
+        """
+        随机返回一个空闲格子(x, y)，没有空闲格子时返回None。
+        avoid和min_distance可以要求与某个格子的曼哈顿距离不小于min_distance。
+        先直接随机抽取，连续attempts次不满足条件时再从所有空闲格子中筛选。
+        rng默认使用random模块，设置random.seed后结果可以复现。
+        """
+        if self._free_count == 0:
+            return None
+        for _ in range(attempts):
+            cell = int(self._free[rng.randrange(self._free_count)])
+            pos = (cell % self.width, cell // self.width)
+            if avoid is None or abs(pos[0] - avoid[0]) + abs(pos[1] - avoid[1]) >= min_distance:
+                return pos
+        cells = self._free[:self._free_count]
+        xs, ys = cells % self.width, cells // self.width
+        candidates = cells[np.abs(xs - avoid[0]) + np.abs(ys - avoid[1]) >= min_distance]
+        if len(candidates) == 0:
+            return None
+        cell = int(candidates[rng.randrange(len(candidates))])
+        return cell % self.width, cell // self.width
+
+
+class BatchOccupancyGrid:
+    """
+    多个同样大小的网格占用表，cells[b, y, x]是第b个网格的格子。
+    每个网格的空闲列表与OccupancyGrid的维护方式完全相同，因此在同一个随机数序列下抽取到的格子也相同。
+    set_many/release_many一次修改多个网格（每个网格一个格子），供批量模拟每一步的蛇头和蛇尾使用。
+    """
+
+    def __init__(self, count, width, height):
+        self.count = count
+        self.width = width
+        self.height = height
+        self.cells = np.zeros((count, height, width), dtype=np.uint8)
+        self._free = np.tile(np.arange(width * height, dtype=np.int32), (count, 1))
+        self._slots = self._free.copy()
+        self.free_counts = np.full(count, width * height, dtype=np.int64)
+
+    def clear(self, board):
+        self.cells[board].fill(EMPTY)
+        self._free[board] = np.arange(self.width * self.height, dtype=np.int32)
+        self._slots[board] = self._free[board]
+        self.free_counts[board] = self.width * self.height
+
+    def kind(self, board, pos):
+        """返回第board个网格中格子的占用类型，超出网格时返回None"""
+        if not (0 <= pos[0] < self.width and 0 <= pos[1] < self.height):
+            return None
+        return int(self.cells[board, pos[1], pos[0]])
+
+    def set(self, board, pos, kind):
+        """设置第board个网格中格子的占用类型，与OccupancyGrid.set相同"""
+        x, y = pos
+        cells = self.cells[board]
+        previous = cells.item(y, x)
+        if previous == kind:
+            return
+        cells[y, x] = kind
+        cell = y * self.width + x
+        free, slots = self._free[board], self._slots[board]
+        free_count = self.free_counts.item(board)
+        if previous == EMPTY:
+            slot = slots.item(cell)
+            last = free.item(free_count - 1)
+            free[slot] = last
+            slots[last] = slot
+            self.free_counts[board] = free_count - 1
+        elif kind == EMPTY:
+            free[free_count] = cell
+            slots[cell] = free_count
+            self.free_counts[board] = free_count + 1
+
+    def release(self, board, pos):
+        self.set(board, pos, EMPTY)
+
+    def set_many(self, boards, xs, ys, kind):
+        """
+        把boards[i]号网格的(xs[i], ys[i])设置为kind（kind不能是EMPTY），boards中不能有重复的网格。
+        """
+        previous = self.cells[boards, ys, xs]
+        self.cells[boards, ys, xs] = kind
+        was_free = previous == EMPTY
+        boards, cells = boards[was_free], (ys * self.width + xs)[was_free]
+        slots = self._slots[boards, cells]
+        last = self._free[boards, self.free_counts[boards] - 1]
+        self._free[boards, slots] = last
+        self._slots[boards, last] = slots
+        self.free_counts[boards] -= 1
+
+    def release_many(self, boards, xs, ys):
+        """把boards[i]号网格的(xs[i], ys[i])标记为空闲，这些格子必须都已被占用，boards中不能有重复的网格"""
+        self.cells[boards, ys, xs] = EMPTY
+        cells = ys * self.width + xs
+        counts = self.free_counts[boards]
+        self._free[boards, counts] = cells
+        self._slots[boards, cells] = counts
+        self.free_counts[boards] += 1
+
+    def sample_free(self, board, rng=random, avoid=None, min_distance=0, attempts=16):
+        """与OccupancyGrid.sample_free相同，在第board个网格中随机返回一个空闲格子"""
+        free_count = int(self.free_counts[board])
+        if free_count == 0:
+            return None
+        free = self._free[board]
+        for _ in range(attempts):
+            cell = int(free[rng.randrange(free_count)])
+            pos = (cell % self.width, cell // self.width)
+            if avoid is None or abs(pos[0] - avoid[0]) + abs(pos[1] - avoid[1]) >= min_distance:
+                return pos
+        cells = free[:free_count]
+        xs, ys = cells % self.width, cells // self.width
+        candidates = cells[np.abs(xs - avoid[0]) + np.abs(ys - avoid[1]) >= min_distance]
+        if len(candidates) == 0:
+            return None
+        cell = int(candidates[rng.randrange(len(candidates))])
+        return cell % self.width, cell // self.width
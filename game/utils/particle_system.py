@@ -0,0 +1,193 @@
+import cv2
+import numpy as np
+import pygame
+
+
+class ParticleSystem:
+    """
+    粒子系统：所有粒子的位置、速度、剩余寿命、起止颜色和大小保存在预先分配的NumPy数组里，
+    存活的粒子始终是数组的前count个，按发射顺序排列（最旧的在前）。
+    每帧对所有粒子做一次向量化更新，绘制时按半径分组计算覆盖的像素，重叠处按发射顺序取最新的粒子，一次性写入图像，
+    不再为每个粒子创建对象和调用cv2.circle。粒子数超过capacity时丢弃最旧的粒子。
+    """
+
+    def __init__(self, capacity=4096, seed=None):
+        self.capacity = capacity
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float64)
+        self.gravity = np.zeros(capacity, dtype=np.float64)
+        self.lifespans = np.zeros(capacity, dtype=np.int32)
+        self.initial_lifespans = np.ones(capacity, dtype=np.int32)
+        self.start_colors = np.zeros((capacity, 3), dtype=np.float64)
+        self.end_colors = np.zeros((capacity, 3), dtype=np.float64)
+        self.colors = np.zeros((capacity, 3), dtype=np.float64)
+        self.sizes = np.zeros(capacity, dtype=np.float64)
+        self._columns = ('positions', 'velocities', 'gravity', 'lifespans', 'initial_lifespans',
+                         'start_colors', 'end_colors', 'colors', 'sizes')
+        # 半径到实心圆像素偏移(dy, dx)的缓存，形状与cv2.circle画出的实心圆相同
+        self._discs = {}
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def _reserve(self, count):
+        """为count个新粒子腾出位置，返回写入的起始下标和实际写入的数量"""
+        count = min(count, self.capacity)
+        overflow = self.count + count - self.capacity
+        if overflow > 0:
+            # 丢弃最旧的粒子
+            for name in self._columns:
+                column = getattr(self, name)
+                column[:self.count - overflow] = column[overflow:self.count]
+            self.count -= overflow
+        return self.count, count
+
+    def emit(self, pos, velocities, colors, life_range, size_range, gravity):
+        """
+        在pos处发射len(velocities)个粒子，velocities为(n, 2)的速度数组，
+        colors为(起始颜色, 结束颜色)的列表，每个粒子随机选择一对。
+        """
+        start, count = self._reserve(len(velocities))
+        if count == 0:
+            return
+        end = start + count
+        palette = np.asarray(colors, dtype=np.float64).reshape(-1, 2, 3)
+        choice = self.rng.integers(len(palette), size=count)
+        self.positions[start:end] = pos
+        self.velocities[start:end] = velocities[-count:]
+        self.gravity[start:end] = gravity
+        lifespans = self.rng.integers(life_range[0], life_range[1] + 1, size=count)
+        self.lifespans[start:end] = lifespans
+        self.initial_lifespans[start:end] = np.maximum(lifespans, 1)
+        self.start_colors[start:end] = palette[choice, 0]
+        self.end_colors[start:end] = palette[choice, 1]
+        self.colors[start:end] = palette[choice, 0]
+        self.sizes[start:end] = self.rng.uniform(size_range[0], size_range[1], size=count)
+        self.count = end
+
+    def emit_burst(self, count, pos, colors, vel_range=(-4, 4), life_range=(30, 60), size_range=(3, 8), grav=0.02):
+        """径向速度的爆炸粒子：方向均匀分布，速率在vel_range内"""
+        angles = self.rng.uniform(0, 2 * np.pi, size=count)
+        speeds = self.rng.uniform(vel_range[0], vel_range[1], size=count)
+        velocities = np.stack((speeds * np.cos(angles), speeds * np.sin(angles)), axis=1)
+        self.emit(pos, velocities, colors, life_range, size_range, grav)
+
+    def emit_trail(self, count, pos, colors, vel_range=(-2, 2), life_range=(20, 40), size_range=(2, 5), grav=0.02):
+        """拖尾粒子：x、y方向的速度分别在vel_range内均匀分布"""
+        velocities = self.rng.uniform(vel_range[0], vel_range[1], size=(count, 2))
+        self.emit(pos, velocities, colors, life_range, size_range, grav)
+
+    def update(self):
+        """所有粒子前进一帧：移动、受重力加速、寿命减一，颜色向结束颜色渐变，大小随寿命缩小"""
+        n = self.count
+        if n == 0:
+            return
+        self.positions[:n] += self.velocities[:n]
+        self.velocities[:n, 1] += self.gravity[:n]
+        self.lifespans[:n] -= 1
+        life_ratio = np.maximum(0, self.lifespans[:n] / self.initial_lifespans[:n])
+        end_colors = self.end_colors[:n]
+        self.colors[:n] = end_colors + (self.start_colors[:n] - end_colors) * life_ratio[:, None]
+        self.sizes[:n] = np.maximum(0, self.sizes[:n] * life_ratio)
+
+    def remove_dead(self):
+        """移除寿命耗尽的粒子，保持存活粒子的顺序"""
+        n = self.count
+        alive = self.lifespans[:n] > 0
+        kept = int(np.count_nonzero(alive))
+        if kept == n:
+            return
+        for name in self._columns:
+            column = getattr(self, name)
+            column[:kept] = column[:n][alive]
+        self.count = kept
+
+    def _disc(self, radius):
+        disc = self._discs.get(radius)
+        if disc is None:
+            canvas = np.zeros((2 * radius + 1, 2 * radius + 1), dtype=np.uint8)
+            cv2.circle(canvas, (radius, radius), radius, 1, cv2.FILLED)
+            dy, dx = np.nonzero(canvas)
+            disc = (dy - radius, dx - radius)
+            self._discs[radius] = disc
+        return disc
+
+    def _splat(self, pixels, width, height, transpose=False, alpha=None, min_radius=0):
+        """
+        把存活粒子写入pixels，pixels为[y, x]（transpose为True时为[x, y]）索引的三通道数组。
+        alpha不为None时同样索引的alpha通道也写为255，半径小于min_radius的粒子不绘制。
+        按半径分组计算覆盖的像素，重叠的像素取最新发射的粒子的颜色，与按发射顺序逐个绘制的结果相同。
+        """
+        n = self.count
+        visible = (self.lifespans[:n] > 0) & (self.sizes[:n] > 0)
+        if not visible.any():
+            return
+        centers = self.positions[:n][visible].astype(np.int64)
+        radii = self.sizes[:n][visible].astype(np.int64)
+        colors = self.colors[:n][visible].astype(np.uint8)
+        count = len(radii)
+        keys = []
+        for radius in np.unique(radii):
+            if radius < min_radius:
+                continue
+            members = np.flatnonzero(radii == radius)
+            dy, dx = self._disc(int(radius))
+            ys = centers[members, 1, None] + dy
+            xs = centers[members, 0, None] + dx
+            inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+            # 排序键：像素下标为主键，同一像素内越新的粒子越靠前
+            keys.append(((ys * width + xs) * count + (count - 1 - members[:, None]))[inside])
+        if not keys:
+            return
+        keys = np.sort(np.concatenate(keys))
+        pixel = keys // count
+        newest = np.ones(len(keys), dtype=bool)
+        np.not_equal(pixel[1:], pixel[:-1], out=newest[1:])
+        keys, pixel = keys[newest], pixel[newest]
+        ys, xs = pixel // width, pixel % width
+        if transpose:
+            xs, ys = ys, xs
+        pixels[ys, xs] = colors[count - 1 - keys % count]
+        if alpha is not None:
+            alpha[ys, xs] = 255
+
+    def draw(self, surface):
+        """绘制所有存活的粒子，surface可以是OpenCV图像或pygame.Surface"""
+        if self.count == 0:
+            return surface
+        if isinstance(surface, np.ndarray):
+            self._splat(surface, surface.shape[1], surface.shape[0])
+        elif isinstance(surface, pygame.Surface):
+            try:
+                pixels = pygame.surfarray.pixels3d(surface)
+                # 带alpha的Surface同时写入不透明的alpha，与pygame.draw.circle相同
+                alpha = pygame.surfarray.pixels_alpha(surface) if surface.get_flags() & pygame.SRCALPHA else None
+            except (ValueError, pygame.error):
+                # 不支持直接访问像素的Surface逐个绘制
+                pixels = alpha = None
+                self._draw_circles(surface)
+            else:
+                # pygame.draw.circle不绘制半径为0的圆
+                self._splat(pixels, surface.get_width(), surface.get_height(), transpose=True,
+                            alpha=alpha, min_radius=1)
+            del pixels, alpha
+        return surface
+
+    def _draw_circles(self, surface):
+        n = self.count
+        for (x, y), size, color, life in zip(self.positions[:n].tolist(), self.sizes[:n].tolist(),
+                                             self.colors[:n].astype(int).tolist(), self.lifespans[:n].tolist()):
+            if life > 0 and size > 0:
+                pygame.draw.circle(surface, color, (int(x), int(y)), int(size))
+
+    def update_and_draw(self, surface):
+        """更新一帧后绘制，再移除寿命耗尽的粒子"""
+        self.update()
+        self.draw(surface)
+        self.remove_dead()
+        return surface
@@ -0,0 +1,50 @@
+import math
+
+import cv2
+import numpy as np
+
+
+def build_gradient_lut(gradient_data, gradient_speed=3, segment_length=50):
+    """
+    预先计算渐变色在一个完整周期内每一帧的BGR颜色，返回形状为(周期, 3)的uint8数组。
+    gradient_data为(起始RGB, 结束RGB)或由多段这样的元组组成的列表（如彩虹），
+    第frame帧的颜色为lut[frame % len(lut)]，与逐帧插值计算的结果完全相同。
+    """
+    segments = gradient_data if isinstance(gradient_data, list) else [gradient_data]
+    period = math.lcm(len(segments), gradient_speed * segment_length)
+    lut = np.empty((period, 3), dtype=np.uint8)
+    for frame in range(period):
+        start_color, end_color = segments[frame % len(segments)]
+        t = (frame // gradient_speed) % segment_length / segment_length
+        rgb_color = [int(start_c + (end_c - start_c) * t) for start_c, end_c in zip(start_color, end_color)]
+        lut[frame] = rgb_color[::-1]
+    return lut
+
+
+class SnakeBodyRenderer:
+    """
+    蛇身渲染器。
+    蛇身的点转换为int32数组后只需一次cv2.polylines，Python开销与蛇的长度无关。
+    """
+
+    def __init__(self, thickness=20, head_radius=20):
+        self.thickness = thickness
+        self.head_radius = head_radius
+
+    @staticmethod
+    def _as_array(points):
+        return np.asarray(points, dtype=np.int32).reshape(-1, 2)
+
+    def _draw_head(self, img, points, color):
+        head = (int(points[-1, 0]), int(points[-1, 1]))
+        cv2.circle(img, head, self.head_radius, color, cv2.FILLED)
+
+    def draw(self, img, points, color, head_color=None):
+        """用同一种颜色绘制蛇身，head_color为None时蛇头与蛇身同色"""
+        points = self._as_array(points)
+        if len(points) == 0:
+            return img
+        if len(points) > 1:
+            cv2.polylines(img, [points], False, color, self.thickness)
+        self._draw_head(img, points, color if head_color is None else head_color)
+        return img
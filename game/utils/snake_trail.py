@@ -0,0 +1,93 @@
+import math
+
+import numpy as np
+
+
+class SnakeTrail:
+    """
+    蛇身轨迹：按顺序保存蛇身的点（第一个点是蛇尾，最后一个点是蛇头）和相邻两点之间的距离。
+    点和距离存放在预先分配的NumPy数组里，有效数据是其中连续的一段[start, end)：
+    新点写在末尾，从蛇尾裁剪只需移动start；写到数组末尾时把有效数据搬回开头或扩容，
+    每个点被搬动的次数有限，追加和裁剪均摊都是O(1)，并且points始终是连续的视图，可以直接用于绘制和碰撞检测。
+    """
+
+    def __init__(self, capacity=256):
+        self._points = np.empty((capacity, 2), dtype=np.int32)
+        # _segments[i]是第i个点到第i+1个点的距离
+        self._segments = np.empty(capacity, dtype=np.float64)
+        self._start = 0
+        self._end = 0
+        self.length = 0.0
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __bool__(self):
+        return self._end > self._start
+
+    @property
+    def points(self):
+        """蛇身各点的int32视图，形状为(点数, 2)，在下一次修改前有效"""
+        return self._points[self._start:self._end]
+
+    @property
+    def segment_lengths(self):
+        """相邻两点之间的距离，长度为点数-1"""
+        return self._segments[self._start:max(self._start, self._end - 1)]
+
+    @property
+    def head(self):
+        """蛇头坐标(x, y)，没有点时返回None"""
+        if self._end == self._start:
+            return None
+        x, y = self._points[self._end - 1]
+        return int(x), int(y)
+
+    def _make_room(self):
+        count = self._end - self._start
+        capacity = len(self._points)
+        # 有效数据超过一半时扩容，否则只把数据搬回数组开头
+        if count * 2 > capacity:
+            capacity *= 2
+        points = np.empty((capacity, 2), dtype=np.int32) if capacity != len(self._points) else self._points
+        segments = np.empty(capacity, dtype=np.float64) if capacity != len(self._segments) else self._segments
+        points[:count] = self._points[self._start:self._end]
+        segments[:count] = self._segments[self._start:self._end]
+        self._points, self._segments = points, segments
+        self._start, self._end = 0, count
+
+    def append(self, x, y):
+        """在蛇头一端追加一个点，返回与上一个点的距离（第一个点返回0）"""
+        if self._end == len(self._points):
+            self._make_room()
+        distance = 0.0
+        if self._end > self._start:
+            px, py = self._points[self._end - 1]
+            distance = math.hypot(x - int(px), y - int(py))
+            self._segments[self._end - 1] = distance
+            self.length += distance
+        self._points[self._end] = (x, y)
+        self._end += 1
+        return distance
+
+    def trim(self, max_length):
+        """
+        总长度超过max_length时从蛇尾依次移除点，直到总长度小于max_length，返回移除的点数。
+        """
+        removed = 0
+        if self.length <= max_length:
+            return removed
+        while self._end - self._start > 1:
+            self.length -= self._segments[self._start]
+            self._start += 1
+            removed += 1
+            if self.length < max_length:
+                break
+        if self._end - self._start <= 1:
+            self.length = 0.0
+        return removed
+
+    def clear(self):
+        self._start = 0
+        self._end = 0
+        self.length = 0.0
@@ -0,0 +1,67 @@
+import cv2
+import numpy as np
+
+
+def clip_roi(img, x, y, width, height):
+    """
+    将(x, y, width, height)区域裁剪到图像范围内，返回图像区域和对应的贴图区域切片。
+    """
+    img_height, img_width = img.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + width, img_width), min(y + height, img_height)
+    if x0 >= x1 or y0 >= y1:
+        return None, None
+    return (slice(y0, y1), slice(x0, x1)), (slice(y0 - y, y1 - y), slice(x0 - x, x1 - x))
+
+
+class Sprite:
+    """
+    预乘alpha的图片精灵，用来代替cvzone.overlayPNG。
+    加载时算好预乘alpha的BGR和三通道的反向alpha，绘制时在裁剪后的图像区域上原地做整数混合：
+    roi = round(roi * inv_alpha / 255) + premultiplied，不再每帧重新提取alpha和做浮点运算。
+    """
+
+    __slots__ = ('premultiplied', 'inv_alpha', 'width', 'height', 'opaque')
+
+    def __init__(self, img):
+        img = np.ascontiguousarray(img)
+        self.height, self.width = img.shape[:2]
+        if img.ndim == 3 and img.shape[2] == 4:
+            alpha = img[:, :, 3:4].astype(np.uint16)
+            self.premultiplied = ((img[:, :, :3] * alpha + 127) // 255).astype(np.uint8)
+            self.inv_alpha = np.repeat(255 - img[:, :, 3:4], 3, axis=2)
+            self.opaque = not self.inv_alpha.any()
+        else:
+            # 没有alpha通道的图片直接拷贝
+            self.premultiplied = img if img.ndim == 3 else cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+            self.inv_alpha = None
+            self.opaque = True
+
+    def blit(self, img, position):
+        """将精灵原地混合到img上，position为左上角坐标，超出图像的部分会被裁掉"""
+        roi_slices, tile_slices = clip_roi(img, int(position[0]), int(position[1]), self.width, self.height)
+        if roi_slices is None:
+            return img
+        roi = img[roi_slices]
+        if self.opaque:
+            roi[:] = self.premultiplied[tile_slices]
+            return img
+        # saturate_cast按四舍五入取整，结果与(roi * inv_alpha + 127) // 255相同
+        cv2.multiply(roi, self.inv_alpha[tile_slices], dst=roi, scale=1 / 255)
+        cv2.add(roi, self.premultiplied[tile_slices], dst=roi)
+        return img
+
+    def blit_centered(self, img, center):
+        """以center为中心绘制精灵"""
+        return self.blit(img, (center[0] - self.width // 2, center[1] - self.height // 2))
+
+    @property
+    def nbytes(self):
+        return self.premultiplied.nbytes + (self.inv_alpha.nbytes if self.inv_alpha is not None else 0)
+
+
+def blit_sprites(img, items):
+    """批量绘制，items为(精灵, 左上角坐标)序列，按顺序原地混合到img上"""
+    for sprite, position in items:
+        sprite.blit(img, position)
+    return img
@@ -0,0 +1,169 @@
+import numpy as np
+from collections import OrderedDict
+from game.utils.glyph_atlas import GlyphAtlas
+from game.utils.sprite import clip_roi
+
+
+class TextSprite:
+    """
+    预渲染的文本精灵。
+    保存预乘alpha后的BGR颜色和反向alpha，绘制时只需在图像局部区域做一次整数混合。
+    """
+
+    __slots__ = ('premultiplied', 'inv_alpha', 'offset', 'text_size', 'nbytes')
+
+    def __init__(self, premultiplied, inv_alpha, offset, text_size):
+        self.premultiplied = premultiplied
+        self.inv_alpha = inv_alpha
+        self.offset = offset
+        self.text_size = text_size
+        self.nbytes = premultiplied.nbytes + inv_alpha.nbytes
+
+    def blit(self, img, position):
+        """将精灵原地混合到图像上，position为文本绘制原点"""
+        x = position[0] + self.offset[0]
+        y = position[1] + self.offset[1]
+        height, width = self.inv_alpha.shape[:2]
+        roi_slices, tile_slices = clip_roi(img, x, y, width, height)
+        if roi_slices is None:
+            return img
+        roi = img[roi_slices]
+        blended = (roi * self.inv_alpha[tile_slices].astype(np.uint16) + 127) // 255
+        blended += self.premultiplied[tile_slices]
+        roi[:] = blended.astype(np.uint8)
+        return img
+
+
+class TextSpriteCache:
+    """
+    文本精灵缓存。
+    字符按(字体, 字号)打包进字符图集，字符串由图集中的字符切片拼接而成，
+    拼好的精灵再按(文本, 字号, 颜色, 背景)缓存，总内存超过上限时按LRU淘汰。
+    """
+
+    def __init__(self, max_bytes=16 * 1024 * 1024, max_atlases=16):
+        self.max_bytes = max_bytes
+        self.max_atlases = max_atlases
+        self._atlases = OrderedDict()
+        self._sprites = OrderedDict()
+        self._sprite_bytes = 0
+        self.sprite_hits = 0
+        self.sprite_misses = 0
+
+    def get_atlas(self, font, font_key):
+        """获取(字体, 字号)对应的字符图集"""
+        atlas = self._atlases.get(font_key)
+        if atlas is not None:
+            self._atlases.move_to_end(font_key)
+            return atlas
+        atlas = GlyphAtlas(font)
+        self._atlases[font_key] = atlas
+        if len(self._atlases) > self.max_atlases:
+            self._atlases.popitem(last=False)
+        return atlas
+
+    def measure(self, font, font_key, text):
+        """测量字符串尺寸(宽, 高)"""
+        _, bbox = self.get_atlas(font, font_key).layout(text)
+        return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+    def _lookup(self, key):
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.sprite_hits += 1
+        else:
+            self.sprite_misses += 1
+        return sprite
+
+    def _store(self, key, sprite):
+        self._sprites[key] = sprite
+        self._sprite_bytes += sprite.nbytes
+        while self._sprite_bytes > self.max_bytes and len(self._sprites) > 1:
+            _, evicted = self._sprites.popitem(last=False)
+            self._sprite_bytes -= evicted.nbytes
+        return sprite
+
+    def get_text_sprite(self, font, font_key, text, color):
+        """获取纯色文本精灵"""
+        key = ('text', font_key, text, tuple(color))
+        sprite = self._lookup(key)
+        if sprite is not None:
+            return sprite
+
+        atlas = self.get_atlas(font, font_key)
+        placements, bbox = atlas.layout(text)
+        text_size = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+        mask = atlas.compose_mask(placements, bbox)
+        alpha = mask[..., None].astype(np.uint16)
+        premultiplied = ((np.asarray(color, dtype=np.uint16) * alpha + 127) // 255).astype(np.uint8)
+        inv_alpha = 255 - mask[..., None]
+        return self._store(key, TextSprite(premultiplied, inv_alpha, (bbox[0], bbox[1]), text_size))
+
+    def get_background_sprite(self, font, font_key, text, text_color, bg_color, bg_opacity, padding=5):
+        """获取带半透明背景框的文本精灵，背景框比文字四周各大padding像素"""
+        key = ('background', font_key, text, tuple(text_color), tuple(bg_color), bg_opacity, padding)
+        sprite = self._lookup(key)
+        if sprite is not None:
+            return sprite
+
+        atlas = self.get_atlas(font, font_key)
+        placements, bbox = atlas.layout(text)
+        text_size = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+        # 背景框包含右下边界，与ImageDraw.rectangle一致
+        width = text_size[0] + padding * 2 + 1
+        height = text_size[1] + padding * 2 + 1
+        text_alpha = np.zeros((height, width), dtype=np.float32)
+        if placements:
+            mask = atlas.compose_mask(placements, bbox)
+            text_alpha[padding:padding + mask.shape[0], padding:padding + mask.shape[1]] = mask / 255.0
+        text_alpha = text_alpha[..., None]
+
+        bg_alpha = int(255 * bg_opacity) / 255.0
+        premultiplied = (np.asarray(bg_color, dtype=np.float32) * bg_alpha * (1 - text_alpha)
+                         + np.asarray(text_color, dtype=np.float32) * text_alpha)
+        inv_alpha = 255.0 * (1 - bg_alpha) * (1 - text_alpha)
+        sprite = TextSprite(np.rint(premultiplied).astype(np.uint8), np.rint(inv_alpha).astype(np.uint8),
+                            (bbox[0] - padding, bbox[1] - padding), text_size)
+        return self._store(key, sprite)
+
+    def get_rainbow_sprite(self, font, font_key, text, colors):
+        """获取逐字变色的文本精灵，colors为按字循环使用的BGR颜色列表"""
+        key = ('rainbow', font_key, text, tuple(colors))
+        sprite = self._lookup(key)
+        if sprite is not None:
+            return sprite
+
+        atlas = self.get_atlas(font, font_key)
+        placements, bbox = atlas.layout(text, advance_by_bbox=True)
+        text_size = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+        if not placements:
+            return self._store(key, TextSprite(np.zeros((0, 0, 3), np.uint8), np.zeros((0, 0, 1), np.uint8), (0, 0), text_size))
+
+        mask = atlas.compose_mask(placements, bbox)
+        color_tile = np.zeros(mask.shape + (3,), dtype=np.uint16)
+        for glyph, gx, _, index in placements:
+            # 颜色按字所在的列填充，空格等不可见字符也占用一个颜色
+            color_tile[:, gx - bbox[0]:gx - bbox[0] + glyph.width] = colors[index % len(colors)]
+        alpha = mask[..., None].astype(np.uint16)
+        premultiplied = ((color_tile * alpha + 127) // 255).astype(np.uint8)
+        return self._store(key, TextSprite(premultiplied, 255 - mask[..., None], (bbox[0], bbox[1]), text_size))
+
+    def stats(self):
+        """返回缓存统计"""
+        return {
+            'glyph_hits': sum(atlas.hits for atlas in self._atlases.values()),
+            'glyph_misses': sum(atlas.misses for atlas in self._atlases.values()),
+            'glyphs': sum(len(atlas) for atlas in self._atlases.values()),
+            'atlases': len(self._atlases),
+            'sprite_hits': self.sprite_hits,
+            'sprite_misses': self.sprite_misses,
+            'sprites': len(self._sprites),
+            'sprite_bytes': self._sprite_bytes,
+        }
+
+    def clear(self):
+        """清空所有缓存"""
+        self._atlases.clear()
+        self._sprites.clear()
+        self._sprite_bytes = 0